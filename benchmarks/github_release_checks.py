@@ -0,0 +1,120 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# Time the lookup of the installer and installer-config GitHub releases with `get_compatible_release_assets` (which the application uses, and runs the lookups at the same time) against looking them up one after the other, using a local stand-in for the GitHub API with injected latency
+# Usage: python benchmarks/github_release_checks.py [--latency-ms 300] [--repeats 5]
+
+# IMPORTS
+import os # for filepath related methods
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import statistics
+import http.server
+from typing import Any, Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # the project directory
+
+from user_interface.gtk.code.github_releases import GitHubReleaseClient, get_compatible_release_asset, get_compatible_release_assets
+
+PACKAGES = [
+    ("calamares-configuration", "rebornos-team/calamares-configuration"),
+    ("calamares-core", "rebornos-team/calamares-core"),
+]
+LOCAL_VERSION = "3.2.0"
+
+def start_stub_api(latency_seconds: float) -> http.server.ThreadingHTTPServer:
+    """
+    Start a local stand-in for the "latest release" endpoint of the GitHub API, which answers every repository with a newer compatible release after a delay
+
+    Parameters
+    ----------
+    latency_seconds: float
+        The delay of every response
+
+    Returns
+    -------
+    server: http.server.ThreadingHTTPServer
+        The running server. Call `shutdown` to stop it
+    """
+
+    class RequestHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(latency_seconds)
+            repository_name = self.path.split("/")[3]
+            body = json.dumps({
+                "tag_name": "v3.2.1",
+                "assets": [{"name": repository_name + "-3.2.1-1-x86_64.pkg.tar.zst", "browser_download_url": "http://127.0.0.1/" + repository_name, "size": 4}],
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target= server.serve_forever, kwargs= {"poll_interval": 0.05}, daemon= True).start()
+    return server
+
+def look_up_serially(client: GitHubReleaseClient) -> list:
+    return [get_compatible_release_asset(client, url_stub, LOCAL_VERSION) for (_, url_stub) in PACKAGES]
+
+def look_up_concurrently(client: GitHubReleaseClient) -> list:
+    return get_compatible_release_assets(client, PACKAGES, lambda package_name: LOCAL_VERSION)
+
+def time_lookup(api_url: str, look_up: Callable[[GitHubReleaseClient], list]) -> float:
+    with tempfile.TemporaryDirectory() as cache_directory_path: # a cold cache, so that every lookup is a round trip
+        client = GitHubReleaseClient(cache_directory_path= cache_directory_path, cache_ttl_seconds= 0, api_base_url= api_url)
+        start_time = time.perf_counter()
+        release_assets = look_up(client)
+        elapsed_seconds = time.perf_counter() - start_time
+    assert all(release_asset is not None for release_asset in release_assets)
+    return elapsed_seconds
+
+def run_benchmark(latency_seconds: float, repeats: int) -> Tuple[List[float], List[float]]:
+    """
+    Parameters
+    ----------
+    latency_seconds: float
+        The latency injected into every request to the stand-in GitHub API
+    repeats: int
+        The number of runs of each variant
+
+    Returns
+    -------
+    timings: Tuple[List[float], List[float]]
+        The elapsed seconds of the serial runs and of the concurrent runs
+    """
+
+    server = start_stub_api(latency_seconds)
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        serial_timings = [time_lookup(api_url, look_up_serially) for _ in range(repeats)]
+        concurrent_timings = [time_lookup(api_url, look_up_concurrently) for _ in range(repeats)]
+        return (serial_timings, concurrent_timings)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description= "Time the GitHub release lookups of the installer packages against a local stand-in for the GitHub API")
+    argument_parser.add_argument('--latency-ms', type= float, default= 300, help= "The latency injected into every request")
+    argument_parser.add_argument('--repeats', type= int, default= 5, help= "The number of runs of each variant")
+    commandline_arguments = argument_parser.parse_args()
+
+    (serial_timings, concurrent_timings) = run_benchmark(commandline_arguments.latency_ms / 1000, commandline_arguments.repeats)
+    print(f"Latency per request: {commandline_arguments.latency_ms:.0f} ms, {len(PACKAGES)} repositories, {commandline_arguments.repeats} runs each")
+    print(f"Serial:                        median {statistics.median(serial_timings) * 1000:.0f} ms")
+    print(f"get_compatible_release_assets: median {statistics.median(concurrent_timings) * 1000:.0f} ms")
@@ -10,22 +10,465 @@
 
 # This is the Python entry point of the welcome application
 
+# IMPORTS NEEDED FOR THE STARTUP GATE
+import os
+import sys
+import json
+import argparse
+
+def exit_if_not_enabled_at_startup() -> None:
+    """
+    Exit right away when launched at startup (`-s` or `--startup`) while the user has disabled starting at startup
+
+    This runs before the remaining modules are imported and before any logging is set up, so that no log file is created and the settings file is not rewritten.
+    Only the `auto_start_enabled` flag is read from the user's settings file. If the settings file is missing or cannot be read, nothing is done here and the normal startup decides.
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    Nothing
+    """
+
+    # Mirrors the options of the main argument parser that take part here, so that flags are recognized exactly as they are later (including combined short flags like `-si`)
+    argument_parser = argparse.ArgumentParser(add_help= False, exit_on_error= False)
+    argument_parser.add_argument('-ui', '--user_interface')
+    argument_parser.add_argument('-s', '--startup', action='store_true', default=False)
+    argument_parser.add_argument('-i', '--iso', action='store_true', default=False)
+    try:
+        (arguments, _) = argument_parser.parse_known_args(sys.argv[1:])
+    except (argparse.ArgumentError, SystemExit): # malformed arguments are reported by the main argument parser
+        return
+    if not arguments.startup:
+        return
+    if arguments.iso:
+        settings_directory_name = ".rebornos-iso-welcome"
+    else:
+        settings_directory_name = ".rebornos-welcome"
+    try:
+        with open(os.path.join(os.path.expanduser("~"), settings_directory_name, "configuration", "settings.json")) as settings_file:
+            auto_start_enabled = json.load(settings_file)["auto_start_enabled"]
+    except Exception:
+        return
+    if auto_start_enabled is False:
+        print("Application not enabled to run at startup. Exiting...")
+        sys.exit(0)
+
+if __name__ == '__main__':
+    exit_if_not_enabled_at_startup() # needs to run before the imports below
+
 # IMPORTS
 from argparse import Namespace
-import os
 import logging
 import argparse
 import importlib
 import datetime
-import subprocess
 import pathlib
-from typing import Optional
+import time
+import contextlib
+import threading
+import atexit
+import gzip
+import logging.handlers
+import queue
+from typing import Optional, List, Dict, Any
 from types import ModuleType
 import shutil
 
 from pysetting import JSONConfiguration # For reading and writing settings files
 from pyrunning import LogMessage, LoggingHandler, Command
 
+logger = logging.getLogger('rebornos_welcome' + '.' + pathlib.Path(__file__).stem)
+
+class StartupProfiler():
+    """
+    Records the wall-clock and CPU time spent in each phase of the startup of the application
+
+    Enabled by the `--profile-startup` command line option. The report is written as JSON to the log directory and summarized on the log
+
+    """
+
+    def __init__(self, start_wall_time: Optional[float] = None, start_cpu_time: Optional[float] = None) -> None:
+        self.start_wall_time: float = time.perf_counter() if start_wall_time is None else start_wall_time
+        self.start_cpu_time: float = time.process_time() if start_cpu_time is None else start_cpu_time
+        self.phases: List[Dict[str, Any]] = []
+
+    def add(self, phase_name: str, wall_time: float, cpu_time: float) -> None:
+        """
+        Record a phase which has already been timed
+
+        Parameters
+        ----------
+        phase_name: str
+            The name of the phase
+        wall_time: float
+            The wall-clock time taken by the phase, in seconds
+        cpu_time: float
+            The CPU time taken by the phase, in seconds
+
+        Returns
+        -------
+        Nothing
+        """
+
+        self.phases.append(
+            {
+                "phase": phase_name,
+                "wall_time_ms": round(wall_time * 1000, 3),
+                "cpu_time_ms": round(cpu_time * 1000, 3),
+            }
+        )
+
+    @contextlib.contextmanager
+    def phase(self, phase_name: str):
+        """
+        A context manager that times the enclosed block as a phase
+
+        Parameters
+        ----------
+        phase_name: str
+            The name of the phase
+        """
+
+        wall_time = time.perf_counter()
+        cpu_time = time.process_time()
+        try:
+            yield
+        finally:
+            self.add(
+                phase_name,
+                time.perf_counter() - wall_time,
+                time.process_time() - cpu_time
+            )
+
+    def report(self, report_directory: str) -> str:
+        """
+        Write the recorded phases as JSON and return a human-readable summary
+
+        Parameters
+        ----------
+        report_directory: str
+            The directory in which the JSON report is written
+
+        Returns
+        -------
+        summary: str
+            A human-readable summary of the phases, including the path to the JSON report
+        """
+
+        total_wall_time = time.perf_counter() - self.start_wall_time
+        total_cpu_time = time.process_time() - self.start_cpu_time
+        report = {
+            "timestamp": RebornOSWelcome.get_time_stamp(),
+            "phases": self.phases,
+            "total_wall_time_ms": round(total_wall_time * 1000, 3),
+            "total_cpu_time_ms": round(total_cpu_time * 1000, 3),
+        }
+        report_file_path = pathlib.Path(os.path.expanduser(report_directory)) / ("startup_profile-" + report["timestamp"] + ".json")
+        with open(report_file_path, "w") as report_file:
+            json.dump(report, report_file, indent=4)
+
+        phase_name_width = max([len(phase["phase"]) for phase in self.phases] + [len("total")])
+        summary_lines = ["Startup profile (written to " + str(report_file_path) + "):"]
+        summary_lines.append("  " + "phase".ljust(phase_name_width) + "   wall (ms)    cpu (ms)")
+        for phase in self.phases:
+            summary_lines.append(
+                "  " + phase["phase"].ljust(phase_name_width)
+                + " " + "{:11.3f}".format(phase["wall_time_ms"])
+                + " " + "{:11.3f}".format(phase["cpu_time_ms"])
+            )
+        summary_lines.append(
+            "  " + "total".ljust(phase_name_width)
+            + " " + "{:11.3f}".format(report["total_wall_time_ms"])
+            + " " + "{:11.3f}".format(report["total_cpu_time_ms"])
+        )
+        return "\n".join(summary_lines)
+
+class DebouncedJSONConfiguration(JSONConfiguration):
+    """
+    A `JSONConfiguration` that keeps changes in memory and writes them to the file in one go
+
+    `write_data()` only schedules a write after a short debounce interval, so that several changes in quick succession result in a single write. 
+    Pending changes are also written on exit. Setting an item to the value it already has does not count as a change, and nothing is written if the data is the same as what was last written.
+    The file is written atomically by writing to a temporary file in the same directory and renaming it over the settings file.
+
+    """
+
+    def __init__(self, filepath: str, debounce_seconds: float = 0.5) -> None:
+        """
+        Initializes a 'DebouncedJSONConfiguration' object by loading the data from the specified filepath
+
+        Parameters
+        ----------
+        filepath: str
+            Either relative or absolute path to a JSON file (with forward slashes)
+        debounce_seconds: float, default 0.5
+            How long to wait after `write_data()` is called before the data is actually written
+
+        Returns
+        -------
+        Nothing
+        """
+
+        self.debounce_seconds = debounce_seconds
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        super().__init__(filepath)
+        self._last_written_text: str = json.dumps(self.data, indent=4)
+        atexit.register(self.flush) # write any pending changes on exit
+
+    def __del__(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def set_item(self, key_name: str, value: Any) -> None:
+        with self._lock:
+            if key_name in self.data and self.data[key_name] == value:
+                return # not a change
+            super().set_item(key_name, value)
+
+    def write_data(self) -> None:
+        """
+        Schedule the data to be written to the file after the debounce interval, unless a write is already scheduled
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Nothing
+        """
+
+        with self._lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.debounce_seconds, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Write the data to the file right away if it differs from what was last written
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Nothing
+        """
+
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            data_text = json.dumps(self.data, indent=4)
+            if data_text == self._last_written_text:
+                self._differs_from_file = False
+                return
+            temporary_filepath = self.filepath + ".tmp"
+            try:
+                with open(temporary_filepath, "w") as temporary_file:
+                    temporary_file.write(data_text)
+                    temporary_file.flush()
+                    os.fsync(temporary_file.fileno())
+                if os.path.exists(self.filepath): # the settings file may have been removed since it was loaded
+                    shutil.copymode(self.filepath, temporary_filepath) # keep the permissions of the settings file
+                os.replace(temporary_filepath, self.filepath)
+            except Exception:
+                with contextlib.suppress(OSError):
+                    os.remove(temporary_filepath) # the settings file is left as it was
+                raise
+            self._last_written_text = data_text
+            self._differs_from_file = False
+
+class LogRetentionManager():
+    """
+    Removes and compresses old log files of the application, in-process
+
+    Only the files whose names start with `welcome_app-` in the log directory are considered. The newest files are kept, up to a count, a total size, and an age. 
+    The current log file (and its rotated parts) is never removed or compressed.
+
+    """
+
+    def __init__(
+        self,
+        log_directory_path: pathlib.Path,
+        current_log_file_path: Optional[pathlib.Path] = None,
+        no_of_files_to_keep: int = 5,
+        max_total_size_bytes: int = 50 * 1024 * 1024,
+        max_age_days: float = 30,
+        compress: bool = True,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        log_directory_path: pathlib.Path
+            The directory which contains the log files
+        current_log_file_path: Optional[pathlib.Path]
+            The log file of the current session, which is left untouched
+        no_of_files_to_keep: int, default 5
+            The number of newest log files to keep, counting the current log file if there is one
+        max_total_size_bytes: int, default 50 MiB
+            The maximum total size of the old log files that are kept
+        max_age_days: float, default 30
+            Old log files older than this are removed
+        compress: bool, default True
+            Whether to compress the kept old log files to `.gz`
+
+        Returns
+        -------
+        Nothing
+        """
+
+        self.log_directory_path = pathlib.Path(log_directory_path)
+        self.current_log_file_name = None if current_log_file_path is None else pathlib.Path(current_log_file_path).name
+        self.no_of_files_to_keep = no_of_files_to_keep
+        self.max_total_size_bytes = max_total_size_bytes
+        self.max_age_days = max_age_days
+        self.compress = compress
+
+    def apply_in_background(self) -> threading.Thread:
+        """
+        Run `apply()` on a separate daemon thread
+
+        Returns
+        -------
+        thread: threading.Thread
+            The thread that was started
+        """
+
+        thread = threading.Thread(target=self.apply, name="LogRetention", daemon=True)
+        thread.start()
+        return thread
+
+    def apply(self) -> None:
+        """
+        Remove the old log files that exceed the count, size or age limits, then compress the remaining old log files if enabled
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        Nothing
+        """
+
+        old_log_files = []
+        with os.scandir(self.log_directory_path) as directory_entries:
+            for directory_entry in directory_entries:
+                if not directory_entry.name.startswith("welcome_app-") or not directory_entry.is_file(follow_symlinks=False):
+                    continue
+                if self.current_log_file_name is not None and directory_entry.name.startswith(self.current_log_file_name):
+                    continue # the current log file and its rotated parts
+                file_status = directory_entry.stat(follow_symlinks=False)
+                old_log_files.append((file_status.st_mtime, file_status.st_size, directory_entry.path))
+        old_log_files.sort(reverse=True) # newest first
+
+        oldest_allowed_time = time.time() - self.max_age_days * 24 * 60 * 60
+        no_of_old_files_to_keep = self.no_of_files_to_keep - (0 if self.current_log_file_name is None else 1)
+        total_size = 0
+        files_to_compress = []
+        for index, (modification_time, size, file_path) in enumerate(old_log_files):
+            total_size += size
+            if index >= no_of_old_files_to_keep or total_size > self.max_total_size_bytes or modification_time < oldest_allowed_time:
+                try:
+                    os.remove(file_path)
+                except OSError as error:
+                    logger.warning("Could not remove the old log file " + file_path + ": " + str(error))
+            elif not file_path.endswith(".gz"):
+                files_to_compress.append(file_path)
+
+        if self.compress:
+            for file_path in files_to_compress:
+                self.compress_file(file_path)
+
+    @staticmethod
+    def compress_file(file_path: str) -> None:
+        """
+        Compress a file to `<file_path>.gz`, keeping its modification time, and remove the original
+
+        Parameters
+        ----------
+        file_path: str
+            The path of the file to compress
+
+        Returns
+        -------
+        Nothing
+        """
+
+        compressed_file_path = file_path + ".gz"
+        try:
+            file_status = os.stat(file_path)
+            with open(file_path, "rb") as input_file, gzip.open(compressed_file_path, "wb") as output_file:
+                shutil.copyfileobj(input_file, output_file)
+            os.utime(compressed_file_path, (file_status.st_atime, file_status.st_mtime)) # so that the ordering by age is unchanged
+            os.remove(file_path)
+        except OSError as error:
+            logger.warning("Could not compress the old log file " + file_path + ": " + str(error))
+            try:
+                os.remove(compressed_file_path)
+            except OSError:
+                pass
+
+class DeferredFlushRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    A `RotatingFileHandler` that does not flush after every record. The stream is flushed by `flush_now()`, which `BatchingQueueListener` calls once per batch of records
+
+    """
+
+    def flush(self) -> None:
+        pass # flushed once per batch by the listener
+
+    def flush_now(self) -> None:
+        super().flush()
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    A `QueueListener` that writes the queued records on its own thread and flushes its handlers once per batch of records instead of once per record
+
+    A batch ends when the queue is drained, or after `max_batch_size` records, whichever comes first
+
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, *handlers: logging.Handler, max_batch_size: int = 256) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.max_batch_size = max_batch_size
+        self.records_since_flush = 0
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if self.records_since_flush >= self.max_batch_size: # the previous record, which completed the batch, has been handled by now
+            self.flush_handlers()
+        try:
+            record = self.queue.get_nowait()
+        except queue.Empty:
+            self.flush_handlers() # the queue is drained, so write out the batch before waiting
+            record = self.queue.get(block)
+        self.records_since_flush += 1
+        return record
+
+    def flush_handlers(self) -> None:
+        for handler in self.handlers:
+            getattr(handler, "flush_now", handler.flush)()
+        self.records_since_flush = 0
+
+    def stop(self) -> None:
+        """
+        Write all the records remaining in the queue, flush the handlers and stop the writer thread. Does nothing if already stopped
+        """
+
+        if self._thread is None:
+            return
+        super().stop()
+        self.flush_handlers()
+
 class RebornOSWelcome():
     """
     An internal-use class to encapsulate the tasks associated with setting up the 
@@ -70,7 +513,66 @@ class RebornOSWelcome():
 
         print("\nRebornOS Welcome Application")
 
+        argument_parsing_wall_time = time.perf_counter()
+        argument_parsing_cpu_time = time.process_time()
         commandline_arguments = self.handle_arguments() # handle command line arguments
+        self.startup_profiler: Optional[StartupProfiler] = None
+        if commandline_arguments.profile_startup:
+            self.startup_profiler = StartupProfiler(argument_parsing_wall_time, argument_parsing_cpu_time)
+            self.startup_profiler.add(
+                "argument_parsing",
+                time.perf_counter() - argument_parsing_wall_time,
+                time.process_time() - argument_parsing_cpu_time
+            )
+        
+        with self.profile_phase("settings_load"):
+            self.load_settings(commandline_arguments)
+
+        if commandline_arguments.startup:
+            if not self.application_settings["auto_start_enabled"]:
+                print("Application not enabled to run at startup. Exiting...") # before the logger is set up, so that no log file is created
+                exit(0)
+
+        with self.profile_phase("setup_logger"):
+            self.logger = self.setup_logger() # configure the logger
+        self.logging_handler = LoggingHandler(logger=self.logger)
+
+        with self.profile_phase("set_current_working_directory"):
+            self.set_current_working_directory() # set the base directory of the welcome application as the current working directory             
+        self.load_UI(commandline_arguments) # load_data the user interface
+
+    def profile_phase(self, phase_name: str):
+        """
+        Time the enclosed block as a startup phase, if startup profiling is enabled
+
+        Parameters
+        ----------
+        phase_name: str
+            The name of the phase
+
+        Returns
+        -------
+        context_manager
+            A context manager to be used in a `with` statement
+        """
+
+        if self.startup_profiler is None:
+            return contextlib.nullcontext()
+        return self.startup_profiler.phase(phase_name)
+
+    def load_settings(self, commandline_arguments: Namespace) -> None:
+        """
+        Load the user's settings file, recreating it from the default settings if it is missing or too old
+
+        Parameters
+        ----------
+        commandline_arguments: Namespace
+            Command-line arguments parsed using the argparse parse_args() method
+
+        Returns
+        -------
+        Nothing
+        """
 
         if commandline_arguments.iso:
             user_settings_filepath = pathlib.Path.home() / ".rebornos-iso-welcome" / "configuration" / "settings.json"
@@ -81,7 +583,7 @@ class RebornOSWelcome():
             RebornOSWelcome._recreate_settings_file(user_settings_filepath, commandline_arguments.iso)
 
         try:
-            self.application_settings = JSONConfiguration(
+            self.application_settings = DebouncedJSONConfiguration(
                 str(user_settings_filepath.resolve())
             ) # to access the settings stored in 'settings.json'
             version = self.application_settings["version"]
@@ -93,29 +595,19 @@ class RebornOSWelcome():
             try:
                 print("Recreating configuration...")
                 RebornOSWelcome._recreate_settings_file(user_settings_filepath, commandline_arguments.iso)
-                self.application_settings = JSONConfiguration(
+                self.application_settings = DebouncedJSONConfiguration(
                     str(user_settings_filepath.resolve())
                 )
             except Exception as inner_error:
                 traceback.print_exception(type(inner_error), inner_error, inner_error.__traceback__)
 
-        self.logger = self.setup_logger() # configure the logger
-        self.logging_handler = LoggingHandler(logger=self.logger)
-
-        self.set_current_working_directory() # set the base directory of the welcome application as the current working directory             
-        if commandline_arguments.startup:
-            if not self.application_settings["auto_start_enabled"]:
-                LogMessage.Info("Application not enabled to run at startup. Exiting...").write(logging_handler=self.logging_handler)
-                exit(0)
-        self.load_UI(commandline_arguments) # load_data the user interface
-
     def setup_logger(self) -> logging.Logger:
         """
         Configure the logger
 
         The following tasks are accomplished:
         - Create a named logger
-        - Setup logging to be done onto a file and the console
+        - Setup logging to be done onto a file and the console, on a separate writer thread
         - Define the format of log entries
         - Delete old log files
 
@@ -170,23 +662,31 @@ class RebornOSWelcome():
         self.application_settings["current_log_file_path"] = str(log_file_path)
         self.application_settings.write_data()        
         print("Logging to " + str(log_file_path.resolve()) + "...\n")        
-        self.application_settings.write_data()
 
-        self.delete_old_log_files(log_directory_path, no_of_files_to_keep =5) # delete old log files
-
-        log_file_handler = logging.FileHandler(log_file_path) # for logging onto files
+        log_file_handler = DeferredFlushRotatingFileHandler( # for logging onto files
+            log_file_path,
+            maxBytes= int(self.application_settings.data.get("log_max_file_size_mb", 10) * 1024 * 1024), # rotate the log file when it grows too large during a long session
+            backupCount= 3
+        )
         log_file_handler.setLevel(logging.DEBUG) # log debug messages and higher
         # log_file_formatter = logging.Formatter('[%(asctime)s, %(levelname)-8s, %(name)s] %(message)s', '%Y-%m-%d, %H:%M:%S %Z') # old format of each log file entry
         log_file_formatter = logging.Formatter('%(asctime)s [%(levelname)8s] %(message)s (%(pathname)s > %(funcName)s; Line %(lineno)d)', '%Y-%m-%d %H:%M:%S %Z') # format of each log file entry
         log_file_handler.setFormatter(log_file_formatter)
-        logger.addHandler(log_file_handler)
 
         # Set up standard console logging
         log_error_handler = logging.StreamHandler() # for logging onto the console
         log_error_handler.setLevel(logging.INFO) # log info messages and higher alert levels   
         log_error_formatter = logging.Formatter('%(levelname)8s: %(message)s') # format of each console log entry    
         log_error_handler.setFormatter(log_error_formatter)    
-        logger.addHandler(log_error_handler)
+
+        # Hand the records over to a writer thread so that the callers never wait for file or console I/O
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.log_listener = BatchingQueueListener(log_queue, log_file_handler, log_error_handler)
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop) # write out the remaining records on exit, after the logging threads of the UI have finished
+
+        self.delete_old_log_files(log_directory_path, no_of_files_to_keep =5, current_log_file_path= log_file_path) # delete old log files, after the handlers are set up so that failures are logged
 
         return logger
 
@@ -255,31 +755,52 @@ class RebornOSWelcome():
             help= "Indicate that the application is being launched from an ISO"
         )
 
+        argument_parser.add_argument( # define a command line argument for profiling the startup
+            '--profile-startup',
+            action='store_true',
+            default=False,
+            help= "Record the time taken by each phase of the startup and write a report to the log directory"
+        )
+
+        argument_parser.add_argument( # define a command line argument for timing the event handlers
+            '--detect-jank',
+            action='store_true',
+            default=False,
+            help= "Time every event handler, warn about the ones that hold the main loop for longer than a frame, and log a summary on exit"
+        )
+
         parsed_args = argument_parser.parse_args()
 
         return parsed_args
 
-    def delete_old_log_files(self, log_directory_path, no_of_files_to_keep: int) -> None:
+    def delete_old_log_files(self, log_directory_path, no_of_files_to_keep: int, current_log_file_path: Optional[pathlib.Path] = None) -> None:
         """
-        Delete old log files while keeping the newest ones whose count is specified by "no_of_files_to_keep"
+        Delete old log files while keeping the newest ones whose count is specified by "no_of_files_to_keep", on a separate thread
         
+        The total size and age limits, and whether the kept files are compressed, are read from the settings `log_max_total_size_mb`, `log_max_age_days` and `log_compress`
+
         Parameters
         ----------
+        log_directory_path: pathlib.Path
+            The directory which contains the log files
         no_of_files_to_keep: int
-            The number of newest log files to keep
+            The number of newest log files to keep, including the current one
+        current_log_file_path: Optional[pathlib.Path]
+            The log file of the current session, which is left untouched
 
         Returns
         -------
         Nothing        
         """
 
-        subprocess.Popen(
-            "ls -tp welcome_app* | grep -v '/$' | tail -n +" 
-                + str(no_of_files_to_keep + 1) 
-                + " | xargs -I {} rm -- {}",
-            shell=True,
-            cwd=log_directory_path
-        )
+        LogRetentionManager(
+            log_directory_path,
+            current_log_file_path= current_log_file_path,
+            no_of_files_to_keep= self.application_settings.data.get("log_files_to_keep", no_of_files_to_keep),
+            max_total_size_bytes= int(self.application_settings.data.get("log_max_total_size_mb", 50) * 1024 * 1024),
+            max_age_days= self.application_settings.data.get("log_max_age_days", 30),
+            compress= self.application_settings.data.get("log_compress", True),
+        ).apply_in_background()
     
     def load_UI(self, commandline_arguments: Namespace) -> None:
         """
@@ -292,18 +813,19 @@ class RebornOSWelcome():
             Command-line arguments parsed using the argparse parse_args() method
         """
    
-        ui_module: ModuleType = importlib.import_module(
-            ".".join(
-                [
-                    "user_interface",
-                    commandline_arguments.user_interface,
-                    "code",
-                    "main"
-                ]
-            )
-        ) # search for and import user_interface/<ui_toolkit>/code/main.py
+        with self.profile_phase("import_ui_module"):
+            ui_module: ModuleType = importlib.import_module(
+                ".".join(
+                    [
+                        "user_interface",
+                        commandline_arguments.user_interface,
+                        "code",
+                        "main"
+                    ]
+                )
+            ) # search for and import user_interface/<ui_toolkit>/code/main.py
         LogMessage.Info("Loading the user-interface: " + commandline_arguments.user_interface + "...").write(self.logging_handler)
-        _ = ui_module.Main(commandline_arguments, self.application_settings) # initialize the Main class of the main script for the chosen user interface toolkit
+        _ = ui_module.Main(commandline_arguments, self.application_settings, self.startup_profiler) # initialize the Main class of the main script for the chosen user interface toolkit
 
     @staticmethod
     def get_time_stamp() -> str:
@@ -0,0 +1,30 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+from typing import Iterator
+
+import pytest
+
+from tests.stub_servers import StubGitHubAPI, StubFileServer
+
+@pytest.fixture
+def github_api() -> Iterator[StubGitHubAPI]:
+    stub = StubGitHubAPI()
+    try:
+        yield stub
+    finally:
+        stub.close()
+
+@pytest.fixture
+def file_server() -> Iterator[StubFileServer]:
+    stub = StubFileServer()
+    try:
+        yield stub
+    finally:
+        stub.close()
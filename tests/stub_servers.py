@@ -0,0 +1,174 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import json
+import hashlib
+import threading
+import time
+import http.server
+from typing import Any, Dict, List, Optional
+
+class StubGitHubAPI:
+    """
+    A local stand-in for the "latest release" endpoint of the GitHub API, with ETags
+
+    The releases are served from `releases`, keyed by "<owner>/<repository>". Every request is recorded in `requests` as (path, If-None-Match header, response status)
+    The largest number of requests that were being handled at the same time is kept in `peak_no_of_requests_in_flight`
+    """
+
+    def __init__(self) -> None:
+        self.releases: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[tuple] = []
+        self.failure_status: Optional[int] = None # every request is answered with this status when set
+        self.latency_seconds: float = 0 # added to every request, to stand in for the round trip to GitHub
+        self.no_of_requests_in_flight = 0
+        self.peak_no_of_requests_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with stub._lock:
+                    stub.no_of_requests_in_flight += 1
+                    stub.peak_no_of_requests_in_flight = max(stub.peak_no_of_requests_in_flight, stub.no_of_requests_in_flight)
+                try:
+                    if stub.latency_seconds:
+                        time.sleep(stub.latency_seconds)
+                    stub._respond(self)
+                finally:
+                    with stub._lock:
+                        stub.no_of_requests_in_flight -= 1
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target= self.server.serve_forever, kwargs= {"poll_interval": 0.05}, daemon= True)
+        self._thread.start()
+
+    def set_release(self, url_stub: str, tag_name: str, assets: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.releases[url_stub] = {
+            "tag_name": tag_name,
+            "assets": assets if assets is not None else [
+                {
+                    "name": url_stub.split("/")[-1] + "-" + tag_name.lstrip("v") + "-1-x86_64.pkg.tar.zst",
+                    "browser_download_url": f"{self.url}/{url_stub}/{tag_name}/package.pkg.tar.zst",
+                    "size": 4,
+                    "digest": None,
+                }
+            ]
+        }
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _respond(self, handler: http.server.BaseHTTPRequestHandler) -> None:
+        (status, headers, body) = self._get_response(handler)
+        with self._lock: # recorded before responding, so that the client never sees a response that is not recorded yet
+            self.requests.append((handler.path, handler.headers.get("If-None-Match"), status))
+        if status >= 400:
+            handler.send_error(status)
+            return
+        handler.send_response(status)
+        for (name, value) in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _get_response(self, handler: http.server.BaseHTTPRequestHandler) -> tuple:
+        if self.failure_status is not None:
+            return (self.failure_status, {}, b"")
+        prefix = "/repos/"
+        suffix = "/releases/latest"
+        url_stub = handler.path[len(prefix):-len(suffix)] if handler.path.startswith(prefix) and handler.path.endswith(suffix) else None
+        if url_stub not in self.releases:
+            return (404, {}, b"")
+        body = json.dumps(self.releases[url_stub]).encode("utf-8")
+        etag = "\"" + hashlib.sha1(body).hexdigest() + "\""
+        if handler.headers.get("If-None-Match") == etag:
+            return (304, {"ETag": etag}, b"")
+        return (200, {"Content-Type": "application/json", "Content-Length": str(len(body)), "ETag": etag}, body)
+
+class StubFileServer:
+    """
+    A local file server that supports resuming with single open-ended ranges ("bytes=<start>-"), like the GitHub release asset downloads
+
+    The files are served from `files`, keyed by path. Every request is recorded in `requests` as (path, Range header, response status)
+    """
+
+    def __init__(self) -> None:
+        self.files: Dict[str, bytes] = {}
+        self.requests: List[tuple] = []
+        self.no_of_truncated_responses = 0 # this many of the next responses are cut off halfway, after announcing the full length
+        self.use_chunked_encoding = False # send the files in one HTTP/1.1 chunk instead of with a Content-Length
+        self._lock = threading.Lock()
+        stub = self
+
+        class RequestHandler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stub._respond(self)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target= self.server.serve_forever, kwargs= {"poll_interval": 0.05}, daemon= True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _respond(self, handler: http.server.BaseHTTPRequestHandler) -> None:
+        range_header = handler.headers.get("Range")
+        content = self.files.get(handler.path)
+        if content is None:
+            status = 404
+        elif range_header is None:
+            status = 200
+            start = 0
+        else:
+            start = int(range_header[len("bytes="):].rstrip("-"))
+            status = 416 if start >= len(content) else 206
+        with self._lock: # recorded before responding, so that the client never sees a response that is not recorded yet
+            self.requests.append((handler.path, range_header, status))
+            is_truncated = status in (200, 206) and self.no_of_truncated_responses > 0
+            if is_truncated:
+                self.no_of_truncated_responses -= 1
+        if status == 404:
+            handler.send_error(404)
+            return
+        if status == 416:
+            handler.send_response(416)
+            handler.send_header("Content-Range", f"bytes */{len(content)}")
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+        body = content[start:]
+        if self.use_chunked_encoding:
+            handler.protocol_version = "HTTP/1.1"
+            handler.close_connection = True
+        handler.send_response(status)
+        if self.use_chunked_encoding:
+            handler.send_header("Transfer-Encoding", "chunked")
+        else:
+            handler.send_header("Content-Length", str(len(body)))
+        if status == 206:
+            handler.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}")
+        handler.end_headers()
+        if self.use_chunked_encoding:
+            handler.wfile.write(f"{len(body):x}\r\n".encode("ascii"))
+        handler.wfile.write(body[:len(body) // 2] if is_truncated else body) # the connection is closed after the response either way
+        if self.use_chunked_encoding and not is_truncated:
+            handler.wfile.write(b"\r\n0\r\n\r\n")
@@ -0,0 +1,56 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+
+from user_interface.gtk.code.asset_cache import ReleaseAssetCache
+
+URL_STUB = "rebornos-team/calamares-core"
+
+def cache_asset(release_asset_cache, tag_name, asset_name, size, modification_time):
+    filepath = release_asset_cache.get_filepath(URL_STUB, tag_name, asset_name)
+    filepath.parent.mkdir(parents= True, exist_ok= True)
+    filepath.write_bytes(b"\0" * size)
+    os.utime(filepath, (modification_time, modification_time))
+    return filepath
+
+def test_lookup_hit(tmp_path):
+    release_asset_cache = ReleaseAssetCache(str(tmp_path))
+    filepath = cache_asset(release_asset_cache, "v3.2.1", "calamares-core-3.2.1-1-x86_64.pkg.tar.zst", 16, 1_700_000_000)
+
+    assert release_asset_cache.lookup(URL_STUB, "v3.2.1", {"name": "calamares-core-3.2.1-1-x86_64.pkg.tar.zst", "size": 16}) == filepath
+    assert filepath.stat().st_mtime > 1_700_000_000 # marked as used
+
+def test_lookup_miss(tmp_path):
+    release_asset_cache = ReleaseAssetCache(str(tmp_path))
+    cache_asset(release_asset_cache, "v3.2.1", "calamares-core-3.2.1-1-x86_64.pkg.tar.zst", 16, 1_700_000_000)
+
+    assert release_asset_cache.lookup(URL_STUB, "v3.2.2", {"name": "calamares-core-3.2.1-1-x86_64.pkg.tar.zst", "size": 16}) is None # another release
+    assert release_asset_cache.lookup(URL_STUB, "v3.2.1", {"name": "calamares-core-3.2.1-1-x86_64.pkg.tar.zst", "size": 17}) is None # a partial or replaced file
+    assert release_asset_cache.lookup(URL_STUB, "v3.2.1", {"name": "calamares-3.2.1-1-x86_64.pkg.tar.zst"}) is None
+
+def test_evict_oldest_beyond_limit(tmp_path):
+    release_asset_cache = ReleaseAssetCache(str(tmp_path), max_size_bytes= 25)
+    oldest_filepath = cache_asset(release_asset_cache, "v1", "calamares-core-1-1-x86_64.pkg.tar.zst", 10, 1_700_000_000)
+    older_filepath = cache_asset(release_asset_cache, "v2", "calamares-core-2-1-x86_64.pkg.tar.zst", 10, 1_700_000_100)
+    newer_filepath = cache_asset(release_asset_cache, "v3", "calamares-core-3-1-x86_64.pkg.tar.zst", 10, 1_700_000_200)
+    newest_filepath = cache_asset(release_asset_cache, "v4", "calamares-core-4-1-x86_64.pkg.tar.zst", 10, 1_700_000_300)
+
+    assert release_asset_cache.evict() == [oldest_filepath, older_filepath]
+    assert newer_filepath.exists() and newest_filepath.exists()
+    assert not oldest_filepath.parent.exists() # the emptied tag directory is removed
+    assert release_asset_cache.evict() == []
+
+def test_evict_skips_kept_files(tmp_path):
+    release_asset_cache = ReleaseAssetCache(str(tmp_path), max_size_bytes= 15)
+    oldest_filepath = cache_asset(release_asset_cache, "v1", "calamares-core-1-1-x86_64.pkg.tar.zst", 10, 1_700_000_000)
+    newest_filepath = cache_asset(release_asset_cache, "v2", "calamares-core-2-1-x86_64.pkg.tar.zst", 10, 1_700_000_100)
+
+    assert release_asset_cache.evict(keep= [oldest_filepath]) == [newest_filepath]
+    assert oldest_filepath.exists()
@@ -0,0 +1,88 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import logging
+import logging.handlers
+import queue
+
+import pytest
+
+pytest.importorskip("pysetting")
+pytest.importorskip("pyrunning")
+
+from main import BatchingQueueListener, DeferredFlushRotatingFileHandler
+
+class RecordingFileHandler(DeferredFlushRotatingFileHandler):
+    """
+    Records the number of lines in the log file after each flush
+    """
+
+    def __init__(self, *arguments, **keyword_arguments) -> None:
+        super().__init__(*arguments, **keyword_arguments)
+        self.setFormatter(logging.Formatter("%(message)s"))
+        self.line_counts_after_flush = []
+
+    def flush_now(self) -> None:
+        super().flush_now()
+        with open(self.baseFilename) as log_file:
+            self.line_counts_after_flush.append(len(log_file.readlines()))
+
+def make_record(message):
+    return logging.makeLogRecord({"name": "rebornos_welcome", "msg": message, "levelno": logging.INFO, "levelname": "INFO"})
+
+def read_lines(log_file_path):
+    return log_file_path.read_text().splitlines()
+
+@pytest.fixture
+def log_file_path(tmp_path):
+    return tmp_path / "welcome_app-test.log"
+
+def test_records_are_only_written_on_flush(log_file_path):
+    log_file_handler = DeferredFlushRotatingFileHandler(log_file_path)
+    log_file_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_file_handler.handle(make_record("buffered"))
+    log_file_handler.flush()
+
+    assert read_lines(log_file_path) == []
+
+    log_file_handler.flush_now()
+    assert read_lines(log_file_path) == ["buffered"]
+    log_file_handler.close()
+
+def test_handlers_are_flushed_once_per_batch(log_file_path):
+    log_file_handler = RecordingFileHandler(log_file_path)
+    log_queue = queue.SimpleQueue()
+    for index in range(7):
+        log_queue.put(make_record("record " + str(index)))
+    listener = BatchingQueueListener(log_queue, log_file_handler, max_batch_size= 3)
+
+    listener.start()
+    listener.stop()
+
+    assert log_file_handler.line_counts_after_flush[:2] == [3, 6] # each flush writes out a whole batch
+    assert log_file_handler.line_counts_after_flush[-1] == 7 # and the remainder once the queue is drained
+    assert len(log_file_handler.line_counts_after_flush) <= 4
+    assert read_lines(log_file_path) == ["record " + str(index) for index in range(7)]
+    log_file_handler.close()
+
+def test_stop_drains_the_queue(log_file_path):
+    log_file_handler = DeferredFlushRotatingFileHandler(log_file_path, maxBytes= 1024 * 1024, backupCount= 3)
+    log_file_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = BatchingQueueListener(log_queue, log_file_handler)
+    listener.start()
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for index in range(1000):
+        queue_handler.handle(make_record("record " + str(index)))
+    listener.stop()
+    listener.stop() # does nothing when already stopped
+
+    assert read_lines(log_file_path) == ["record " + str(index) for index in range(1000)]
+    log_file_handler.close()
@@ -0,0 +1,100 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import json
+import errno
+
+import pytest
+
+pytest.importorskip("pysetting")
+pytest.importorskip("pyrunning")
+
+import main
+from main import DebouncedJSONConfiguration
+
+@pytest.fixture
+def settings_filepath(tmp_path):
+    settings_filepath = tmp_path / "settings.json"
+    settings_filepath.write_text(json.dumps({"auto_start_enabled": True, "log_files_to_keep": 5}, indent=4))
+    settings_filepath.chmod(0o600)
+    return settings_filepath
+
+@pytest.fixture
+def writes(monkeypatch):
+    writes = []
+    replace = os.replace
+    def record_and_replace(source_filepath, destination_filepath):
+        writes.append(destination_filepath)
+        replace(source_filepath, destination_filepath)
+    monkeypatch.setattr(main.os, "replace", record_and_replace)
+    return writes
+
+def read_settings(settings_filepath):
+    return json.loads(settings_filepath.read_text())
+
+def test_writes_in_the_debounce_interval_are_coalesced(settings_filepath, writes):
+    configuration = DebouncedJSONConfiguration(str(settings_filepath), debounce_seconds= 0.2)
+    for index in range(10):
+        configuration["log_files_to_keep"] = index
+        configuration.write_data()
+    flush_timer = configuration._flush_timer
+    assert read_settings(settings_filepath)["log_files_to_keep"] == 5 # nothing is written before the interval ends
+
+    flush_timer.join()
+
+    assert writes == [str(settings_filepath)]
+    assert read_settings(settings_filepath) == {"auto_start_enabled": True, "log_files_to_keep": 9}
+    assert settings_filepath.stat().st_mode & 0o777 == 0o600 # the permissions of the settings file are kept
+
+def test_unchanged_data_is_not_written(settings_filepath, writes):
+    configuration = DebouncedJSONConfiguration(str(settings_filepath), debounce_seconds= 0.2)
+    configuration["log_files_to_keep"] = 5
+    configuration.write_data()
+    configuration.flush()
+
+    assert writes == []
+
+def test_flush_writes_pending_data(settings_filepath, writes):
+    configuration = DebouncedJSONConfiguration(str(settings_filepath), debounce_seconds= 60)
+    configuration["auto_start_enabled"] = False
+    configuration.write_data()
+
+    configuration.flush()
+
+    assert configuration._flush_timer is None
+    assert writes == [str(settings_filepath)]
+    assert read_settings(settings_filepath)["auto_start_enabled"] is False
+
+def test_flush_when_the_settings_file_was_removed(settings_filepath):
+    configuration = DebouncedJSONConfiguration(str(settings_filepath), debounce_seconds= 60)
+    configuration["auto_start_enabled"] = False
+    settings_filepath.unlink()
+
+    configuration.flush()
+
+    assert read_settings(settings_filepath) == {"auto_start_enabled": False, "log_files_to_keep": 5}
+
+def test_failed_write_leaves_the_settings_file_intact(settings_filepath, monkeypatch):
+    original_text = settings_filepath.read_text()
+    configuration = DebouncedJSONConfiguration(str(settings_filepath), debounce_seconds= 60)
+    configuration["auto_start_enabled"] = False
+    def fail_to_sync(file_descriptor):
+        raise OSError(errno.ENOSPC, "No space left on device")
+    monkeypatch.setattr(main.os, "fsync", fail_to_sync)
+
+    with pytest.raises(OSError):
+        configuration.flush()
+
+    assert settings_filepath.read_text() == original_text
+    assert not os.path.exists(str(settings_filepath) + ".tmp")
+
+    monkeypatch.undo()
+    configuration.flush() # the pending data is written once the disk recovers
+    assert read_settings(settings_filepath)["auto_start_enabled"] is False
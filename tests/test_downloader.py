@@ -0,0 +1,96 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import hashlib
+
+import pytest
+
+from user_interface.gtk.code.downloader import Downloader, DownloadError
+
+CONTENT = bytes(range(256)) * 1024 # 256 KiB, several chunks
+DIGEST = "sha256:" + hashlib.sha256(CONTENT).hexdigest()
+
+@pytest.fixture
+def package_url(file_server) -> str:
+    file_server.files["/package.pkg.tar.zst"] = CONTENT
+    return file_server.url + "/package.pkg.tar.zst"
+
+def get_partial_filepath(destination_filepath):
+    return destination_filepath.parent / ("." + destination_filepath.name + ".part")
+
+def test_download(file_server, package_url, tmp_path):
+    progress = []
+    downloader = Downloader(chunk_size= 16 * 1024, progress_callback= lambda *arguments: progress.append(arguments))
+    destination_filepath = tmp_path / "package.pkg.tar.zst"
+
+    assert downloader.download_all([(package_url, str(destination_filepath), len(CONTENT), DIGEST)]) == [None]
+
+    assert destination_filepath.read_bytes() == CONTENT
+    assert not get_partial_filepath(destination_filepath).exists()
+    assert file_server.requests == [("/package.pkg.tar.zst", None, 200)]
+    assert progress[-1][:2] == (len(CONTENT), len(CONTENT))
+
+def test_resume_from_partial_file(file_server, package_url, tmp_path):
+    destination_filepath = tmp_path / "package.pkg.tar.zst"
+    get_partial_filepath(destination_filepath).write_bytes(CONTENT[:1000]) # left by an earlier run
+
+    Downloader().download(package_url, str(destination_filepath), len(CONTENT), DIGEST)
+
+    assert destination_filepath.read_bytes() == CONTENT
+    assert file_server.requests == [("/package.pkg.tar.zst", "bytes=1000-", 206)]
+
+def test_range_not_satisfiable_for_complete_partial_file(file_server, package_url, tmp_path):
+    destination_filepath = tmp_path / "package.pkg.tar.zst"
+    get_partial_filepath(destination_filepath).write_bytes(CONTENT) # downloaded completely, but not renamed yet
+
+    Downloader().download(package_url, str(destination_filepath), len(CONTENT), DIGEST)
+
+    assert destination_filepath.read_bytes() == CONTENT
+    assert file_server.requests == [("/package.pkg.tar.zst", f"bytes={len(CONTENT)}-", 416)]
+
+def test_digest_mismatch(file_server, package_url, tmp_path):
+    destination_filepath = tmp_path / "package.pkg.tar.zst"
+    wrong_digest = "sha256:" + hashlib.sha256(b"something else").hexdigest()
+
+    (error,) = Downloader().download_all([(package_url, str(destination_filepath), len(CONTENT), wrong_digest)])
+
+    assert isinstance(error, DownloadError)
+    assert not destination_filepath.exists()
+    assert not get_partial_filepath(destination_filepath).exists() # not resumed from on the next run
+
+def test_truncated_stream_is_resumed(file_server, package_url, tmp_path):
+    destination_filepath = tmp_path / "package.pkg.tar.zst"
+    file_server.no_of_truncated_responses = 1
+
+    assert Downloader().download_all([(package_url, str(destination_filepath), len(CONTENT), DIGEST)]) == [None]
+
+    assert destination_filepath.read_bytes() == CONTENT
+    ((_, first_range, first_status), (_, second_range, second_status)) = file_server.requests
+    assert (first_range, first_status) == (None, 200)
+    assert (second_range, second_status) == (f"bytes={len(CONTENT) // 2}-", 206)
+
+def test_truncated_chunked_stream_is_resumed(file_server, package_url, tmp_path):
+    destination_filepath = tmp_path / "package.pkg.tar.zst"
+    file_server.use_chunked_encoding = True # a cut chunk raises `http.client.IncompleteRead` instead of ending the read early
+    file_server.no_of_truncated_responses = 1
+
+    assert Downloader().download_all([(package_url, str(destination_filepath), len(CONTENT), DIGEST)]) == [None]
+
+    assert destination_filepath.read_bytes() == CONTENT
+    assert [status for (_, _, status) in file_server.requests] == [200, 206]
+
+def test_truncated_stream_on_every_attempt(file_server, package_url, tmp_path):
+    destination_filepath = tmp_path / "package.pkg.tar.zst"
+    file_server.no_of_truncated_responses = 3
+
+    (error,) = Downloader(no_of_attempts= 3).download_all([(package_url, str(destination_filepath), len(CONTENT), DIGEST)])
+
+    assert isinstance(error, DownloadError) # returned, not raised
+    assert not destination_filepath.exists()
+    assert len(file_server.requests) == 3
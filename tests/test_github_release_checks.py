@@ -0,0 +1,60 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+from user_interface.gtk.code.github_releases import GitHubReleaseClient, get_compatible_release_asset, get_compatible_release_assets
+
+INSTALLER_CONFIG_URL_STUB = "rebornos-team/calamares-configuration"
+INSTALLER_URL_STUB = "rebornos-team/calamares-core"
+
+def make_client(github_api, tmp_path) -> GitHubReleaseClient:
+    return GitHubReleaseClient(cache_directory_path= str(tmp_path / "github_releases"), api_base_url= github_api.url)
+
+def test_lookups_run_at_the_same_time(github_api, tmp_path):
+    github_api.set_release(INSTALLER_CONFIG_URL_STUB, "v3.2.1")
+    github_api.set_release(INSTALLER_URL_STUB, "v3.2.2")
+    github_api.latency_seconds = 0.5 # long enough for the two requests to overlap if they are sent at the same time
+
+    release_assets = get_compatible_release_assets(
+        make_client(github_api, tmp_path),
+        [("calamares-configuration", INSTALLER_CONFIG_URL_STUB), ("calamares-core", INSTALLER_URL_STUB)],
+        lambda package_name: "3.2.0",
+    )
+
+    assert [tag_name for (tag_name, _) in release_assets] == ["v3.2.1", "v3.2.2"]
+    assert github_api.peak_no_of_requests_in_flight == 2
+
+def test_newer_patch_release_is_compatible(github_api, tmp_path):
+    github_api.set_release(INSTALLER_URL_STUB, "v3.2.1")
+
+    (tag_name, asset) = get_compatible_release_asset(make_client(github_api, tmp_path), INSTALLER_URL_STUB, "3.2.0")
+
+    assert tag_name == "v3.2.1"
+    assert asset["name"] == "calamares-core-3.2.1-1-x86_64.pkg.tar.zst"
+
+def test_not_installed_package_is_compatible(github_api, tmp_path):
+    github_api.set_release(INSTALLER_URL_STUB, "v3.2.1")
+
+    assert get_compatible_release_asset(make_client(github_api, tmp_path), INSTALLER_URL_STUB, "") is not None
+
+def test_same_or_older_release_is_skipped(github_api, tmp_path):
+    github_api.set_release(INSTALLER_URL_STUB, "v3.2.1")
+    client = make_client(github_api, tmp_path)
+
+    assert get_compatible_release_asset(client, INSTALLER_URL_STUB, "3.2.1") is None
+    assert get_compatible_release_asset(client, INSTALLER_URL_STUB, "3.2.2") is None
+
+def test_release_with_a_major_change_is_skipped(github_api, tmp_path):
+    github_api.set_release(INSTALLER_URL_STUB, "v3.3.0")
+
+    assert get_compatible_release_asset(make_client(github_api, tmp_path), INSTALLER_URL_STUB, "3.2.9") is None
+
+def test_release_without_a_package_is_skipped(github_api, tmp_path):
+    github_api.set_release(INSTALLER_URL_STUB, "v3.2.1", assets= [])
+
+    assert get_compatible_release_asset(make_client(github_api, tmp_path), INSTALLER_URL_STUB, "3.2.0") is None
@@ -0,0 +1,70 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+from user_interface.gtk.code.github_releases import GitHubReleaseClient
+
+URL_STUB = "rebornos-team/calamares-core"
+
+def make_client(github_api, tmp_path, cache_ttl_seconds: float = 300) -> GitHubReleaseClient:
+    return GitHubReleaseClient(
+        cache_directory_path= str(tmp_path / "github_releases"),
+        cache_ttl_seconds= cache_ttl_seconds,
+        timeout_seconds= 5,
+        api_base_url= github_api.url,
+    )
+
+def test_first_fetch(github_api, tmp_path):
+    github_api.set_release(URL_STUB, "v3.2.1")
+    client = make_client(github_api, tmp_path)
+
+    release = client.get_latest_release(URL_STUB)
+
+    assert release.tag_name == "v3.2.1"
+    assert release.version == "3.2.1"
+    assert release.get_package_asset()["name"] == "calamares-core-3.2.1-1-x86_64.pkg.tar.zst"
+    assert github_api.requests == [("/repos/" + URL_STUB + "/releases/latest", None, 200)]
+    assert (tmp_path / "github_releases" / "rebornos-team__calamares-core.json").is_file()
+
+def test_missing_release(github_api, tmp_path):
+    assert make_client(github_api, tmp_path).get_latest_release(URL_STUB) is None
+
+def test_cache_hit_within_ttl(github_api, tmp_path):
+    github_api.set_release(URL_STUB, "v3.2.1")
+    make_client(github_api, tmp_path).get_latest_release(URL_STUB)
+    github_api.set_release(URL_STUB, "v3.2.2") # not seen until the cached response expires
+
+    assert make_client(github_api, tmp_path).get_latest_release(URL_STUB).tag_name == "v3.2.1" # a new client reads the cache on the disk
+    assert len(github_api.requests) == 1
+
+def test_revalidation_with_etag(github_api, tmp_path):
+    github_api.set_release(URL_STUB, "v3.2.1")
+    client = make_client(github_api, tmp_path, cache_ttl_seconds= 0)
+    client.get_latest_release(URL_STUB)
+
+    assert client.get_latest_release(URL_STUB).tag_name == "v3.2.1"
+    ((_, first_etag, first_status), (_, second_etag, second_status)) = github_api.requests
+    assert (first_etag, first_status) == (None, 200)
+    assert second_etag is not None and second_status == 304
+
+    github_api.set_release(URL_STUB, "v3.2.2") # a changed release gets a new ETag
+    assert client.get_latest_release(URL_STUB).tag_name == "v3.2.2"
+    assert github_api.requests[-1][2] == 200
+
+def test_stale_fallback(github_api, tmp_path):
+    github_api.set_release(URL_STUB, "v3.2.1")
+    make_client(github_api, tmp_path).get_latest_release(URL_STUB)
+    github_api.failure_status = 503
+
+    assert make_client(github_api, tmp_path, cache_ttl_seconds= 0).get_latest_release(URL_STUB).tag_name == "v3.2.1"
+    assert github_api.requests[-1][2] == 503
+
+def test_unreachable_without_cache(github_api, tmp_path):
+    github_api.failure_status = 503
+
+    assert make_client(github_api, tmp_path).get_latest_release(URL_STUB) is None
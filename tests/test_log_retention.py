@@ -0,0 +1,78 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import gzip
+import time
+
+import pytest
+
+pytest.importorskip("pysetting")
+pytest.importorskip("pyrunning")
+
+from main import LogRetentionManager
+
+def write_log_file(log_directory_path, name, size= 10, age_days= 0.0):
+    log_file_path = log_directory_path / name
+    log_file_path.write_bytes(b"x" * size)
+    modification_time = time.time() - age_days * 24 * 60 * 60
+    os.utime(log_file_path, (modification_time, modification_time))
+    return log_file_path
+
+def get_file_names(log_directory_path):
+    return sorted([file_path.name for file_path in log_directory_path.iterdir()])
+
+def test_count_includes_the_current_log_file(tmp_path):
+    for index in range(8):
+        write_log_file(tmp_path, "welcome_app-2024-01-0" + str(index + 1) + ".log", age_days= 8 - index)
+    current_log_file_path = write_log_file(tmp_path, "welcome_app-2024-01-09.log")
+    write_log_file(tmp_path, "welcome_app-2024-01-09.log.1") # a rotated part of the current log file
+    write_log_file(tmp_path, "unrelated.log", age_days= 100)
+
+    LogRetentionManager(tmp_path, current_log_file_path, no_of_files_to_keep= 5, compress= False).apply()
+
+    assert get_file_names(tmp_path) == [
+        "unrelated.log",
+        "welcome_app-2024-01-05.log",
+        "welcome_app-2024-01-06.log",
+        "welcome_app-2024-01-07.log",
+        "welcome_app-2024-01-08.log",
+        "welcome_app-2024-01-09.log",
+        "welcome_app-2024-01-09.log.1",
+    ]
+
+def test_total_size_limit(tmp_path):
+    write_log_file(tmp_path, "welcome_app-1.log", size= 40, age_days= 3)
+    write_log_file(tmp_path, "welcome_app-2.log", size= 40, age_days= 2)
+    write_log_file(tmp_path, "welcome_app-3.log", size= 40, age_days= 1)
+
+    LogRetentionManager(tmp_path, max_total_size_bytes= 100, compress= False).apply()
+
+    assert get_file_names(tmp_path) == ["welcome_app-2.log", "welcome_app-3.log"]
+
+def test_age_limit(tmp_path):
+    write_log_file(tmp_path, "welcome_app-1.log", age_days= 40)
+    write_log_file(tmp_path, "welcome_app-2.log", age_days= 20)
+
+    LogRetentionManager(tmp_path, max_age_days= 30, compress= False).apply()
+
+    assert get_file_names(tmp_path) == ["welcome_app-2.log"]
+
+def test_kept_files_are_compressed(tmp_path):
+    old_log_file_path = write_log_file(tmp_path, "welcome_app-1.log", size= 1000, age_days= 2)
+    modification_time = old_log_file_path.stat().st_mtime
+    current_log_file_path = write_log_file(tmp_path, "welcome_app-2.log")
+
+    LogRetentionManager(tmp_path, current_log_file_path).apply()
+
+    assert get_file_names(tmp_path) == ["welcome_app-1.log.gz", "welcome_app-2.log"]
+    compressed_file_path = tmp_path / "welcome_app-1.log.gz"
+    with gzip.open(compressed_file_path, "rb") as compressed_file:
+        assert compressed_file.read() == b"x" * 1000
+    assert compressed_file_path.stat().st_mtime == modification_time # the ordering by age is unchanged
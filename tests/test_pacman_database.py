@@ -0,0 +1,144 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import io
+import tarfile
+
+from user_interface.gtk.code.pacman_database import LocalPackageIndex, SyncDatabaseIndex
+
+PACMAN_CONFIGURATION = """[options]
+HoldPkg = pacman glibc
+Architecture = auto
+
+[rebornos]
+SigLevel = Optional TrustAll
+Include = /etc/pacman.d/reborn-mirrorlist
+
+[core]
+Include = /etc/pacman.d/mirrorlist
+
+[extra]
+Include = /etc/pacman.d/mirrorlist
+"""
+
+def make_local_database(tmp_path, package_directory_names):
+    local_database_path = tmp_path / "local"
+    local_database_path.mkdir()
+    (local_database_path / "ALPM_DB_VERSION").write_text("9\n")
+    for package_directory_name in package_directory_names:
+        (local_database_path / package_directory_name).mkdir()
+        (local_database_path / package_directory_name / "desc").write_text("")
+    return local_database_path
+
+def set_modification_time(path, modification_time_ns):
+    os.utime(path, ns= (modification_time_ns, modification_time_ns))
+
+def test_local_lookup(tmp_path):
+    local_package_index = LocalPackageIndex(str(make_local_database(tmp_path, ["pacman-6.1.0-3", "calamares-core-3.2.1-1", "python-gobject-2:3.46.0-1"])))
+
+    assert local_package_index.is_available()
+    assert local_package_index.get_version("pacman") == "6.1.0-3"
+    assert local_package_index.get_version("calamares-core") == "3.2.1-1"
+    assert local_package_index.get_version("python-gobject") == "2:3.46.0-1"
+    assert local_package_index.is_installed("calamares-core")
+    assert not local_package_index.is_installed("calamares") # names are matched exactly
+    assert local_package_index.get_version("ALPM_DB_VERSION") is None
+
+def test_local_database_missing(tmp_path):
+    assert not LocalPackageIndex(str(tmp_path / "local")).is_available()
+
+def test_local_index_is_rebuilt_when_the_database_changes(tmp_path):
+    local_database_path = make_local_database(tmp_path, ["calamares-core-3.2.1-1"])
+    set_modification_time(local_database_path, 1_000_000_000_000_000_000)
+    local_package_index = LocalPackageIndex(str(local_database_path))
+    assert local_package_index.get_version("calamares-core") == "3.2.1-1"
+
+    # Not rebuilt while the modification time stays the same
+    os.rename(local_database_path / "calamares-core-3.2.1-1", local_database_path / "calamares-core-3.2.2-1")
+    set_modification_time(local_database_path, 1_000_000_000_000_000_000)
+    assert local_package_index.get_version("calamares-core") == "3.2.1-1"
+
+    # Rebuilt once it changes, as it does when pacman installs or removes a package
+    set_modification_time(local_database_path, 1_000_000_001_000_000_000)
+    assert local_package_index.get_version("calamares-core") == "3.2.2-1"
+
+def write_sync_database(sync_database_path, repository_name, package_directory_names):
+    """
+    Write a sync database like pacman's: a gzipped tar archive with a `<name>-<pkgver>-<pkgrel>/desc` entry for every package
+    """
+
+    database_filepath = sync_database_path / (repository_name + ".db")
+    with tarfile.open(database_filepath, "w:gz") as database_archive:
+        for package_directory_name in package_directory_names:
+            directory_info = tarfile.TarInfo(package_directory_name)
+            directory_info.type = tarfile.DIRTYPE
+            database_archive.addfile(directory_info)
+            desc = ("%NAME%\n" + package_directory_name.rsplit("-", 2)[0] + "\n").encode("utf-8")
+            desc_info = tarfile.TarInfo(package_directory_name + "/desc")
+            desc_info.size = len(desc)
+            database_archive.addfile(desc_info, io.BytesIO(desc))
+    return database_filepath
+
+def make_sync_database_index(tmp_path, databases):
+    sync_database_path = tmp_path / "sync"
+    sync_database_path.mkdir()
+    for (repository_name, package_directory_names) in databases.items():
+        write_sync_database(sync_database_path, repository_name, package_directory_names)
+    pacman_configuration_path = tmp_path / "pacman.conf"
+    pacman_configuration_path.write_text(PACMAN_CONFIGURATION)
+    return SyncDatabaseIndex(str(sync_database_path), str(pacman_configuration_path))
+
+def test_sync_lookup_matches_exact_names(tmp_path):
+    sync_database_index = make_sync_database_index(tmp_path, {"extra": ["calamares-core-3.2.1-1", "python-gobject-2:3.46.0-1"]})
+
+    assert sync_database_index.is_available()
+    assert sync_database_index.get_version("calamares-core") == "3.2.1-1"
+    assert sync_database_index.get_version("calamares") is None
+    assert sync_database_index.get_version("python-gobject") == "2:3.46.0-1"
+
+def test_first_repository_in_pacman_conf_wins(tmp_path):
+    sync_database_index = make_sync_database_index(tmp_path, {
+        "core": ["calamares-core-3.2.0-1"],
+        "extra": ["calamares-core-3.1.0-1", "firefox-120.0-1"],
+        "rebornos": ["calamares-core-3.2.1-1"],
+        "unlisted": ["calamares-core-9.0.0-1", "firefox-121.0-1"],
+    })
+
+    assert [database_name for (database_name, _) in sync_database_index.get_database_modification_times()] == ["rebornos.db", "core.db", "extra.db", "unlisted.db"] # `[options]` is not a repository, and unlisted databases come last
+    assert sync_database_index.get_version("calamares-core") == "3.2.1-1"
+    assert sync_database_index.get_version("firefox") == "120.0-1"
+
+def test_sync_index_is_rebuilt_when_a_database_changes(tmp_path):
+    sync_database_index = make_sync_database_index(tmp_path, {"rebornos": ["calamares-core-3.2.1-1"]})
+    assert sync_database_index.get_version("calamares-core") == "3.2.1-1"
+
+    database_filepath = write_sync_database(tmp_path / "sync", "rebornos", ["calamares-core-3.2.2-1"]) # like `pacman -Sy`
+    set_modification_time(database_filepath, os.stat(database_filepath).st_mtime_ns + 1_000_000_000)
+
+    assert sync_database_index.get_version("calamares-core") == "3.2.2-1"
+
+def test_unreadable_database(tmp_path):
+    sync_database_index = make_sync_database_index(tmp_path, {"core": ["pacman-6.1.0-3"]})
+    (tmp_path / "sync" / "extra.db").write_bytes(b"not an archive")
+
+    assert sync_database_index.get_version("pacman") == "6.1.0-3"
+    assert sync_database_index.unreadable_databases == ["extra.db"]
+    assert not sync_database_index.is_available()
+
+def test_last_refresh_time_is_that_of_the_oldest_database(tmp_path):
+    sync_database_index = make_sync_database_index(tmp_path, {"core": ["pacman-6.1.0-3"], "extra": ["firefox-120.0-1"]})
+    set_modification_time(tmp_path / "sync" / "core.db", 1_700_000_000_000_000_000)
+    set_modification_time(tmp_path / "sync" / "extra.db", 1_700_000_100_000_000_000)
+
+    assert sync_database_index.get_last_refresh_time() == 1_700_000_000
+
+def test_last_refresh_time_without_databases(tmp_path):
+    assert make_sync_database_index(tmp_path, {}).get_last_refresh_time() is None
+    assert SyncDatabaseIndex(str(tmp_path / "missing")).get_last_refresh_time() is None
@@ -0,0 +1,122 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import stat
+import logging
+
+import pytest
+
+pytest.importorskip("pyrunning")
+from pyrunning import BatchJob, LoggingHandler
+
+from user_interface.gtk.code.pacman_transaction import PacmanTransaction
+
+# Record every call in $FAKE_CALL_LOG. The fake `pacman` fails when its operation is $FAKE_PACMAN_FAIL_ON
+FAKE_PKEXEC = """#! /bin/sh
+echo "pkexec $*" >> "$FAKE_CALL_LOG"
+exec "$@"
+"""
+FAKE_PACMAN = """#! /bin/sh
+echo "pacman $*" >> "$FAKE_CALL_LOG"
+if [ "$1" = "$FAKE_PACMAN_FAIL_ON" ]; then
+    exit 1
+fi
+"""
+
+@pytest.fixture
+def call_log(tmp_path, monkeypatch):
+    bin_directory_path = tmp_path / "bin"
+    bin_directory_path.mkdir()
+    for (name, script) in [("pkexec", FAKE_PKEXEC), ("pacman", FAKE_PACMAN)]:
+        script_filepath = bin_directory_path / name
+        script_filepath.write_text(script)
+        script_filepath.chmod(script_filepath.stat().st_mode | stat.S_IXUSR)
+    call_log_filepath = tmp_path / "calls.log"
+    call_log_filepath.touch()
+    monkeypatch.setenv("PATH", str(bin_directory_path) + os.pathsep + os.environ["PATH"])
+    monkeypatch.setenv("FAKE_CALL_LOG", str(call_log_filepath))
+    monkeypatch.delenv("FAKE_PACMAN_FAIL_ON", raising= False)
+    return call_log_filepath
+
+def run_transaction(transaction: PacmanTransaction) -> None:
+    logging_handler = LoggingHandler(logger= logging.getLogger("rebornos_welcome.tests"))
+    batch_job = transaction.add_to_batch_job(BatchJob(logging_handler= logging_handler))
+    batch_job.start()
+    batch_job.boss_thread.join(timeout= 30)
+    logging_handler.abort(wait= True)
+    assert not batch_job.boss_thread.is_alive()
+
+def make_installer_transaction() -> PacmanTransaction:
+    transaction = PacmanTransaction()
+    transaction.sync(["calamares-configuration", "calamares-core"], refresh= True) # added first, but run last
+    transaction.remove(["calamares-core-git", "calamares-configuration-git"])
+    transaction.add_package_files(["/tmp/calamares-core-3.2.1-1-x86_64.pkg.tar.zst"])
+    return transaction
+
+def test_one_privileged_call_in_order(call_log):
+    run_transaction(make_installer_transaction())
+
+    (pkexec_call, *pacman_calls) = call_log.read_text().splitlines()
+    assert pkexec_call.startswith("pkexec /bin/sh -c ")
+    assert pacman_calls == [
+        "pacman -Rdd --noconfirm calamares-core-git calamares-configuration-git",
+        "pacman -U --noconfirm /tmp/calamares-core-3.2.1-1-x86_64.pkg.tar.zst",
+        "pacman -Sy --needed --noconfirm calamares-configuration", # `calamares-core` comes from the file, and is not replaced by the repository build
+    ]
+
+def test_failing_step_stops_the_chain(call_log, monkeypatch):
+    monkeypatch.setenv("FAKE_PACMAN_FAIL_ON", "-U")
+
+    run_transaction(make_installer_transaction())
+
+    assert [call.split()[:2] for call in call_log.read_text().splitlines()] == [
+        ["pkexec", "/bin/sh"],
+        ["pacman", "-Rdd"],
+        ["pacman", "-U"],
+    ]
+
+def test_post_transaction_commands_run_unprivileged(call_log):
+    transaction = PacmanTransaction()
+    transaction.sync(["rebornos-fire"])
+    transaction.add_post_transaction_command(["sh", "-c", "echo launched >> \"$FAKE_CALL_LOG\""])
+
+    run_transaction(transaction)
+
+    assert call_log.read_text().splitlines()[1:] == [
+        "pacman -S --needed --noconfirm rebornos-fire",
+        "launched",
+    ]
+
+def test_empty_transaction_makes_no_privileged_call(call_log):
+    run_transaction(PacmanTransaction())
+
+    assert call_log.read_text() == ""
+
+def test_packages_from_files_are_not_synced():
+    transaction = PacmanTransaction()
+    transaction.add_package_files(["/tmp/calamares-core-3.2.1-1-x86_64.pkg.tar.zst", "/tmp/calamares-configuration-2:24.1_2-1-any.pkg.tar.zst"])
+    transaction.sync(["calamares-configuration", "calamares-core"], refresh= True)
+
+    assert transaction.get_pacman_commands() == [
+        ["pacman", "-U", "--noconfirm", "/tmp/calamares-core-3.2.1-1-x86_64.pkg.tar.zst", "/tmp/calamares-configuration-2:24.1_2-1-any.pkg.tar.zst"],
+        ["pacman", "-Sy"],
+    ]
+
+def test_package_name_of_package_file():
+    assert PacmanTransaction.get_package_name("/cache/v3.2.1/calamares-core-3.2.1-1-x86_64.pkg.tar.zst") == "calamares-core"
+    assert PacmanTransaction.get_package_name("python-gobject-3.46.0-1-x86_64.pkg.tar.xz") == "python-gobject"
+
+def test_duplicates_are_planned_once():
+    transaction = PacmanTransaction(remove_database_lock= True)
+    transaction.sync(["calamares-core"])
+    transaction.sync(["calamares-core", "calamares-configuration"])
+
+    assert transaction.get_pacman_commands() == [["pacman", "-S", "--needed", "--noconfirm", "calamares-core", "calamares-configuration"]]
+    assert transaction.get_command_strings()[3].startswith("rm -f /var/lib/pacman/db.lck && pacman -S ")
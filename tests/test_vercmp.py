@@ -0,0 +1,95 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import pytest
+
+from user_interface.gtk.code.pacman_database import vercmp
+
+# The cases of `test/util/vercmptest.sh` in the pacman sources, as (version_1, version_2, expected result of `vercmp version_1 version_2`)
+VERCMP_CASES = [
+    # all similar length, no pkgrel
+    ("1.5.0", "1.5.0", 0),
+    ("1.5.1", "1.5.0", 1),
+
+    # mixed length
+    ("1.5.1", "1.5", 1),
+
+    # with pkgrel, simple
+    ("1.5.0-1", "1.5.0-1", 0),
+    ("1.5.0-1", "1.5.0-2", -1),
+    ("1.5.0-1", "1.5.1-1", -1),
+    ("1.5.0-2", "1.5.1-1", -1),
+
+    # with pkgrel, mixed lengths
+    ("1.5-1", "1.5.1-1", -1),
+    ("1.5-2", "1.5.1-1", -1),
+    ("1.5-2", "1.5.1-2", -1),
+
+    # mixed pkgrel inclusion
+    ("1.5", "1.5-1", 0),
+    ("1.5-1", "1.5", 0),
+    ("1.1-1", "1.1", 0),
+    ("1.0-1", "1.1", -1),
+    ("1.1-1", "1.0", 1),
+
+    # alphanumeric versions
+    ("1.5b-1", "1.5-1", -1),
+    ("1.5b", "1.5", -1),
+    ("1.5b-1", "1.5", -1),
+    ("1.5b", "1.5.1", -1),
+
+    # from the manpage
+    ("1.0a", "1.0alpha", -1),
+    ("1.0alpha", "1.0b", -1),
+    ("1.0b", "1.0beta", -1),
+    ("1.0beta", "1.0rc", -1),
+    ("1.0rc", "1.0", -1),
+
+    # alpha-dotted versions
+    ("1.5.a", "1.5", 1),
+    ("1.5.b", "1.5.a", 1),
+    ("1.5.1", "1.5.b", 1),
+
+    # alpha dots and dashes
+    ("1.5.b-1", "1.5.b", 0),
+    ("1.5-1", "1.5.b", -1),
+
+    # same/similar content, differing separators
+    ("2.0", "2_0", 0),
+    ("2.0_a", "2_0.a", 0),
+    ("2.0a", "2.0.a", -1),
+    ("2___a", "2_a", 1),
+
+    # epoch included version comparisons
+    ("0:1.0", "0:1.0", 0),
+    ("0:1.0", "0:1.1", -1),
+    ("1:1.0", "0:1.0", 1),
+    ("1:1.0", "0:1.1", 1),
+    ("1:1.0", "2:1.1", -1),
+
+    # epoch + sometimes present pkgrel
+    ("1:1.0", "0:1.0-1", 1),
+    ("1:1.0-1", "0:1.1-1", 1),
+
+    # epoch included on one version
+    ("0:1.0", "1.0", 0),
+    ("0:1.0", "1.1", -1),
+    ("0:1.1", "1.0", 1),
+    ("1:1.0", "1.0", 1),
+    ("1:1.0", "1.1", 1),
+    ("1:1.1", "1.1", 1),
+]
+
+@pytest.mark.parametrize("version_1, version_2, expected", VERCMP_CASES)
+def test_vercmp(version_1: str, version_2: str, expected: int) -> None:
+    assert vercmp(version_1, version_2) == expected
+
+@pytest.mark.parametrize("version_1, version_2, expected", VERCMP_CASES)
+def test_vercmp_reversed(version_1: str, version_2: str, expected: int) -> None:
+    assert vercmp(version_2, version_1) == -expected
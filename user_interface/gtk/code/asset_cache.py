@@ -0,0 +1,151 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import threading
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Any
+
+logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
+
+class ReleaseAssetCache:
+    """
+    Keep downloaded GitHub release assets on the disk, keyed by repository and release tag, so that they are downloaded again only when the release changes
+
+    The files are laid out as `<cache directory>/<owner>__<repository>/<tag>/<asset name>`. The modification time of a file is its last use, and the least recently used files are evicted once the cache grows beyond `max_size_bytes`
+    """
+
+    def __init__(self, cache_directory_path: str, max_size_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Parameters
+        ----------
+        cache_directory_path: str
+            The directory to keep the assets in
+        max_size_bytes: int
+            The size beyond which the least recently used assets are evicted
+        """
+
+        self.cache_directory_path = Path(cache_directory_path).expanduser()
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _to_path_component(name: str) -> str:
+        return name.replace(os.sep, "__")
+
+    def get_filepath(self, url_stub: str, tag_name: str, asset_name: str) -> Path:
+        """
+        Get where an asset is kept, whether or not it is in the cache yet
+
+        Parameters
+        ----------
+        url_stub: str
+            The owner and the name of the repository, for example "rebornos-team/calamares-core"
+        tag_name: str
+            The tag of the release
+        asset_name: str
+            The file name of the asset
+
+        Returns
+        -------
+        filepath: Path
+            Where the asset is kept
+        """
+
+        return (
+            self.cache_directory_path
+            / self._to_path_component(url_stub)
+            / self._to_path_component(tag_name)
+            / self._to_path_component(asset_name)
+        )
+
+    def lookup(self, url_stub: str, tag_name: str, asset: Dict[str, Any]) -> Optional[Path]:
+        """
+        Get a cached asset and mark it as used
+
+        Parameters
+        ----------
+        url_stub: str
+            The owner and the name of the repository
+        tag_name: str
+            The tag of the release
+        asset: Dict[str, Any]
+            The asset, with at least a "name", and optionally its "size"
+
+        Returns
+        -------
+        filepath: Optional[Path]
+            The cached file, or None if it is not in the cache. The digest of the file was verified when it was downloaded
+        """
+
+        filepath = self.get_filepath(url_stub, tag_name, asset["name"])
+        try:
+            size = filepath.stat().st_size
+        except FileNotFoundError:
+            return None
+        if asset.get("size") is not None and size != asset["size"]:
+            logger.warning(f"Ignoring the cached `{filepath}` since its size does not match the release")
+            return None
+        try:
+            os.utime(filepath) # the modification time is the last use
+        except OSError:
+            pass
+        return filepath
+
+    def evict(self, keep: Iterable[Path] = ()) -> List[Path]:
+        """
+        Delete the least recently used files until the cache fits in `max_size_bytes`
+
+        Parameters
+        ----------
+        keep: Iterable[Path]
+            Files that are never deleted, for example the ones about to be installed
+
+        Returns
+        -------
+        deleted_filepaths: List[Path]
+            The deleted files
+        """
+
+        keep = set([Path(filepath) for filepath in keep])
+        deleted_filepaths = []
+        with self._lock:
+            files = [] # (modification time, size, filepath)
+            for (directory_path, _, filenames) in os.walk(self.cache_directory_path):
+                for filename in filenames:
+                    filepath = Path(directory_path) / filename
+                    try:
+                        file_stat = filepath.stat()
+                    except OSError:
+                        continue
+                    files.append((file_stat.st_mtime, file_stat.st_size, filepath))
+
+            total_size = sum([size for (_, size, _) in files])
+            for (_, size, filepath) in sorted(files):
+                if total_size <= self.max_size_bytes:
+                    break
+                if filepath in keep:
+                    continue
+                try:
+                    filepath.unlink()
+                except OSError as error:
+                    logger.warning(f"Could not evict `{filepath}` from the release asset cache: {error}")
+                    continue
+                total_size -= size
+                deleted_filepaths.append(filepath)
+                logger.debug(f"Evicted `{filepath}` from the release asset cache")
+
+            # Remove the tag and repository directories that were emptied
+            for directory_path in sorted(set([filepath.parent for filepath in deleted_filepaths] + [filepath.parent.parent for filepath in deleted_filepaths]), reverse= True):
+                try:
+                    directory_path.rmdir()
+                except OSError: # not empty
+                    pass
+        return deleted_filepaths
@@ -0,0 +1,252 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import time
+import hashlib
+import threading
+import logging
+import concurrent.futures
+import urllib.request
+import urllib.error
+import http.client
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
+
+class DownloadError(Exception):
+    """
+    Raised when a file could not be downloaded or did not match its expected size or digest
+    """
+
+    pass
+
+class Downloader:
+    """
+    Download files over HTTP(S) into a directory, streaming them to the disk in chunks
+
+    The files are downloaded at the same time on a pool of worker threads. Each file is written to a hidden partial file next to its destination, which is renamed to the destination only after its size and digest are verified, so that globs like `*.pkg.tar.*` never match an incomplete download. 
+    If a download is interrupted, it is resumed from the end of the partial file with an HTTP Range request, both on the next attempt and on the next run
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float = 30,
+        chunk_size: int = 64 * 1024,
+        max_workers: int = 4,
+        no_of_attempts: int = 3,
+        progress_callback: Optional[Callable[[int, Optional[int], float], None]] = None,
+        progress_interval_seconds: float = 0.5,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        timeout_seconds: float
+            The timeout of connecting and of each read
+        chunk_size: int
+            The number of bytes read and written at a time
+        max_workers: int
+            The number of files that can be downloaded at the same time
+        no_of_attempts: int
+            The number of times a download is attempted before giving up. Each attempt resumes from where the previous one stopped
+        progress_callback: Optional[Callable[[int, Optional[int], float], None]]
+            Called from the download threads with the number of bytes downloaded so far, the total number of bytes expected (None if unknown) and the download speed in bytes per second
+        progress_interval_seconds: float
+            The minimum time between calls to `progress_callback`
+        """
+
+        self.timeout_seconds = timeout_seconds
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.no_of_attempts = no_of_attempts
+        self.progress_callback = progress_callback
+        self.progress_interval_seconds = progress_interval_seconds
+
+        self._progress_lock = threading.Lock()
+        self._bytes_on_disk: Dict[Path, int] = {} # the size of each partial file, including resumed bytes
+        self._bytes_transferred = 0 # the bytes received over the network, for the speed
+        self._bytes_expected: Optional[int] = None
+        self._last_progress_time = 0.0
+        self._last_progress_bytes_transferred = 0
+
+    def download_all(
+        self,
+        downloads: List[Tuple[str, str, Optional[int], Optional[str]]]
+    ) -> List[Optional[DownloadError]]:
+        """
+        Download files at the same time
+
+        Parameters
+        ----------
+        downloads: List[Tuple[str, str, Optional[int], Optional[str]]]
+            The downloads, each as (url, destination_filepath, expected_size, expected_digest). See `download`
+
+        Returns
+        -------
+        errors: List[Optional[DownloadError]]
+            The error of each download in the same order as `downloads`, or None for the downloads that succeeded
+        """
+
+        if not downloads:
+            return []
+
+        with self._progress_lock:
+            self._bytes_on_disk = {}
+            self._bytes_transferred = 0
+            expected_sizes = [expected_size for (_, _, expected_size, _) in downloads]
+            self._bytes_expected = None if None in expected_sizes else sum(expected_sizes)
+            self._last_progress_time = time.perf_counter()
+            self._last_progress_bytes_transferred = 0
+
+        def download_and_catch(download: Tuple[str, str, Optional[int], Optional[str]]) -> Optional[DownloadError]:
+            try:
+                self.download(*download)
+            except DownloadError as error:
+                return error
+            return None
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers= min(self.max_workers, len(downloads)),
+            thread_name_prefix= "Download"
+        ) as executor:
+            errors = list(executor.map(download_and_catch, downloads))
+        self._report_progress(force= True)
+        return errors
+
+    def download(
+        self,
+        url: str,
+        destination_filepath: str,
+        expected_size: Optional[int] = None,
+        expected_digest: Optional[str] = None,
+    ) -> Path:
+        """
+        Download a file
+
+        Parameters
+        ----------
+        url: str
+            The address of the file
+        destination_filepath: str
+            Where to save the file
+        expected_size: Optional[int]
+            The size of the file in bytes, if known
+        expected_digest: Optional[str]
+            The digest of the file in the form "<algorithm>:<hex digest>", for example "sha256:ab12...", if known
+
+        Returns
+        -------
+        destination_filepath: Path
+            Where the file was saved
+
+        Raises
+        ------
+        DownloadError
+            If the file could not be downloaded after all the attempts, or if it does not match the expected size or digest
+        """
+
+        destination_filepath = Path(destination_filepath)
+        partial_filepath = destination_filepath.parent / ("." + destination_filepath.name + ".part")
+        destination_filepath.parent.mkdir(parents= True, exist_ok= True)
+
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self.no_of_attempts + 1):
+            try:
+                self._download_to_partial_file(url, partial_filepath, expected_size)
+                break
+            except (urllib.error.URLError, OSError, ValueError, http.client.HTTPException) as error: # HTTPError and timeouts are subclasses of these, and `IncompleteRead` (a connection closed in the middle of a read) is an `HTTPException`
+                last_error = error
+                logger.warning(f"Attempt {attempt} of {self.no_of_attempts} to download `{url}` failed: {error}")
+        else:
+            raise DownloadError(f"Could not download `{url}`: {last_error}")
+
+        try:
+            self._verify(partial_filepath, expected_size, expected_digest)
+        except DownloadError:
+            partial_filepath.unlink()
+            raise
+        os.replace(partial_filepath, destination_filepath)
+        logger.debug(f"Downloaded `{url}` to `{destination_filepath}`")
+        return destination_filepath
+
+    def _download_to_partial_file(self, url: str, partial_filepath: Path, expected_size: Optional[int]) -> None:
+        try:
+            resume_from = partial_filepath.stat().st_size
+        except FileNotFoundError:
+            resume_from = 0
+        if expected_size is not None and resume_from > expected_size: # cannot be a prefix of the file
+            partial_filepath.unlink()
+            resume_from = 0
+
+        request = urllib.request.Request(url, headers= {"User-Agent": "rebornos-welcome"})
+        if resume_from > 0:
+            request.add_header("Range", f"bytes={resume_from}-")
+        try:
+            response = urllib.request.urlopen(request, timeout= self.timeout_seconds)
+        except urllib.error.HTTPError as error:
+            if error.code == 416 and resume_from > 0: # the range starts at or after the end, so the partial file may already be complete
+                if expected_size is None or resume_from == expected_size:
+                    return
+                partial_filepath.unlink()
+            raise
+
+        with response:
+            if resume_from > 0 and response.status == 206:
+                logger.info(f"Resuming the download of `{url}` from byte {resume_from}...")
+                file_mode = "ab"
+            else: # the server sent the whole file
+                file_mode = "wb"
+                resume_from = 0
+            with self._progress_lock:
+                self._bytes_on_disk[partial_filepath] = resume_from
+            content_length = response.headers.get("Content-Length")
+            no_of_bytes_received = 0
+            with open(partial_filepath, file_mode) as partial_file:
+                while True:
+                    chunk = response.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    no_of_bytes_received += len(chunk)
+                    partial_file.write(chunk)
+                    with self._progress_lock:
+                        self._bytes_on_disk[partial_filepath] += len(chunk)
+                        self._bytes_transferred += len(chunk)
+                    self._report_progress()
+            if content_length is not None and no_of_bytes_received < int(content_length): # the connection was closed early
+                raise ConnectionError(f"Received {no_of_bytes_received} of {content_length} bytes")
+
+    def _verify(self, filepath: Path, expected_size: Optional[int], expected_digest: Optional[str]) -> None:
+        size = filepath.stat().st_size
+        if expected_size is not None and size != expected_size:
+            raise DownloadError(f"`{filepath}` has {size} bytes instead of {expected_size}")
+        if expected_digest:
+            (algorithm, _, expected_hex_digest) = expected_digest.partition(":")
+            try:
+                file_hash = hashlib.new(algorithm)
+            except ValueError:
+                logger.warning(f"Not verifying `{filepath}` with the unknown digest algorithm `{algorithm}`")
+                return
+            with open(filepath, "rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    file_hash.update(chunk)
+            if file_hash.hexdigest() != expected_hex_digest.lower():
+                raise DownloadError(f"`{filepath}` has the {algorithm} digest {file_hash.hexdigest()} instead of {expected_hex_digest}")
+
+    def _report_progress(self, force: bool = False) -> None:
+        with self._progress_lock:
+            current_time = time.perf_counter()
+            elapsed_time = current_time - self._last_progress_time
+            if self.progress_callback is None or (not force and elapsed_time < self.progress_interval_seconds):
+                return
+            bytes_per_second = (self._bytes_transferred - self._last_progress_bytes_transferred) / elapsed_time if elapsed_time > 0 else 0.0
+            self._last_progress_time = current_time
+            self._last_progress_bytes_transferred = self._bytes_transferred
+            progress = (sum(self._bytes_on_disk.values()), self._bytes_expected, bytes_per_second)
+        self.progress_callback(*progress)
@@ -0,0 +1,338 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import re
+import json
+import time
+import threading
+import tempfile
+import logging
+import urllib.request
+import urllib.error
+import concurrent.futures
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+from .pacman_database import vercmp
+
+logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
+
+class GitHubRelease:
+    """
+    The parts of the metadata of a GitHub release that are used by the application
+    """
+
+    def __init__(self, tag_name: str, assets: List[Dict[str, Any]]) -> None:
+        """
+        Parameters
+        ----------
+        tag_name: str
+            The tag of the release, for example "v3.2.1"
+        assets: List[Dict[str, Any]]
+            The assets of the release, each with a "name", a "browser_download_url", a "size" and a "digest" (which may be None)
+        """
+
+        self.tag_name = tag_name
+        self.assets = assets
+
+    @property
+    def version(self) -> str:
+        """
+        The tag of the release without a leading "v"
+        """
+
+        if self.tag_name.startswith("v"):
+            return self.tag_name[1:].strip()
+        return self.tag_name.strip()
+
+    def get_package_asset(self, suffix: str = ".zst") -> Optional[Dict[str, Any]]:
+        """
+        Get the package asset of the release, leaving out debug packages
+
+        Parameters
+        ----------
+        suffix: str
+            The ending of the asset file name
+
+        Returns
+        -------
+        asset: Optional[Dict[str, Any]]
+            The first matching asset, or None if there is none
+        """
+
+        for asset in self.assets:
+            if asset["name"].endswith(suffix) and "debug" not in asset["browser_download_url"]:
+                return asset
+        return None
+
+    def get_package_asset_url(self, suffix: str = ".zst") -> Optional[str]:
+        """
+        Get the download URL of the package asset of the release, leaving out debug packages
+
+        Parameters
+        ----------
+        suffix: str
+            The ending of the asset file name
+
+        Returns
+        -------
+        url: Optional[str]
+            The download URL of the first matching asset, or None if there is none
+        """
+
+        asset = self.get_package_asset(suffix)
+        if asset is None:
+            return None
+        return asset["browser_download_url"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tag_name": self.tag_name,
+            "assets": self.assets
+        }
+
+    @classmethod
+    def from_dict(cls, release_data: Dict[str, Any]) -> "GitHubRelease":
+        """
+        Create a release from either the JSON returned by the GitHub API or from a cached dictionary
+        """
+
+        return cls(
+            tag_name= release_data["tag_name"],
+            assets= [
+                {
+                    "name": asset["name"],
+                    "browser_download_url": asset["browser_download_url"],
+                    "size": asset.get("size"),
+                    "digest": asset.get("digest"),
+                }
+                for asset in release_data.get("assets", [])
+            ]
+        )
+
+class GitHubReleaseClient:
+    """
+    Get the metadata of the latest release of GitHub repositories, with a cache on the disk
+
+    A cached response is used without asking GitHub for `cache_ttl_seconds`. After that, it is revalidated with `If-None-Match` using the stored ETag, so an unchanged release costs a "304 Not Modified", which GitHub does not count against the rate limit.
+    If GitHub cannot be reached, a stale cached response is used if there is one
+    """
+
+    def __init__(
+        self,
+        cache_directory_path: str,
+        cache_ttl_seconds: float = 300,
+        timeout_seconds: float = 10,
+        api_base_url: str = "https://api.github.com"
+    ) -> None:
+        """
+        Parameters
+        ----------
+        cache_directory_path: str
+            The directory to store the cached responses in
+        cache_ttl_seconds: float
+            How long a cached response is used without revalidating it
+        timeout_seconds: float
+            The timeout of each request to GitHub
+        api_base_url: str
+            The address of the GitHub API. Can be pointed at a local server for testing
+        """
+
+        self.cache_directory_path = Path(cache_directory_path).expanduser()
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self.api_base_url = api_base_url.rstrip("/")
+        self._lock = threading.Lock()
+        self._cache_entries: Dict[str, Dict[str, Any]] = {}
+
+    def get_latest_release(self, url_stub: str) -> Optional[GitHubRelease]:
+        """
+        Get the latest release of a GitHub repository
+
+        Parameters
+        ----------
+        url_stub: str
+            The owner and the name of the repository, for example "rebornos-team/calamares-core"
+
+        Returns
+        -------
+        release: Optional[GitHubRelease]
+            The latest release, or None if it could not be found
+        """
+
+        cache_entry = self._get_cache_entry(url_stub)
+        if cache_entry is not None and (time.time() - cache_entry["fetched_at"]) < self.cache_ttl_seconds:
+            logger.debug(f"Using the cached latest release of `{url_stub}`...")
+            return GitHubRelease.from_dict(cache_entry["release"])
+
+        request = urllib.request.Request(
+            f"{self.api_base_url}/repos/{url_stub}/releases/latest",
+            headers= {
+                "Accept": "application/vnd.github+json",
+                "User-Agent": "rebornos-welcome",
+            }
+        )
+        if cache_entry is not None and cache_entry.get("etag"):
+            request.add_header("If-None-Match", cache_entry["etag"])
+
+        try:
+            with urllib.request.urlopen(request, timeout= self.timeout_seconds) as response:
+                release_data = json.loads(response.read().decode("utf-8"))
+                etag = response.headers.get("ETag")
+            release = GitHubRelease.from_dict(release_data)
+        except urllib.error.HTTPError as error:
+            if error.code == 304 and cache_entry is not None: # not modified
+                logger.debug(f"The cached latest release of `{url_stub}` is still current...")
+                cache_entry = dict(cache_entry, fetched_at= time.time())
+                self._set_cache_entry(url_stub, cache_entry)
+                return GitHubRelease.from_dict(cache_entry["release"])
+            logger.warning(f"Could not get the latest release of `{url_stub}`: {error}")
+            return self._get_stale_release(url_stub, cache_entry)
+        except (urllib.error.URLError, OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning(f"Could not get the latest release of `{url_stub}`: {error}")
+            return self._get_stale_release(url_stub, cache_entry)
+
+        self._set_cache_entry(
+            url_stub,
+            {
+                "etag": etag,
+                "fetched_at": time.time(),
+                "release": release.to_dict(),
+            }
+        )
+        return release
+
+    def _get_stale_release(self, url_stub: str, cache_entry: Optional[Dict[str, Any]]) -> Optional[GitHubRelease]:
+        if cache_entry is None:
+            return None
+        logger.info(f"Using the stale cached latest release of `{url_stub}`...")
+        return GitHubRelease.from_dict(cache_entry["release"])
+
+    def _get_cache_filepath(self, url_stub: str) -> Path:
+        return self.cache_directory_path / (url_stub.replace("/", "__") + ".json")
+
+    def _get_cache_entry(self, url_stub: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if url_stub in self._cache_entries:
+                return self._cache_entries[url_stub]
+            try:
+                with open(self._get_cache_filepath(url_stub), "r") as cache_file:
+                    cache_entry = json.load(cache_file)
+                cache_entry["fetched_at"] = float(cache_entry["fetched_at"])
+                GitHubRelease.from_dict(cache_entry["release"]) # make sure that it is usable
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError, KeyError, TypeError) as error:
+                logger.warning(f"Ignoring the unreadable release cache of `{url_stub}`: {error}")
+                return None
+            self._cache_entries[url_stub] = cache_entry
+            return cache_entry
+
+    def _set_cache_entry(self, url_stub: str, cache_entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._cache_entries[url_stub] = cache_entry
+            cache_filepath = self._get_cache_filepath(url_stub)
+            try:
+                cache_filepath.parent.mkdir(parents= True, exist_ok= True)
+                (file_descriptor, temporary_filepath) = tempfile.mkstemp(
+                    dir= str(cache_filepath.parent),
+                    prefix= cache_filepath.name + ".",
+                    suffix= ".tmp"
+                )
+                try:
+                    with os.fdopen(file_descriptor, "w") as cache_file:
+                        json.dump(cache_entry, cache_file, indent= 4)
+                    os.replace(temporary_filepath, cache_filepath) # atomic, so that a concurrent reader never sees a partial file
+                except BaseException:
+                    os.unlink(temporary_filepath)
+                    raise
+            except OSError as error:
+                logger.warning(f"Could not write the release cache of `{url_stub}`: {error}")
+
+def get_compatible_release_asset(
+    release_client: GitHubReleaseClient,
+    url_stub: str,
+    local_version: str,
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Get the package asset of the latest GitHub release of a package, if the release is newer than the installed version and compatible with it
+
+    A release is compatible if only the last part of its version (the patch version) differs from the installed version, since a larger change needs a newer ISO
+
+    Parameters
+    ----------
+    release_client: GitHubReleaseClient
+        The client to get the release with
+    url_stub: str
+        The owner and the name of the GitHub repository of the package
+    local_version: str
+        The installed version of the package without the pkgrel, or "" if it is not installed
+
+    Returns
+    -------
+    release_asset: Optional[Tuple[str, Dict[str, Any]]]
+        The release tag and the package asset of the release (see `GitHubRelease.get_package_asset`), or None if there is no compatible newer release
+    """
+
+    release = release_client.get_latest_release(url_stub)
+    if release is None:
+        return None
+    try:
+        if vercmp(local_version, release.version) >= 0:
+            logger.debug(f"The latest GitHub release of `{url_stub}` ({release.version}) is not newer than the installed version ({local_version})")
+            return None
+    except Exception:
+        return None
+    local_version_parts = re.split('[._]', local_version)
+    github_version_parts = re.split('[._]', release.version)
+    for (local_version_part, github_version_part) in zip(local_version_parts[:-1], github_version_parts[:-1]):
+        if local_version_part != github_version_part:
+            logger.info(f"The latest GitHub release of `{url_stub}` ({release.version}) has a major change from the installed version ({local_version}), so a newer ISO is needed")
+            return None
+    asset = release.get_package_asset()
+    if asset is None:
+        logger.warning(f"No package was found in the latest GitHub release of `{url_stub}`")
+        return None
+    return (release.tag_name, asset)
+
+def get_compatible_release_assets(
+    release_client: GitHubReleaseClient,
+    packages: List[Tuple[str, str]],
+    get_local_version: Callable[[str], str],
+) -> List[Optional[Tuple[str, Dict[str, Any]]]]:
+    """
+    Look up the compatible newer GitHub releases of several packages at the same time (see `get_compatible_release_asset`)
+
+    Each lookup is a network round trip, so the time taken is that of the slowest lookup instead of the sum of all of them
+
+    Parameters
+    ----------
+    release_client: GitHubReleaseClient
+        The client to get the releases with
+    packages: List[Tuple[str, str]]
+        The packages, each as (package_name, url_stub)
+    get_local_version: Callable[[str], str]
+        Called with a package name to get its installed version without the pkgrel, or "" if it is not installed
+
+    Returns
+    -------
+    release_assets: List[Optional[Tuple[str, Dict[str, Any]]]]
+        The release tag and the package asset of each package, or None, in the same order as `packages`
+    """
+
+    if not packages:
+        return []
+
+    def get_release_asset(package: Tuple[str, str]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        (package_name, url_stub) = package
+        return get_compatible_release_asset(release_client, url_stub, get_local_version(package_name))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers= len(packages), thread_name_prefix= "GitHubCheck") as executor:
+        return list(executor.map(get_release_asset, packages))
@@ -0,0 +1,241 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import re
+import glob
+import hashlib
+import tempfile
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
+
+from .resource_bundle import ResourceBundle
+
+logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
+
+class IconCache:
+    """
+    Decode image files (like SVGs) once for each size and scale factor, and reuse the decoded surfaces
+
+    Setting an image from the cache is only a swap of the surface shown by the widget, instead of reading and rendering the file again. Images are rendered at the device pixel size, so they stay sharp on HiDPI screens.
+    If a cache directory is given, the rendered SVGs are also kept there as PNGs, so that they are not parsed again on the next start. A PNG is named after the modification time and the size of its SVG (or of the resource bundle that contains the SVG), so it is replaced when the SVG changes.
+    Meant to be used from the main loop only
+    """
+
+    def __init__(self, cache_directory_path: Optional[str] = None, resource_bundle: Optional[ResourceBundle] = None) -> None:
+        """
+        Parameters
+        ----------
+        cache_directory_path: Optional[str]
+            The directory to keep the rendered SVGs in. Nothing is kept on the disk if not given
+        resource_bundle: Optional[ResourceBundle]
+            The bundle to read the image files from, when they are in it. The image files are read from the disk if not given
+        """
+
+        self.cache_directory_path = None if cache_directory_path is None else Path(cache_directory_path).expanduser()
+        self.resource_bundle = resource_bundle
+        self._surfaces: Dict[Tuple[str, Optional[Tuple[int, int]], int], Any] = {}
+        self._natural_sizes: Dict[str, Tuple[int, int]] = {}
+        self._image_sources: Dict[Gtk.Image, Tuple[str, Optional[Tuple[int, int]]]] = {} # the file and size last set on each image widget
+
+    def get_natural_size(self, filepath: str) -> Tuple[int, int]:
+        """
+        Get the size of an image file in logical pixels
+
+        Parameters
+        ----------
+        filepath: str
+            The image file
+
+        Returns
+        -------
+        size: Tuple[int, int]
+            The width and the height
+        """
+
+        if filepath not in self._natural_sizes:
+            if self._is_bundled(filepath):
+                self._load_bundled_pixbuf(filepath, lambda width, height: (1, 1)) # the natural size is recorded before the image is rendered
+                return self._natural_sizes[filepath]
+            (_, width, height) = GdkPixbuf.Pixbuf.get_file_info(filepath)
+            self._natural_sizes[filepath] = (width, height)
+        return self._natural_sizes[filepath]
+
+    def get_surface(self, filepath: str, scale_factor: int = 1, size: Optional[Tuple[int, int]] = None) -> Any:
+        """
+        Get an image file rendered for a scale factor
+
+        Parameters
+        ----------
+        filepath: str
+            The image file
+        scale_factor: int
+            The scale factor of the widget that shows the image
+        size: Optional[Tuple[int, int]]
+            The width and height in logical pixels. The natural size of the image if not given
+
+        Returns
+        -------
+        surface: cairo.Surface
+            The rendered image
+        """
+
+        key = (filepath, size, scale_factor)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = Gdk.cairo_surface_create_from_pixbuf(self._load_pixbuf(filepath, scale_factor, size), scale_factor, None)
+            self._surfaces[key] = surface
+        return surface
+
+    def set_image(self, image: Gtk.Image, filepath: str, size: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Show an image file on an image widget, rendered for the widget's scale factor
+
+        The image is rendered again whenever the scale factor of the widget changes, from the file last set on it
+
+        Parameters
+        ----------
+        image: Gtk.Image
+            The image widget
+        filepath: str
+            The image file
+        size: Optional[Tuple[int, int]]
+            The width and height in logical pixels. The natural size of the image if not given
+        """
+
+        if image not in self._image_sources:
+            image.connect("notify::scale-factor", self._on_image_scale_factor_changed)
+        self._image_sources[image] = (filepath, size)
+        image.set_from_surface(self.get_surface(filepath, image.get_scale_factor(), size))
+
+    def _on_image_scale_factor_changed(self, image: Gtk.Image, _) -> None:
+        (filepath, size) = self._image_sources[image]
+        image.set_from_surface(self.get_surface(filepath, image.get_scale_factor(), size))
+
+    def _load_pixbuf(self, filepath: str, scale_factor: int, size: Optional[Tuple[int, int]]) -> GdkPixbuf.Pixbuf:
+        raster_filepath = self._get_raster_filepath(filepath, scale_factor, size)
+        if raster_filepath is not None:
+            try:
+                return GdkPixbuf.Pixbuf.new_from_file(str(raster_filepath))
+            except GLib.Error: # not rendered yet, or unreadable
+                pass
+
+        if self._is_bundled(filepath):
+            pixbuf = self._load_bundled_pixbuf(
+                filepath,
+                lambda width, height: ((size[0] if size is not None else width) * scale_factor, (size[1] if size is not None else height) * scale_factor)
+            ) # the natural size comes from the same parse that renders the image
+        else:
+            (width, height) = size if size is not None else self.get_natural_size(filepath)
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(filepath, width * scale_factor, height * scale_factor)
+        if raster_filepath is not None:
+            self._store_raster(pixbuf, raster_filepath)
+        return pixbuf
+
+    def _get_raster_filepath(self, filepath: str, scale_factor: int, size: Optional[Tuple[int, int]]) -> Optional[Path]:
+        if self.cache_directory_path is None or not filepath.lower().endswith(".svg"):
+            return None
+        try:
+            file_stat = self.resource_bundle.get_stat(filepath) if self.resource_bundle is not None else os.stat(filepath)
+        except OSError:
+            return None
+        source_id = hashlib.sha1(os.path.abspath(filepath).encode("utf-8")).hexdigest()[:16]
+        size_id = "natural" if size is None else f"{size[0]}x{size[1]}"
+        return self.cache_directory_path / f"{Path(filepath).stem}-{source_id}-{size_id}@{scale_factor}x-{file_stat.st_mtime_ns}-{file_stat.st_size}.png"
+
+    def _is_bundled(self, filepath: str) -> bool:
+        return self.resource_bundle is not None and self.resource_bundle.contains(filepath)
+
+    def _load_bundled_pixbuf(self, filepath: str, get_pixel_size: Callable[[int, int], Tuple[int, int]]) -> GdkPixbuf.Pixbuf:
+        loader = GdkPixbuf.PixbufLoader()
+
+        def on_size_prepared(loader: GdkPixbuf.PixbufLoader, width: int, height: int) -> None:
+            self._natural_sizes[filepath] = (width, height)
+            loader.set_size(*get_pixel_size(width, height))
+
+        loader.connect("size-prepared", on_size_prepared)
+        try:
+            loader.write_bytes(self.resource_bundle.read_bytes(filepath))
+        finally:
+            loader.close()
+        return loader.get_pixbuf()
+
+    def _store_raster(self, pixbuf: GdkPixbuf.Pixbuf, raster_filepath: Path) -> None:
+        try:
+            raster_filepath.parent.mkdir(parents= True, exist_ok= True)
+            # Remove the renderings of earlier versions of the SVG
+            (stale_prefix, _, _) = raster_filepath.name.rpartition("x-")
+            for stale_filepath in raster_filepath.parent.glob(glob.escape(stale_prefix) + "x-*.png"):
+                stale_filepath.unlink()
+            (file_descriptor, temporary_filepath) = tempfile.mkstemp(dir= str(raster_filepath.parent), suffix= ".tmp")
+            os.close(file_descriptor)
+            try:
+                pixbuf.savev(temporary_filepath, "png", [], [])
+                os.replace(temporary_filepath, raster_filepath) # atomic, so that a concurrent start never reads a partial file
+            except BaseException:
+                os.unlink(temporary_filepath)
+                raise
+        except (OSError, GLib.Error) as error:
+            logger.debug(f"Could not keep the rendering `{raster_filepath}`: {error}")
+
+    def extract_svg_images(self, form_text: str, form_directory_path: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """
+        Take the SVG images out of a glade form, so that Gtk.Builder does not render them, and they can be set from the cache instead with `set_image`
+
+        The file paths left in the form are made absolute (or "resource://" URIs, for the files in the resource bundle), since a form built from a string resolves them against the current directory instead of the directory of the form
+
+        Parameters
+        ----------
+        form_text: str
+            The contents of the glade file
+        form_directory_path: str
+            The directory of the glade file, relative to the project directory
+
+        Returns
+        -------
+        form_text: str
+            The contents of the glade file without the SVG images. Images without an ID are given one
+        images: List[Tuple[str, str]]
+            The ID of each image and its SVG file
+        """
+
+        images: List[Tuple[str, str]] = []
+        form_id = hashlib.sha1(form_text.encode("utf-8")).hexdigest()[:8] # IDs have to be unique across all the forms in a builder
+
+        def replace_image(match: "re.Match") -> str:
+            object_id = match.group("id")
+            if object_id is None:
+                object_id = "svg_image_" + form_id + "_" + str(len(images))
+            images.append((object_id, os.path.normpath(os.path.join(form_directory_path, match.group("filepath")))))
+            return f"<object class=\"GtkImage\" id=\"{object_id}\">" + match.group("properties_before") + match.group("properties_after")
+
+        form_text = _svg_image_pattern.sub(replace_image, form_text)
+        form_text = _relative_filepath_pattern.sub(
+            lambda match: ">" + self._get_form_filepath(os.path.normpath(os.path.join(form_directory_path, match.group("filepath")))) + "<",
+            form_text
+        )
+        return (form_text, images)
+
+    def _get_form_filepath(self, filepath: str) -> str:
+        if self.resource_bundle is not None:
+            return self.resource_bundle.get_uri(filepath)
+        return os.path.abspath(filepath)
+
+_svg_image_pattern = re.compile(
+    r"<object class=\"GtkImage\"(?: id=\"(?P<id>[^\"]*)\")?>"
+    r"(?P<properties_before>(?:(?!</object>).)*?)"
+    r"<property name=\"pixbuf\">(?P<filepath>[^<]*\.svg)</property>"
+    r"(?P<properties_after>(?:(?!</object>).)*?</object>)",
+    re.DOTALL
+)
+
+_relative_filepath_pattern = re.compile(r">(?P<filepath>(?:\.\./)+[^<>]*\.(?:svg|png))<")
@@ -0,0 +1,194 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import sys
+import time
+import math
+import bisect
+import threading
+import traceback
+import functools
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
+
+class _HandlerCall:
+    __slots__ = ("handler_name", "start_time", "finished", "stack")
+
+    def __init__(self, handler_name: str) -> None:
+        self.handler_name = handler_name
+        self.start_time = time.perf_counter()
+        self.finished = threading.Event()
+        self.stack: Optional[str] = None # where the main thread was when the call went over the frame budget
+
+class _HandlerStatistics:
+    __slots__ = ("no_of_calls", "total_duration", "max_duration", "no_of_slow_calls", "histogram")
+
+    def __init__(self, no_of_buckets: int) -> None:
+        self.no_of_calls = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.no_of_slow_calls = 0
+        self.histogram = [0] * no_of_buckets
+
+class JankDetector:
+    """
+    Time the event handlers called by the main loop, to find the ones that make the window hang
+
+    Each handler is wrapped with `wrap` (or all the handlers of an object with `wrap_handlers`). The durations of the calls are kept in a histogram per handler.
+    A call that holds the main loop for longer than a frame is logged as a warning, along with the stack of the main thread captured by a watchdog thread while the call was still running, which shows where it was stuck
+    """
+
+    histogram_bucket_upper_bounds_ms = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, math.inf)
+
+    def __init__(self, frame_budget_ms: float = 16) -> None:
+        """
+        Parameters
+        ----------
+        frame_budget_ms: float
+            The duration beyond which a handler call is reported
+        """
+
+        self.frame_budget_ms = frame_budget_ms
+        self._lock = threading.Lock()
+        self._statistics: Dict[str, _HandlerStatistics] = {}
+        self._current_call: Optional[_HandlerCall] = None # the outermost handler call being run
+        self._call_started = threading.Event()
+        self._main_thread_id = threading.main_thread().ident
+        threading.Thread(target= self._watch, name= "JankDetector", daemon= True).start()
+
+    def wrap(self, handler_name: str, handler: Callable) -> Callable:
+        """
+        Wrap a handler so that its calls are timed
+
+        Parameters
+        ----------
+        handler_name: str
+            The name to report the handler with
+        handler: Callable
+            The handler
+
+        Returns
+        -------
+        timed_handler: Callable
+            The handler, timed
+        """
+
+        @functools.wraps(handler)
+        def timed_handler(*arguments, **keyword_arguments):
+            call = _HandlerCall(handler_name)
+            with self._lock:
+                is_outermost_call = self._current_call is None # signals emitted by a handler call other handlers right away
+                if is_outermost_call:
+                    self._current_call = call
+                    self._call_started.set()
+            try:
+                return handler(*arguments, **keyword_arguments)
+            finally:
+                duration = time.perf_counter() - call.start_time
+                if is_outermost_call:
+                    call.finished.set()
+                    with self._lock:
+                        self._current_call = None
+                self._record(call, duration)
+
+        return timed_handler
+
+    def wrap_handlers(self, handler_object: Any) -> Any:
+        """
+        Get a stand-in for an object whose attributes are the timed versions of its methods, to be passed to `Gtk.Builder.connect_signals`
+
+        Parameters
+        ----------
+        handler_object: Any
+            The object with the handler methods
+
+        Returns
+        -------
+        timed_handler_object: Any
+            The stand-in
+        """
+
+        jank_detector = self
+
+        class TimedHandlers:
+            def __getattr__(self, name: str) -> Any:
+                attribute = getattr(handler_object, name)
+                if not callable(attribute):
+                    return attribute
+                return jank_detector.wrap(name, attribute)
+
+        return TimedHandlers()
+
+    def _record(self, call: _HandlerCall, duration: float) -> None:
+        duration_ms = duration * 1000
+        bucket_index = bisect.bisect_left(self.histogram_bucket_upper_bounds_ms, duration_ms)
+        with self._lock:
+            statistics = self._statistics.get(call.handler_name)
+            if statistics is None:
+                statistics = self._statistics[call.handler_name] = _HandlerStatistics(len(self.histogram_bucket_upper_bounds_ms))
+            statistics.no_of_calls += 1
+            statistics.total_duration += duration
+            statistics.max_duration = max(statistics.max_duration, duration)
+            statistics.histogram[bucket_index] += 1
+            if duration_ms > self.frame_budget_ms:
+                statistics.no_of_slow_calls += 1
+        if duration_ms > self.frame_budget_ms:
+            logger.warning(
+                "The handler `{:s}` held the main loop for {:.1f} ms (frame budget: {:.0f} ms)".format(call.handler_name, duration_ms, self.frame_budget_ms)
+                + ("" if call.stack is None else ". It was at:\n" + call.stack)
+            )
+
+    def _watch(self) -> None:
+        frame_budget_seconds = self.frame_budget_ms / 1000
+        while True:
+            self._call_started.wait()
+            with self._lock:
+                call = self._current_call
+                self._call_started.clear()
+            if call is None:
+                continue
+            if not call.finished.wait(max(0.0, frame_budget_seconds - (time.perf_counter() - call.start_time))):
+                frame = sys._current_frames().get(self._main_thread_id)
+                if frame is not None:
+                    call.stack = "".join(traceback.format_stack(frame))
+
+    def get_summary(self) -> str:
+        """
+        Summarize the handler calls so far, the slowest handlers first
+
+        Returns
+        -------
+        summary: str
+            A table of the handlers with their number of calls, total, mean and maximum durations, number of calls over the frame budget and histogram of durations
+        """
+
+        with self._lock:
+            statistics_items = [(handler_name, statistics) for (handler_name, statistics) in self._statistics.items()]
+            statistics_items.sort(key= lambda item: item[1].max_duration, reverse= True)
+            bucket_names = [("<=" + str(upper_bound)) if upper_bound != math.inf else (">" + str(self.histogram_bucket_upper_bounds_ms[-2])) for upper_bound in self.histogram_bucket_upper_bounds_ms]
+            lines: List[str] = [
+                "Main loop handler timings (frame budget: {:.0f} ms)".format(self.frame_budget_ms),
+                "{:<40s} {:>7s} {:>10s} {:>9s} {:>9s} {:>6s}  {:s}".format("handler", "calls", "total ms", "mean ms", "max ms", "slow", "histogram (ms: calls)"),
+            ]
+            for (handler_name, statistics) in statistics_items:
+                lines.append(
+                    "{:<40s} {:>7d} {:>10.1f} {:>9.2f} {:>9.1f} {:>6d}  {:s}".format(
+                        handler_name,
+                        statistics.no_of_calls,
+                        statistics.total_duration * 1000,
+                        statistics.total_duration * 1000 / statistics.no_of_calls,
+                        statistics.max_duration * 1000,
+                        statistics.no_of_slow_calls,
+                        " ".join([f"{bucket_name}: {count}" for (bucket_name, count) in zip(bucket_names, statistics.histogram) if count > 0])
+                    )
+                )
+        return "\n".join(lines)
@@ -12,15 +12,29 @@ import gi # Python GObject introspection module which contains Python bindings a
 gi.require_version('Gtk', '3.0') # make sure that the Gtk version is at the required level
 from gi.repository import Gtk, GLib, GdkPixbuf, Gdk # Gtk related modules for the graphical interface
 from argparse import Namespace
-from typing import List, Union, Tuple, Optional, Any
+from typing import Dict, List, Union, Tuple, Optional, Any
 from pathlib import Path
 import logging
 import functools
 import sys
+import contextlib
+import threading
+import time
+import concurrent.futures
 
 from pysetting import JSONConfiguration
 from pyrunning import LoggingHandler, LogMessage, Command, LoggingLevel, BatchJob, Function
 
+from .pacman_database import LocalPackageIndex, SyncDatabaseIndex, vercmp
+from .github_releases import GitHubReleaseClient, get_compatible_release_assets
+from .downloader import Downloader
+from .asset_cache import ReleaseAssetCache
+from .pacman_transaction import PacmanTransaction
+from .task_executor import TaskExecutor
+from .jank_detector import JankDetector
+from .icon_cache import IconCache
+from .resource_bundle import ResourceBundle
+
 logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
 
 # THE EVENT HANDLER
@@ -29,9 +43,7 @@ class Main:
     Specify how this particular Gtk container handles user interaction events. 
     The names of handler functions (also called `signals` in Gtk) can be assigned in `Glade` under "Signals
 
-    TODO
-    ----
-    - Splash screen before loading the pages and the main window, to avoid delay in getting some UI up for the user
+    The main window is shown with a splash page first, and the pages are added to it from idle callbacks, to avoid delay in getting some UI up for the user
 
     """
 
@@ -47,7 +59,12 @@ class Main:
         None: "#808080"
     }
 
-    def __init__(self, commandline_arguments: Namespace, application_settings: JSONConfiguration) -> None:
+    jank_frame_budget_ms: float = 16 # handler calls longer than this are reported by `--detect-jank`
+    package_check_max_workers: int = 4 # the number of package checks that can run at the same time
+    console_frame_interval_ms: int = 16 # how often queued console lines are inserted into the console
+    console_trim_chunk_lines: int = 500 # old console lines are removed in chunks of at least this many lines, to avoid trimming on every insert
+
+    def __init__(self, commandline_arguments: Namespace, application_settings: JSONConfiguration, startup_profiler: Optional[Any] = None) -> None:
         """
         Initialize the main window in Gtk
 
@@ -55,6 +72,10 @@ class Main:
         ----------
         commandline_arguments: Namespace
             Contains the command line arguments
+        application_settings: JSONConfiguration
+            The settings of the application
+        startup_profiler: Optional[Any]
+            The `StartupProfiler` from the main script which records the time taken by the startup phases, if startup profiling is enabled
         """
         self.is_iso = False
         self.initialized = False
@@ -62,6 +83,41 @@ class Main:
         self.expander_previous_height=-1
 
         self.commandline_arguments = commandline_arguments
+        self.startup_profiler = startup_profiler
+        self.jank_detector: Optional[JankDetector] = JankDetector(frame_budget_ms= self.jank_frame_budget_ms) if commandline_arguments.detect_jank else None # times the signal handlers
+        self.local_package_index = LocalPackageIndex() # answers install-state queries without running `pacman -Q`
+        self.sync_database_index = SyncDatabaseIndex() # answers available-version queries without running `pacman -Ss`
+        self.last_sync_database_refresh_time: Optional[float] = None # when this application last ran `pacman -Sy`
+
+        self.console_lock = threading.Lock() # guards the queued console lines, which are added from the logging thread
+        self.console_pending_lines: List[str] = [] # markup of the console lines waiting to be inserted
+        self.console_drain_scheduled = False
+        self.console_rendered_lines = 0
+        self.console_rendered_batches = 0
+        self.console_statistics_start_time = time.perf_counter()
+
+        self.status_lock = threading.Lock() # guards the latest status message, which is set from the logging thread
+        self.status_pending_message: Optional[str] = None
+        self.status_update_scheduled = False
+
+        self.resource_bundle = ResourceBundle(
+            os.path.join("user_interface", commandline_arguments.user_interface, "rebornos-welcome.gresource")
+        ) # the glade forms, the CSS and the media are read from one memory-mapped file when it has been built by packaging
+        self.icon_cache = IconCache(
+            cache_directory_path= os.path.join(
+                GLib.get_user_cache_dir(),
+                "rebornos-iso-welcome" if commandline_arguments.iso else "rebornos-welcome",
+                "rendered_images"
+            ),
+            resource_bundle= self.resource_bundle
+        ) # the SVGs are rendered once per scale factor, and kept on the disk as PNGs for the next start
+        self.busy_lock = threading.Lock() # guards the number of running jobs, which is changed from job threads
+        self.no_of_busy_jobs = 0
+        self.task_executor = TaskExecutor(
+            max_workers= 1, # one at a time, so that settings changed in quick succession are applied in order
+            on_busy= self.display_busy,
+            on_ready= self.display_ready,
+        ) # runs the blocking work of event handlers off the main loop
 
         self.logging_handler = LoggingHandler(
             logger=logger,
@@ -71,10 +127,14 @@ class Main:
             ]
         )
         self.application_settings: JSONConfiguration = application_settings
+        self.console_max_lines: int = self.settings_safe_get("console_max_lines", 5000) # the full history is kept only in the log file
+        self.status_update_interval_ms: int = self.settings_safe_get("status_update_interval_ms", 16) # the status label is updated at most once per this interval
+        self.sync_database_freshness_seconds: float = self.settings_safe_get("sync_database_freshness_seconds", 300) # `pacman -Sy` is skipped if the sync databases were refreshed within this time
 
         LogMessage.Info("Loading CSS styles...").write(self.logging_handler)
         provider = Gtk.CssProvider()
-        provider.load_from_path("user_interface/gtk/forms/style.css")
+        with self.profile_phase("css_load"):
+            self.resource_bundle.load_css(provider, "user_interface/gtk/forms/style.css")
         Gtk.StyleContext.add_provider_for_screen(
             Gdk.Screen.get_default(),
             provider,
@@ -83,15 +143,11 @@ class Main:
 
         LogMessage.Info("Creating a Gtk Builder and importing the UI from glade files...").write(self.logging_handler)
         self.builder = Gtk.Builder()
-        self.builder.add_from_file( # extract the main form from the glade file
-            os.path.join(
-                "user_interface",
-                commandline_arguments.user_interface,
-                "forms",
-                "main.glade"
-            )
-        ) 
-        self.builder.connect_signals(self) # connect the signals from the Gtk forms to our event handlers (which are all defined in a class)
+        self.loaded_forms: dict = {} # names of the glade fragments that have already been built
+        self.page_placeholders: dict = {} # empty boxes standing in for the pages in `page_stack` until they are first shown
+        self.pending_pages: List[Tuple[str, str]] = [] # (name, title) of the pages yet to be added to `page_stack`
+        self.application_icon_path = "media/icons/rebornos_welcome_logo.svg"
+        self.load_form("main") # extract only the main window from the glade files. The pages and dialogs are built when they are first shown
         
         self.builder.get_object("main_window").set_title("Welcome to RebornOS!") 
 
@@ -107,10 +163,7 @@ class Main:
 
         self.builder.get_object("green_light").set_visible(True)
         self.builder.get_object("red_light").set_visible(True)
-        
-        self.builder.get_object("show_installinfo_again").set_active(self.settings_safe_get("show_install_info", True))
-
-        page_stack = self.builder.get_object("page_stack")
+        self.on_status_lights_update() # the lights are drawn from the icon cache, at the scale factor of the screen
 
         if commandline_arguments.iso:
             self.is_iso = True
@@ -119,19 +172,8 @@ class Main:
             self.builder.get_object("main_window").resize(1,1) # resize the window to fit contents
 
             self.show_update_toggle = self.settings_safe_get("show_update_toggle", True)            
-            if not self.show_update_toggle:
-                self.builder.get_object("installer_update_switch_box").hide()
-                LogMessage.Info("Update toggle is hidden...").write(self.logging_handler)
-
             self.show_git_toggle = self.settings_safe_get("show_git_toggle", True)            
-            if not self.show_git_toggle:
-                self.builder.get_object("git_switch_box").hide()
-                LogMessage.Info("Git toggle is hidden...").write(self.logging_handler)  
-
             self.use_github_toggle = self.settings_safe_get("show_from_github_toggle", True)            
-            if not self.use_github_toggle:
-                self.builder.get_object("use_github_switch_box").hide()
-                LogMessage.Info("\"from GitHub\" toggle is hidden...").write(self.logging_handler)                     
 
             self.installer_package_name_stub = self.settings_safe_get("installer_package_name_stub", "calamares-core")
             LogMessage.Info(f"Set to detect installer package name {self.installer_package_name_stub}...").write(self.logging_handler)
@@ -140,60 +182,196 @@ class Main:
 
             self.installer_github_url_stub = self.settings_safe_get("installer_github_url_stub", "rebornos-team/calamares-core")
             self.installer_config_github_url_stub = self.settings_safe_get("installer_config_github_url_stub", "rebornos-team/calamares-configuration")
-
-            LogMessage.Info("Loading the 'Install' tab...").write(self.logging_handler)
-            install_page = self.builder.get_object("install_page")
-            page_stack.add_titled(
-                child = install_page,
-                name = "install_page",
-                title = "Install"
+            self.release_asset_cache = ReleaseAssetCache(
+                cache_directory_path= str(Path.home() / ".rebornos-iso-welcome" / "cache" / "release_assets"),
+                max_size_bytes= self.settings_safe_get("release_asset_cache_max_size_mb", 256) * 1024 * 1024,
             )
+            self.github_release_client = GitHubReleaseClient(
+                cache_directory_path= str(Path.home() / ".rebornos-iso-welcome" / "cache" / "github_releases"),
+                cache_ttl_seconds= self.settings_safe_get("github_release_cache_ttl_seconds", 300),
+                timeout_seconds= self.settings_safe_get("github_request_timeout_seconds", 10),
+            )
+
+            self.pending_pages.append(("install_page", "Install"))
 
             self.builder.get_object("startup_toggle").hide()
             self.builder.get_object("startup_toggle_text").hide()
 
-            rebornos_iso_welcome_icon_path = "media/icons/rebornos_iso_welcome_logo.svg"
-            self.builder.get_object("main_window").set_icon_from_file(rebornos_iso_welcome_icon_path)
-            about_dialog = self.builder.get_object("about")
-            about_dialog.set_icon_from_file(rebornos_iso_welcome_icon_path)
-            about_dialog.set_title("About RebornOS ISO Welcome Application")
+            self.application_icon_path = "media/icons/rebornos_iso_welcome_logo.svg"
+            self.builder.get_object("main_window").set_icon(self.resource_bundle.load_pixbuf(self.application_icon_path))
 
-            self.builder.get_object("internet_check").set_active(self.settings_safe_get("internet_check_toggled", True))
-            self.builder.get_object("memory_check").set_active(self.settings_safe_get("memory_check_toggled", True))
-            self.builder.get_object("storage_check").set_active(self.settings_safe_get("storage_check_toggled", True))
-            self.builder.get_object("isp_dns_radio_button").set_active(self.settings_safe_get("isp_dns_toggled", True))
-            self.builder.get_object("cloudflare_dns_radio_button").set_active(self.settings_safe_get("cloudflare_dns_toggled", False))
-            self.builder.get_object("google_dns_radio_button").set_active(self.settings_safe_get("google_dns_toggled", False))
+        self.pending_pages.append(("links_page", "Links"))
+        self.pending_pages.append(("utilities_page", "Utilities"))
 
-            self.builder.get_object("about_application_name").set_label("RebornOS ISO Welcome Application")
-            self.builder.get_object("about_logo").set_from_file(rebornos_iso_welcome_icon_path)
-        else:            
-            self.builder.get_object("about").set_title("About RebornOS Welcome Application")
-
-        LogMessage.Info("Loading the 'Links' tab...").write(self.logging_handler)
-        links_page = self.builder.get_object("links_page")
-        page_stack.add_titled(
-            child = links_page,
-            name = "links_page",
-            title = "Links"
-        )
+        LogMessage.Info("Displaying the main window with the splash page...").write(self.logging_handler)
+        self.builder.get_object("main_window").resize(1,1) # resize the window to fit contents
+        with self.profile_phase("first_show"):
+            self.builder.get_object("main_window").show() # get the main form object and make it visible 
 
-        LogMessage.Info("Loading the 'Utilities' tab...").write(self.logging_handler)
-        utilities_page = self.builder.get_object("utilities_page")        
-        page_stack.add_titled(
-            child = utilities_page,
-            name = "utilities_page",
-            title = "Utilities"
+        GLib.idle_add(self.on_idle_load_next_page) # add the pages one per main loop iteration once the window has been drawn
+
+        LogMessage.Info("Starting the event loop...").write(self.logging_handler)
+        Gtk.main() # start the GUI event loop
+
+    def load_form(self, form_name: str) -> Any:
+        """
+        Build the widgets of a glade fragment, if they have not already been built
+
+        Each fragment `user_interface/<ui_toolkit>/forms/<form_name>.glade` contains one top-level object with the same name as the fragment (except `main`, which contains `main_window`).
+        A method named `setup_<form_name>`, if present, is called after the widgets are built and before the signals are connected, so that the initial values set on the widgets do not trigger the handlers.
+
+        Parameters
+        ----------
+        form_name: str
+            The name of the glade fragment, without the extension
+
+        Returns
+        -------
+        form: Any
+            The top-level object of the glade fragment
+        """
+
+        if form_name not in self.loaded_forms:
+            LogMessage.Debug("Building the widgets from `" + form_name + ".glade`...").write(self.logging_handler)
+            form_directory_path = os.path.join(
+                "user_interface",
+                self.commandline_arguments.user_interface,
+                "forms"
+            )
+            with self.profile_phase("gtk_builder_parse (" + form_name + ")"):
+                # The SVG images are set from the icon cache instead of being rendered by the builder
+                (form_text, svg_images) = self.icon_cache.extract_svg_images(
+                    self.resource_bundle.read_text(os.path.join(form_directory_path, form_name + ".glade")),
+                    form_directory_path
+                )
+                self.builder.add_from_string(form_text)
+            with self.profile_phase("set_images (" + form_name + ")"):
+                for (image_id, svg_filepath) in svg_images:
+                    self.icon_cache.set_image(self.builder.get_object(image_id), svg_filepath) # also re-rendered by the cache when the scale factor changes
+            setup_function = getattr(self, "setup_" + form_name, None)
+            if setup_function is not None:
+                setup_function()
+            with self.profile_phase("connect_signals (" + form_name + ")"):
+                self.builder.connect_signals(
+                    self if self.jank_detector is None else self.jank_detector.wrap_handlers(self)
+                ) # connect the signals from the newly built widgets to our event handlers (signals of widgets built earlier are not connected again)
+            self.loaded_forms[form_name] = True
+        if form_name == "main":
+            return self.builder.get_object("main_window")
+        return self.builder.get_object(form_name)
+
+    def add_page(self, page_name: str, title: str) -> None:
+        """
+        Add an empty placeholder for a page to `page_stack`. The page itself is built the first time it is shown
+
+        Parameters
+        ----------
+        page_name: str
+            The name of the page, which is also the name of its glade fragment
+        title: str
+            The title displayed on the stack switcher
+        """
+
+        LogMessage.Info("Adding the '" + title + "' tab...").write(self.logging_handler)
+        placeholder = Gtk.Box(orientation= Gtk.Orientation.VERTICAL)
+        placeholder.show()
+        self.page_placeholders[page_name] = placeholder
+        self.builder.get_object("page_stack").add_titled(
+            child = placeholder,
+            name = page_name,
+            title = title
         )
 
-        LogMessage.Info("Displaying the main window...").write(self.logging_handler)
+    def on_idle_load_next_page(self) -> bool:
+        """
+        Add the next pending page to `page_stack`. Once all pages are added, replace the splash page with the first page
+
+        Called from `GLib.idle_add`, so that the main loop can draw the window and handle events between pages
+
+        Returns
+        -------
+        call_again: bool
+            True if the callback should be called again on the next idle iteration
+        """
+
+        if self.pending_pages:
+            (page_name, title) = self.pending_pages.pop(0)
+            self.add_page(page_name, title)
+            return True
+
+        page_stack = self.builder.get_object("page_stack")
+        first_page_name = next(iter(self.page_placeholders))
+        page_stack.set_visible_child_name(first_page_name) # builds the first page
+        page_stack.remove(self.builder.get_object("splash_page"))
         self.builder.get_object("main_window").resize(1,1) # resize the window to fit contents
-        self.builder.get_object("main_window").show() # get the main form object and make it visible 
 
-        self.initialized = True 
+        self.initialized = True
+        LogMessage.Info("Finished loading the pages...").write(self.logging_handler)
 
-        LogMessage.Info("Starting the event loop...").write(self.logging_handler)
-        Gtk.main() # start the GUI event loop
+        if self.startup_profiler is not None:
+            try:
+                LogMessage.Info(self.startup_profiler.report(self.application_settings["log_directory"])).write(self.logging_handler)
+            except Exception as error:
+                LogMessage.Warning("Could not write the startup profile: " + str(error)).write(self.logging_handler)
+            self.startup_profiler = None # stop profiling the forms built later on demand
+        return False
+
+    def profile_phase(self, phase_name: str):
+        """
+        Time the enclosed block as a startup phase, if startup profiling is enabled
+
+        Parameters
+        ----------
+        phase_name: str
+            The name of the phase
+
+        Returns
+        -------
+        context_manager
+            A context manager to be used in a `with` statement
+        """
+
+        if self.startup_profiler is None:
+            return contextlib.nullcontext()
+        return self.startup_profiler.phase(phase_name)
+
+    def on_page_stack_visible_child_changed(self, page_stack, _):
+        page_name = page_stack.get_visible_child_name()
+        if page_name is None or page_name in self.loaded_forms or page_name not in self.page_placeholders:
+            return
+        LogMessage.Info("Loading the '" + page_name + "' tab...").write(self.logging_handler)
+        self.page_placeholders[page_name].pack_start(self.load_form(page_name), True, True, 0)
+
+    def setup_install_page(self) -> None:
+        if not self.show_update_toggle:
+            self.builder.get_object("installer_update_switch_box").hide()
+            LogMessage.Info("Update toggle is hidden...").write(self.logging_handler)
+        if not self.show_git_toggle:
+            self.builder.get_object("git_switch_box").hide()
+            LogMessage.Info("Git toggle is hidden...").write(self.logging_handler)  
+        if not self.use_github_toggle:
+            self.builder.get_object("use_github_switch_box").hide()
+            LogMessage.Info("\"from GitHub\" toggle is hidden...").write(self.logging_handler)                     
+
+        self.builder.get_object("internet_check").set_active(self.settings_safe_get("internet_check_toggled", True))
+        self.builder.get_object("memory_check").set_active(self.settings_safe_get("memory_check_toggled", True))
+        self.builder.get_object("storage_check").set_active(self.settings_safe_get("storage_check_toggled", True))
+        self.builder.get_object("isp_dns_radio_button").set_active(self.settings_safe_get("isp_dns_toggled", True))
+        self.builder.get_object("cloudflare_dns_radio_button").set_active(self.settings_safe_get("cloudflare_dns_toggled", False))
+        self.builder.get_object("google_dns_radio_button").set_active(self.settings_safe_get("google_dns_toggled", False))
+
+    def setup_about(self) -> None:
+        about_dialog = self.builder.get_object("about")
+        if self.is_iso:
+            about_dialog.set_icon(self.resource_bundle.load_pixbuf(self.application_icon_path))
+            about_dialog.set_title("About RebornOS ISO Welcome Application")
+            self.builder.get_object("about_application_name").set_label("RebornOS ISO Welcome Application")
+            self.icon_cache.set_image(self.builder.get_object("about_logo"), self.application_icon_path)
+        else:
+            about_dialog.set_title("About RebornOS Welcome Application")
+
+    def setup_installinfo(self) -> None:
+        self.builder.get_object("show_installinfo_again").set_active(self.settings_safe_get("show_install_info", True))
 
     def settings_safe_get(self, key: str, default_value: Any) -> Any :
         try:
@@ -223,7 +401,25 @@ class Main:
         self,
         package_name: Union[str, List[str]]
     ):
-        package_lookup_command = None
+        if self.local_package_index.is_available():
+            package_names: List[str] = []
+            if type(package_name) == str:
+                package_names = [package_name]
+            elif type(package_name) == list:
+                package_names = package_name
+            else:
+                LogMessage.Warning("Wrong package_name format: " + str(package_name)).write(logging_handler=self.logging_handler)
+                return True
+            LogMessage.Debug("Checking if missing: " + str(package_name)).write(logging_handler=self.logging_handler)
+            missing_package_names = [name for name in package_names if not self.local_package_index.is_installed(name)]
+            if not missing_package_names:
+                LogMessage.Info("Package(s) found installed: " + str(package_name)).write(logging_handler=self.logging_handler)
+                return False
+            else:
+                LogMessage.Debug("Package(s) not found installed: " + str(missing_package_names)).write(logging_handler=self.logging_handler)
+                return True
+
+        package_lookup_command = None # fall back to asking pacman when the local database cannot be read directly
         if type(package_name) == str: 
             package_lookup_command = Command(
                 [
@@ -300,7 +496,99 @@ class Main:
             batch_job += run_entity
             return batch_job
 
+    def compare_versions(self, version_1: str, version_2: str) -> int:
+        """
+        Compare two package versions like `vercmp`
+
+        Returns
+        -------
+        comparison: int
+            Negative if version_1 is older, 0 if they are the same, and positive if version_1 is newer
+        """
+
+        return vercmp(version_1, version_2)
+
+    def get_old_packages(self, package_names: List[str]) -> List[str]:
+        """
+        Returns the packages in the list that are either not installed, or older than the version in the sync databases, in the same order
+
+        Parameters
+        ----------
+        package_names: List[str]
+            The names of the packages to check
+
+        Returns
+        -------
+        old_package_names: List[str]
+            The names of the packages that need to be installed or updated
+        """
+
+        if not (self.local_package_index.is_available() and self.sync_database_index.is_available()):
+            return self.filter_concurrently(self.is_package_old_according_to_pacman, package_names)
+
+        old_package_names: List[str] = []
+        for package_name in package_names:
+            local_version = self.local_package_index.get_version(package_name)
+            sync_version = self.sync_database_index.get_version(package_name)
+            if local_version is None:
+                old_package_names.append(package_name) # not installed
+            elif sync_version is not None:
+                try:
+                    if self.compare_versions(local_version, sync_version) < 0:
+                        old_package_names.append(package_name)
+                except Exception:
+                    old_package_names.append(package_name)
+        return old_package_names
+
+    def filter_concurrently(self, predicate, items: List[Any]) -> List[Any]:
+        """
+        Filter a list with a predicate that may block (for example on a subprocess), running the checks on a bounded pool of worker threads
+
+        The time taken by each check and by the whole filter are logged
+
+        Parameters
+        ----------
+        predicate: Callable[[Any], bool]
+            The check to be run on each item
+        items: List[Any]
+            The items to be filtered
+
+        Returns
+        -------
+        filtered_items: List[Any]
+            The items for which the predicate is true, in the same order as in the input
+        """
+
+        if not items:
+            return []
+
+        def timed_predicate(item: Any) -> Tuple[bool, float]:
+            start_time = time.perf_counter()
+            result = predicate(item)
+            elapsed_time = time.perf_counter() - start_time
+            LogMessage.Debug("Checked `" + str(item) + "` in {:.1f} ms".format(elapsed_time * 1000)).write(logging_handler=self.logging_handler)
+            return (result, elapsed_time)
+
+        start_time = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers= min(self.package_check_max_workers, len(items)),
+            thread_name_prefix= "PackageCheck"
+        ) as executor:
+            results = list(executor.map(timed_predicate, items)) # `map` keeps the input order
+        elapsed_time = time.perf_counter() - start_time
+        LogMessage.Debug(
+            "Checked {:d} item(s) in {:.1f} ms (the checks took {:.1f} ms in total)".format(
+                len(items),
+                elapsed_time * 1000,
+                sum([check_time for (_, check_time) in results]) * 1000
+            )
+        ).write(logging_handler=self.logging_handler)
+        return [item for (item, (result, _)) in zip(items, results) if result]
+
     def is_package_old(self, single_package_name: str) -> bool:
+        return bool(self.get_old_packages([single_package_name]))
+
+    def is_package_old_according_to_pacman(self, single_package_name: str) -> bool:
         version_check_command = Command.Shell(
             f"vercmp \"$(pacman -Q {single_package_name} | cut -d \' \'  -f 2)\" \"$(pacman -Ss {single_package_name} | head -n 1 | cut -d \' \'  -f 2)\""
         )
@@ -313,28 +601,27 @@ class Main:
         except:
             return True # For when the package is not found
 
-    def is_new_github_package_available(self, single_package_name: str, url_stub: str) -> Tuple[bool, str, str]:
-        import requests        
+    def get_local_package_version(self, single_package_name: str) -> str:
+        """
+        Get the installed version of a package without the pkgrel, or "" if it is not installed
+        """
 
-        local_version = Command.Shell(
+        if self.local_package_index.is_available():
+            return (self.local_package_index.get_version(single_package_name) or "").split("-")[0] # without the pkgrel
+        return Command.Shell(
             f"pacman -Q {single_package_name} | cut -d \' \'  -f 2 | cut -d \'-\'  -f 1"
         ).run_and_wait().strip()
 
-        github_version = ""
-        try:
-            github_version = requests.get(f'https://api.github.com/repos/{url_stub}/releases/latest').json()["tag_name"];
-        except: 
-            return (False, local_version, github_version)
-        if github_version[0] == 'v':
-            github_version = github_version[1:].strip()
-        
-        version_check_command = Command.Shell(
-            f"vercmp {local_version} {github_version}"
-        )
+    def is_new_github_package_available(self, single_package_name: str, url_stub: str) -> Tuple[bool, str, str]:
+        local_version = self.get_local_package_version(single_package_name)
 
+        release = self.github_release_client.get_latest_release(url_stub)
+        if release is None:
+            return (False, local_version, "")
+        github_version = release.version
+        
         try:
-            version_check_command_output = version_check_command.run_and_wait().strip()
-            if int(version_check_command_output) < 0:
+            if self.compare_versions(local_version, github_version) < 0:
                 return (True, local_version, github_version)
             else:
                 return (False, local_version, github_version)
@@ -346,9 +633,7 @@ class Main:
         package_names: Union[str, List[str]]
     ) -> Union[str, List[str]]:
         if type(package_names) == list:
-            old_package_names = list(
-                filter(self.is_package_old, package_names)
-            )
+            old_package_names = self.get_old_packages(package_names)
             return old_package_names
         elif type(package_names) == str:
             if self.is_package_old(str(package_names)):
@@ -364,16 +649,22 @@ class Main:
         post_install_command: Optional[Union[str, List[str]]] = None,
         update: bool= False,
         batch_job: BatchJob | None = None,
+        transaction: Optional[PacmanTransaction] = None,
     ) -> BatchJob | None:
         import subprocess
         import shlex
 
+        refresh = False
         if update:          
             LogMessage.Debug("Checking if newer versions exist for: " + str(package_name)).write(logging_handler=self.logging_handler)
-            if self.is_iso:
-                Command.Shell("pkexec rm /var/lib/pacman/db.lck").run_log_and_wait(self.logging_handler)
-            Command(["pkexec", "pacman", "-Sy"]).run_log_and_wait(self.logging_handler)
-            package_name = self.filter_old_packages(package_name)
+            if transaction is None:
+                self.refresh_sync_databases_if_stale(remove_database_lock= self.is_iso)
+                package_name = self.filter_old_packages(package_name)
+            elif self.are_sync_databases_fresh():
+                package_name = self.filter_old_packages(package_name)
+            else:
+                # Refreshing now would need an authentication prompt of its own, so the refresh is left to the transaction. `--needed` skips only the packages whose installed version is the same as in the repository, so the transaction leaves out the packages it installs from files
+                refresh = True
             LogMessage.Debug("Package(s) which need updates: " + str(package_name)).write(logging_handler=self.logging_handler)
 
             package_name_joined: str = ""
@@ -396,7 +687,7 @@ class Main:
                 [
                     "pkexec",
                     "pacman",
-                    "-Sy",
+                    "-S", # the sync databases were refreshed above, if needed
                     "--needed",
                     "--noconfirm" ,
                     *shlex.split(package_name_joined),
@@ -426,6 +717,12 @@ class Main:
                 ]
             )
 
+        if transaction is not None:
+            transaction.sync(shlex.split(package_name_joined), refresh= refresh)
+            if post_install_command is not None:
+                transaction.add_post_transaction_command(post_install_command)
+            return batch_job
+
         if batch_job is None:
             install_message.write(logging_handler=self.logging_handler)
             install_command.run_log_and_wait(self.logging_handler)
@@ -446,32 +743,79 @@ class Main:
                     batch_job += Command.Shell(post_install_command)
             return batch_job
 
+    def are_sync_databases_fresh(self) -> bool:
+        """
+        Check if the sync databases were refreshed within `sync_database_freshness_seconds`
+
+        Returns
+        -------
+        fresh: bool
+            Whether the sync databases need not be refreshed again
+        """
+
+        last_refresh_times = [
+            last_refresh_time
+            for last_refresh_time in [self.last_sync_database_refresh_time, self.sync_database_index.get_last_refresh_time()]
+            if last_refresh_time is not None
+        ]
+        if not last_refresh_times:
+            return False
+        return (time.time() - max(last_refresh_times)) < self.sync_database_freshness_seconds
+
+    def refresh_sync_databases_if_stale(self, remove_database_lock: bool = False) -> None:
+        """
+        Refresh the sync databases with `pacman -Sy`, unless they were refreshed recently
+
+        Blocks until the refresh is done
+
+        Parameters
+        ----------
+        remove_database_lock: bool
+            Whether to remove a stale pacman database lock before refreshing, like on the live ISO
+        """
+
+        if self.are_sync_databases_fresh():
+            LogMessage.Debug("Not refreshing the package databases since they were refreshed recently...").write(logging_handler=self.logging_handler)
+            return
+        if remove_database_lock:
+            Command.Shell("pkexec rm /var/lib/pacman/db.lck").run_log_and_wait(self.logging_handler)
+        refresh_command = Command(["pkexec", "pacman", "-Sy"])
+        refresh_command.run_log_and_wait(self.logging_handler)
+        if refresh_command.return_code != 0: # failed, or the authentication was cancelled
+            LogMessage.Warning("Could not refresh the package databases...").write(logging_handler=self.logging_handler)
+            return
+        # pacman does not rewrite databases that did not change on the mirror, so the time of the refresh is remembered as well
+        self.last_sync_database_refresh_time = time.time()
+
     def uninstall_package(
         self,
         package_name: Union[str, List[str]],
         batch_job: BatchJob | None = None,
+        transaction: Optional[PacmanTransaction] = None,
     ) -> BatchJob | None:
         import subprocess
         import shlex
 
         package_name_joined: str = ""
         if type(package_name) == list:
-            filtered_package_list = list(
-                filter(
-                    lambda p: not self.is_any_package_missing(p),
-                    package_name
-                )
+            filtered_package_list = self.filter_concurrently(
+                lambda p: not self.is_any_package_missing(p),
+                package_name
             )
             if not filtered_package_list:
-                return
+                return batch_job
             package_name_joined = ' '.join(filtered_package_list)
         elif type(package_name) == str:
             if self.is_any_package_missing(package_name):
-                return None
+                return batch_job
             package_name_joined = str(package_name)
         else:
             package_name_joined = str(package_name)
 
+        if transaction is not None:
+            transaction.remove(shlex.split(package_name_joined))
+            return batch_job
+
         uninstall_message = LogMessage.Info("Trying to uninstall: `" + str(package_name) + "`...")
 
         # uninstall_command = Command.Shell(
@@ -513,20 +857,28 @@ class Main:
                     self.display_ready
                 ),
             )
-        if update or self.is_any_package_missing(package_name): 
-            batch_job = self.install_package(
-                package_name= package_name,
-                post_install_command= post_install_command,
-                update= update,
+
+        def install_and_launch(batch_job: BatchJob) -> None:
+            if update or self.is_any_package_missing(package_name): 
+                batch_job = self.install_package(
+                    package_name= package_name,
+                    post_install_command= post_install_command,
+                    update= update,
+                    batch_job= batch_job
+                )
+            batch_job = self.run_executable(
+                executable_name= executable_name,
+                detached= detached,
                 batch_job= batch_job
             )
-        batch_job = self.run_executable(
-            executable_name= executable_name,
-            detached= detached,
-            batch_job= batch_job
-        )
-        if batch_job is not None:
-            batch_job.start()
+            if batch_job is not None:
+                batch_job.start()
+
+        if update:
+            # Removing the database lock, refreshing the databases and looking for newer versions block, so they are done on a worker thread
+            self.task_executor.submit(install_and_launch, batch_job, on_error= self.on_batch_job_planning_error)
+        else:
+            install_and_launch(batch_job)
 
     def log_console(
         self,
@@ -545,59 +897,94 @@ class Main:
 
         logging_level_name = LoggingLevel(logging_level).name
 
-        # Needed because Gtk doesn't prefer adding stuff on a different thread
-        GLib.idle_add(
-            lambda: ( # A temporary nameless function handle to make sure that console_buffer.get_end_iter() is valid by calling it right when the insert() method is called. They are both grouped together. Using GLib.idle_add directly was somehow invalidating get_end_iter(), resulting in runtime errors, which are now fixed
-                self.console_buffer.insert_markup(
-                    self.console_buffer.get_end_iter(),
-                    "".join(
-                        (
-                            "- ",
-                            "<span color=\"{:s}\">",
-                            logging_level_name.rjust(8, " "),
-                            ": ",
-                            "</span>"
-                        )
-                    ).format(self.log_color[logging_level_name]),
-                    -1
-                )
-            )
-        ) 
-
         if LoggingLevel(logging_level) != LoggingLevel.DEBUG:
-            # Needed because Gtk doesn't prefer adding stuff on a different thread
-            GLib.idle_add(
-                lambda: ( # A temporary nameless function handle to make sure that console_buffer.get_end_iter() is valid by calling it right when the insert() method is called. They are both grouped together. Using GLib.idle_add directly was somehow invalidating get_end_iter(), resulting in runtime errors, which are now fixed
-                    self.console_buffer.insert(
-                        self.console_buffer.get_end_iter(),
-                        "".join(
-                            (
-                                message,
-                                # "(", loginfo_filename, " > ", loginfo_function_name, "; ", "Line ", str(loginfo_line_number), ")"
-                                "\n"
-                            )
-                        )
-                    )
-                )
-            )
+            message_markup = GLib.markup_escape_text(message)
         else:
-            GLib.idle_add(
-                lambda: ( # A temporary nameless function handle to make sure that console_buffer.get_end_iter() is valid by calling it right when the insert() method is called. They are both grouped together. Using GLib.idle_add directly was somehow invalidating get_end_iter(), resulting in runtime errors, which are now fixed
-                    self.console_buffer.insert_markup(
-                        self.console_buffer.get_end_iter(),
-                        "".join(
-                            (
-                                "<span color=\"{:s}\">",
-                                GLib.markup_escape_text(message),                                
-                                # "(", loginfo_filename, " > ", loginfo_function_name, "; ", "Line ", str(loginfo_line_number), ")"
-                                "</span>"
-                                "\n",                                
-                            )
-                        ).format(self.log_color[logging_level_name]),
-                        -1,
+            message_markup = "<span color=\"{:s}\">{:s}</span>".format(self.log_color[logging_level_name], GLib.markup_escape_text(message))
+        line_markup = "".join(
+            (
+                "- ",
+                "<span color=\"{:s}\">".format(self.log_color[logging_level_name]),
+                logging_level_name.rjust(8, " "),
+                ": ",
+                "</span>",
+                message_markup,
+                # "(", loginfo_filename, " > ", loginfo_function_name, "; ", "Line ", str(loginfo_line_number), ")"
+                "\n",
+            )
+        )
+
+        # Gtk doesn't prefer adding stuff on a different thread, so queue the line and let the main loop insert all queued lines once per frame
+        with self.console_lock:
+            self.console_pending_lines.append(line_markup)
+            if not self.console_drain_scheduled:
+                self.console_drain_scheduled = True
+                GLib.timeout_add(self.console_frame_interval_ms, self.on_console_drain)
+
+    def on_console_drain(self) -> bool:
+        """
+        Insert all the queued console lines into the console buffer with a single insert
+
+        Called on the main loop, at most once per frame
+
+        Returns
+        -------
+        call_again: bool
+            Always False. The next drain is scheduled when a line is queued
+        """
+
+        with self.console_lock:
+            pending_lines = self.console_pending_lines
+            self.console_pending_lines = []
+            self.console_drain_scheduled = False
+        if not pending_lines:
+            return False
+
+        self.console_buffer.insert_markup(
+            self.console_buffer.get_end_iter(),
+            "".join(pending_lines),
+            -1
+        )
+        self.trim_console()
+
+        # Throughput statistics. These go only to the log file through the standard logger, to avoid feeding the console itself
+        self.console_rendered_lines += len(pending_lines)
+        self.console_rendered_batches += 1
+        elapsed_time = time.perf_counter() - self.console_statistics_start_time
+        if elapsed_time >= 1.0:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Console rendered {:d} lines in {:d} batches ({:.1f} lines/s)".format(
+                        self.console_rendered_lines,
+                        self.console_rendered_batches,
+                        self.console_rendered_lines / elapsed_time
                     )
                 )
-            )
+            self.console_rendered_lines = 0
+            self.console_rendered_batches = 0
+            self.console_statistics_start_time = time.perf_counter()
+        return False
+
+    def trim_console(self) -> None:
+        """
+        Remove the oldest lines from the console buffer once it exceeds `console_max_lines` by at least `console_trim_chunk_lines`
+
+        A `console_max_lines` of 0 or less keeps all the lines
+
+        Returns
+        -------
+        Nothing
+        """
+
+        if self.console_max_lines <= 0:
+            return
+        excess_lines = self.console_buffer.get_line_count() - self.console_max_lines
+        if excess_lines < self.console_trim_chunk_lines:
+            return
+        self.console_buffer.delete(
+            self.console_buffer.get_start_iter(),
+            self.console_buffer.get_iter_at_line(excess_lines)
+        )
 
     def log_status(
         self,
@@ -616,8 +1003,44 @@ class Main:
         
         # logging_level_name = LoggingLevel(logging_level).name
 
-        # Needed because Gtk doesn't prefer adding stuff on a different thread
-        GLib.idle_add(self.status_label.set_text, message) 
+        self.set_status(message)
+
+    def set_status(self, message: str) -> None:
+        """
+        Show a message on the status label without logging it. Can be called from any thread
+
+        Parameters
+        ----------
+        message: str
+            The message to be shown
+        """
+
+        # Gtk doesn't prefer adding stuff on a different thread, so keep only the latest message and let the main loop show it at most once per update interval
+        with self.status_lock:
+            self.status_pending_message = message
+            if not self.status_update_scheduled:
+                self.status_update_scheduled = True
+                GLib.timeout_add(self.status_update_interval_ms, self.on_status_update)
+
+    def on_status_update(self) -> bool:
+        """
+        Show the latest queued status message on the status label, unless it is already shown
+
+        Called on the main loop, at most once per `status_update_interval_ms`
+
+        Returns
+        -------
+        call_again: bool
+            Always False. The next update is scheduled when a message is queued
+        """
+
+        with self.status_lock:
+            message = self.status_pending_message
+            self.status_pending_message = None
+            self.status_update_scheduled = False
+        if message is not None and message != self.status_label.get_text():
+            self.status_label.set_text(message)
+        return False
 
     # def on_refresh_pacman_mirrors(self, _):
     #     LogMessage.Info("Refreshing pacman mirrors...").write(self.logging_handler)
@@ -651,6 +1074,9 @@ class Main:
         """
 
         LogMessage.Info("User closed the application. Exiting...").write(self.logging_handler)
+        if self.jank_detector is not None:
+            LogMessage.Info(self.jank_detector.get_summary()).write(self.logging_handler)
+        self.task_executor.shutdown()
         # self.logging_handler.abort(wait=False)
         Gtk.main_quit() # Quit from the Gtk UI
         # exit(0)
@@ -680,24 +1106,65 @@ class Main:
         self.expander_previous_height = height
 
     def display_busy(self):
-        green_light = self.builder.get_object("green_light")
-        green_light.set_from_file("media/icons/grey.svg")
-        red_light = self.builder.get_object("red_light")
-        red_light.set_from_file("media/icons/red.svg")
-        # self.builder.get_object("green_light").set_visible(False)
-        # self.builder.get_object("red_light").set_visible(False)
+        """
+        Mark the start of a job. The busy light stays on until every started job has called `display_ready`
+
+        Can be called from any thread
+        """
+
+        with self.busy_lock:
+            self.no_of_busy_jobs += 1
+            has_state_changed = self.no_of_busy_jobs == 1
+        if has_state_changed:
+            self.request_status_lights_update()
 
     def display_ready(self):
+        """
+        Mark the end of a job started with `display_busy`
+
+        Can be called from any thread, like from the `post_run_function` of a `BatchJob`
+        """
+
+        with self.busy_lock:
+            if self.no_of_busy_jobs > 0:
+                self.no_of_busy_jobs -= 1
+            has_state_changed = self.no_of_busy_jobs == 0
+        if has_state_changed:
+            self.request_status_lights_update()
+
+    def request_status_lights_update(self) -> None:
+        if threading.current_thread() is threading.main_thread():
+            self.on_status_lights_update()
+        else: # Gtk doesn't prefer changing widgets on a different thread
+            GLib.idle_add(self.on_status_lights_update)
+
+    def on_status_lights_update(self) -> bool:
+        """
+        Show the light of the current busy state
+
+        Returns
+        -------
+        call_again: bool
+            Always False
+        """
+
+        with self.busy_lock:
+            is_busy = self.no_of_busy_jobs > 0
         green_light = self.builder.get_object("green_light")
-        green_light.set_from_file("media/icons/green.svg")
         red_light = self.builder.get_object("red_light")
-        red_light.set_from_file("media/icons/grey.svg")
+        if is_busy:
+            self.icon_cache.set_image(green_light, "media/icons/grey.svg")
+            self.icon_cache.set_image(red_light, "media/icons/red.svg")
+        else:
+            self.icon_cache.set_image(green_light, "media/icons/green.svg")
+            self.icon_cache.set_image(red_light, "media/icons/grey.svg")
         # self.builder.get_object("green_light").set_visible(False)
         # self.builder.get_object("red_light").set_visible(False)
+        return False
 
     def on_about_clicked(self, _):
         LogMessage.Debug("Bringing up the \"About\" dialog...").write(self.logging_handler)
-        self.builder.get_object("about").show_all()
+        self.load_form("about").show_all()
 
     def on_log_clicked(self, _):
         LogMessage.Debug("Opening the log on the default editor...").write(self.logging_handler)
@@ -907,49 +1374,97 @@ class Main:
             ]
         )   
 
+    def download_github_packages(self, downloads: List[Tuple[str, str, Optional[int], Optional[str]]]) -> List[bool]:
+        """
+        Download packages at the same time, showing the progress on the status bar. Blocks until the downloads are done
+
+        Parameters
+        ----------
+        downloads: List[Tuple[str, str, Optional[int], Optional[str]]]
+            The downloads, each as (url, destination_filepath, expected_size, expected_digest)
+
+        Returns
+        -------
+        successes: List[bool]
+            Whether each package was downloaded and verified, in the same order as `downloads`
+        """
+
+        downloader = Downloader(
+            timeout_seconds= self.settings_safe_get("github_request_timeout_seconds", 10),
+            progress_callback= self.on_download_progress,
+        )
+        errors = downloader.download_all(downloads)
+        for error in errors:
+            if error is not None:
+                LogMessage.Error(str(error)).write(logging_handler=self.logging_handler)
+        return [error is None for error in errors]
+
+    def on_download_progress(self, bytes_downloaded: int, bytes_expected: Optional[int], bytes_per_second: float) -> None:
+        mebibyte = 1024 * 1024
+        if bytes_expected is None:
+            message = "Downloading from GitHub... {:.1f} MiB".format(bytes_downloaded / mebibyte)
+        else:
+            message = "Downloading from GitHub... {:.1f} of {:.1f} MiB".format(bytes_downloaded / mebibyte, bytes_expected / mebibyte)
+        self.set_status(message + " at {:.1f} MiB/s".format(bytes_per_second / mebibyte))
+
     def install_latest_installer_github_release(
         self,
         batch_job: Optional[BatchJob] = None, 
+        transaction: Optional[PacmanTransaction] = None,
     ) -> Optional[BatchJob]:
-        LogMessage.Debug(f"Checking if a newer Github package exists for `{self.installer_config_package_name_stub}`...").write(logging_handler=self.logging_handler)
-        (is_new_installer_config_github_package_available, local_version, github_version) = self.is_new_github_package_available(self.installer_config_package_name_stub, self.installer_config_github_url_stub)
-        import re
-        local_version_parts = re.split('[._]', local_version)
-        github_version_parts = re.split('[._]', github_version)
-        # Ensure that a new package is assumed to exist only if there is a new patch version and not more major changes
-        for (local_version_part, github_version_part) in zip(local_version_parts[:-1], github_version_parts[:-1]):
-            if local_version_part != github_version_part:
-                is_new_installer_config_github_package_available = False
-                LogMessage.Info(f"New Github package exists for`{self.installer_config_package_name_stub}`, but has a major change, so a newer ISO is needed...").write(logging_handler=self.logging_handler)
-                break
-
-        if not is_new_installer_config_github_package_available:
-            LogMessage.Debug(f"No new compatible Github package exists for`{self.installer_config_package_name_stub}`...").write(logging_handler=self.logging_handler)
-        else:
-            LogMessage.Info(f"New Github package exists for `{self.installer_config_package_name_stub}`...").write(logging_handler=self.logging_handler)
-        
-        LogMessage.Debug(f"Checking if a newer Github package exists for `{self.installer_package_name_stub}`...").write(logging_handler=self.logging_handler)
-        (is_new_installer_github_package_available, local_version, github_version) = self.is_new_github_package_available(self.installer_package_name_stub, self.installer_github_url_stub)     
-        import re
-        local_version_parts = re.split('[._]', local_version)
-        github_version_parts = re.split('[._]', github_version)
-        # Ensure that a new package is assumed to exist only if there is a new patch version and not more major changes
-        for (local_version_part, github_version_part) in zip(local_version_parts[:-1], github_version_parts[:-1]):
-            if local_version_part != github_version_part:
-                is_new_installer_github_package_available = False
-                LogMessage.Info(f"New Github package exists for`{self.installer_package_name_stub}`, but has a major change, so a newer ISO is needed...").write(logging_handler=self.logging_handler)
-                break
-
-        if not is_new_installer_github_package_available:
-            LogMessage.Debug(f"No new compatible Github package exists for`{self.installer_package_name_stub}`...").write(logging_handler=self.logging_handler)
-        else:
-            LogMessage.Info(f"New Github package exists for `{self.installer_package_name_stub}`...").write(logging_handler=self.logging_handler)
+        LogMessage.Debug(f"Checking if newer compatible Github packages exist for `{self.installer_config_package_name_stub}` and `{self.installer_package_name_stub}`...").write(logging_handler=self.logging_handler)
+        start_time = time.perf_counter()
+        # The two lookups are independent network round trips, so they are run at the same time
+        (installer_config_release_asset, installer_release_asset) = get_compatible_release_assets(
+            self.github_release_client,
+            [
+                (self.installer_config_package_name_stub, self.installer_config_github_url_stub),
+                (self.installer_package_name_stub, self.installer_github_url_stub),
+            ],
+            self.get_local_package_version,
+        )
+        LogMessage.Debug("Checked the GitHub releases in {:.1f} ms".format((time.perf_counter() - start_time) * 1000)).write(logging_handler=self.logging_handler)
+        for (package_name_stub, release_asset) in [
+            (self.installer_config_package_name_stub, installer_config_release_asset),
+            (self.installer_package_name_stub, installer_release_asset),
+        ]:
+            if release_asset is None:
+                LogMessage.Debug(f"No new compatible Github package exists for `{package_name_stub}`...").write(logging_handler=self.logging_handler)
+            else:
+                LogMessage.Info(f"New Github package exists for `{package_name_stub}` in the release `{release_asset[0]}`...").write(logging_handler=self.logging_handler)
 
-        if not is_new_installer_config_github_package_available and not is_new_installer_github_package_available:
-            return None
+        if installer_config_release_asset is None and installer_release_asset is None:
+            return batch_job
         
         LogMessage.Info("Will download and install from GitHub...").write(self.logging_handler)
-        download_path = "/tmp/downloaded_from_github"
+        package_filepaths = []
+        downloads = []
+        for (package_name_stub, url_stub, release_asset) in [
+            (self.installer_config_package_name_stub, self.installer_config_github_url_stub, installer_config_release_asset),
+            (self.installer_package_name_stub, self.installer_github_url_stub, installer_release_asset),
+        ]:
+            if release_asset is None:
+                continue
+            (tag_name, asset) = release_asset
+            cached_filepath = self.release_asset_cache.lookup(url_stub, tag_name, asset)
+            if cached_filepath is not None:
+                LogMessage.Info(f"Using the cached `{package_name_stub}` package from the GitHub release `{tag_name}`...").write(logging_handler=self.logging_handler)
+                package_filepaths.append(cached_filepath)
+                continue
+            # The downloader renames a file into the cache only after verifying it, and resumes from any partial file left by an earlier run
+            filepath = self.release_asset_cache.get_filepath(url_stub, tag_name, asset["name"])
+            downloads.append((asset["browser_download_url"], str(filepath), asset["size"], asset["digest"]))
+        if downloads:
+            # Downloaded while planning (which is off the main loop), so that a package that could not be downloaded is left to the repositories instead of failing the whole job
+            LogMessage.Debug(f"Downloading {len(downloads)} package(s) from GitHub...").write(logging_handler=self.logging_handler)
+            for ((_, filepath, _, _), success) in zip(downloads, self.download_github_packages(downloads)):
+                if success:
+                    package_filepaths.append(Path(filepath))
+                else:
+                    LogMessage.Warning(f"Not installing `{Path(filepath).name}` from GitHub, since it could not be downloaded. The package from the repositories is used instead...").write(logging_handler=self.logging_handler)
+        if not package_filepaths:
+            return batch_job
+
         if batch_job is None:
             self.display_busy()
             batch_job = BatchJob(
@@ -958,42 +1473,42 @@ class Main:
                     self.display_ready
                 ),
             )
-        batch_job += LogMessage.Debug("Removing temporary download directory: " + download_path)
-        batch_job += Command.Shell(
-            "rm -rf" + " " + download_path
-        )
-        batch_job += LogMessage.Debug("(Re)creating temporary download directory: " + download_path)
-        batch_job += Command.Shell(
-            "mkdir -p" + " " + download_path
+        batch_job += Function(
+            self.release_asset_cache.evict,
+            package_filepaths
         )
-        if is_new_installer_config_github_package_available:
-            batch_job += LogMessage.Debug(f"Downloading `{self.installer_config_package_name_stub}` from GitHub...")
-            batch_job += Command.Shell(
-                "curl --silent"
-                + " " + "--output" + " " + download_path + "/" + f"{self.installer_config_package_name_stub}.pkg.tar.zst"
-                + " " + "--location" + " " + f"$(curl --silent \'https://api.github.com/repos/{self.installer_config_github_url_stub}/releases/latest\' | jq \'.assets[] | select(.name | endswith(\".zst\")).browser_download_url\' | grep -v debug | cat | cut -d \'\"\' -f 2)"
-            )
-        if is_new_installer_github_package_available:
-            batch_job += LogMessage.Debug(f"Downloading `{self.installer_package_name_stub}` from GitHub...")
-            batch_job += Command.Shell(
-                "curl --silent"
-                + " " + "--output" + " " + download_path + "/" + f"{self.installer_package_name_stub}.pkg.tar.zst"
-                + " " + "--location" + " " + f"$(curl --silent \'https://api.github.com/repos/{self.installer_github_url_stub}/releases/latest\' | jq \'.assets[] | select(.name | endswith(\".zst\")).browser_download_url\' | grep -v debug | cat | cut -d \'\"\' -f 2)"
-            )
-        # batch_job += Command.Shell(
-        #     "rm -rf" + " " + download_path + "/" + "*.md5sum"
-        # )
+        if transaction is not None:
+            transaction.remove_database_lock = True
+            transaction.add_package_files([str(filepath) for filepath in package_filepaths])
+            return batch_job
         batch_job += LogMessage.Debug("Installing downloaded files...")
         batch_job += Command.Shell(
             "pkexec rm /var/lib/pacman/db.lck"
         )
-        batch_job += Command.Shell(
-            "pkexec pacman -U --noconfirm" + " " + download_path + "/" + "*.pkg.tar.*",
+        batch_job += Command(
+            ["pkexec", "pacman", "-U", "--noconfirm"] + [str(filepath) for filepath in package_filepaths]
         )
         batch_job += LogMessage.Debug("GitHub download and install task finished...")
         return batch_job
 
     def on_online_installer(self, _):
+        self.launch_installer("calamares_online")
+
+    def on_offline_installer(self, _):    
+        self.launch_installer("calamares_offline")
+
+    def launch_installer(self, desktop_entry_name: str) -> None:
+        """
+        Set up the selected flavour of the installer and launch it
+
+        All the package operations go into one `PacmanTransaction`, so that the user is asked to authenticate once and pacman loads its databases as few times as possible
+
+        Parameters
+        ----------
+        desktop_entry_name: str
+            The desktop entry of the installer, to be launched with `gtk-launch`
+        """
+
         self.display_busy()
         batch_job = BatchJob(
             logging_handler= self.logging_handler,
@@ -1001,87 +1516,61 @@ class Main:
                 self.display_ready
             ),
         )
-        if not self.builder.get_object("git_switch").get_active():    
-            batch_job = self.uninstall_package(
-                [
-                    f"{self.installer_package_name_stub}-git",
-                    f"{self.installer_config_package_name_stub}-git", 
-                    f"{self.installer_package_name_stub}-local", 
-                    f"{self.installer_config_package_name_stub}-local",
-                ],
-                batch_job= batch_job,
-            )
-            if self.builder.get_object("use_github_switch").get_active():
-                batch_job = self.install_latest_installer_github_release(batch_job= batch_job)
-            self.launch_third_party_utility(
-                package_name= [f"{self.installer_config_package_name_stub}", f"{self.installer_package_name_stub}"],
-                executable_name = ["gtk-launch", "calamares_online"],
+        # The switches are read here, since Gtk doesn't prefer being used from a different thread
+        use_git = self.builder.get_object("git_switch").get_active()
+        use_github = self.builder.get_object("use_github_switch").get_active()
+        update = self.builder.get_object("installer_update_switch").get_active()
+
+        def plan_and_start(batch_job: BatchJob) -> None:
+            transaction = PacmanTransaction(remove_database_lock= self.is_iso)
+            if not use_git:    
+                batch_job = self.uninstall_package(
+                    [
+                        f"{self.installer_package_name_stub}-git",
+                        f"{self.installer_config_package_name_stub}-git", 
+                        f"{self.installer_package_name_stub}-local", 
+                        f"{self.installer_config_package_name_stub}-local",
+                    ],
+                    batch_job= batch_job,
+                    transaction= transaction,
+                )
+                if use_github:
+                    batch_job = self.install_latest_installer_github_release(batch_job= batch_job, transaction= transaction)
+                package_names = [f"{self.installer_config_package_name_stub}", f"{self.installer_package_name_stub}"]
+            else:
+                batch_job = self.uninstall_package(
+                    [
+                        f"{self.installer_package_name_stub}",
+                        f"{self.installer_config_package_name_stub}",
+                        f"{self.installer_package_name_stub}-local", 
+                        f"{self.installer_config_package_name_stub}-local",                                    
+                    ],
+                    batch_job= batch_job,
+                    transaction= transaction,
+                )
+                package_names = [f"{self.installer_config_package_name_stub}-git", f"{self.installer_package_name_stub}-git"]
+
+            if update or self.is_any_package_missing(package_names): 
+                batch_job = self.install_package(
+                    package_name= package_names,
+                    update= update,
+                    batch_job= batch_job,
+                    transaction= transaction,
+                )
+            batch_job = transaction.add_to_batch_job(batch_job)
+            batch_job = self.run_executable(
+                executable_name= ["gtk-launch", desktop_entry_name],
                 detached= True,
-                update= self.builder.get_object("installer_update_switch").get_active(),
-                batch_job= batch_job,
-            ) 
-        else:
-            batch_job = self.uninstall_package(
-                [
-                    f"{self.installer_package_name_stub}",
-                    f"{self.installer_config_package_name_stub}",
-                    f"{self.installer_package_name_stub}-local", 
-                    f"{self.installer_config_package_name_stub}-local",                                    
-                ],
                 batch_job= batch_job
             )
-            self.launch_third_party_utility(
-                package_name= [f"{self.installer_config_package_name_stub}-git", f"{self.installer_package_name_stub}-git"],
-                executable_name = ["gtk-launch", "calamares_online"],
-                detached= True,
-                update= self.builder.get_object("installer_update_switch").get_active(),
-                batch_job= batch_job,
-            )
+            batch_job.start()
 
-    def on_offline_installer(self, _):    
-        self.display_busy()    
-        batch_job = BatchJob(
-            logging_handler= self.logging_handler,
-            post_run_function=functools.partial(
-                self.display_ready
-            ),
-        )        
-        if not self.builder.get_object("git_switch").get_active(): 
-            batch_job = self.uninstall_package(
-                [
-                    f"{self.installer_package_name_stub}-git",
-                    f"{self.installer_config_package_name_stub}-git", 
-                    f"{self.installer_package_name_stub}-local", 
-                    f"{self.installer_config_package_name_stub}-local", 
-                ],
-                batch_job= batch_job
-            ) 
-            if self.builder.get_object("use_github_switch").get_active():
-                batch_job = self.install_latest_installer_github_release(batch_job= batch_job)            
-            self.launch_third_party_utility(
-                package_name= [f"{self.installer_config_package_name_stub}", f"{self.installer_package_name_stub}"],
-                executable_name = ["gtk-launch", "calamares_offline"],
-                detached= True,
-                update= self.builder.get_object("installer_update_switch").get_active(),
-                batch_job= batch_job
-            ) 
-        else:
-            batch_job = self.uninstall_package(
-                [
-                    f"{self.installer_package_name_stub}",
-                    f"{self.installer_config_package_name_stub}",
-                    f"{self.installer_package_name_stub}-local", 
-                    f"{self.installer_config_package_name_stub}-local",                                  
-                ],
-                batch_job= batch_job
-            )
-            self.launch_third_party_utility(
-                package_name= [f"{self.installer_config_package_name_stub}-git", f"{self.installer_package_name_stub}-git"],
-                executable_name = ["gtk-launch", "calamares_offline"],
-                detached= True,
-                update= self.builder.get_object("installer_update_switch").get_active(),
-                batch_job= batch_job
-            )          
+        # Looking up GitHub releases and package states block, so the transaction is planned on a worker thread
+        self.task_executor.submit(plan_and_start, batch_job, on_error= self.on_batch_job_planning_error)
+
+    def on_batch_job_planning_error(self, error: BaseException) -> None:
+        LogMessage.Error("Could not prepare the task: " + str(error)).write(logging_handler=self.logging_handler)
+        self.display_ready() # the batch job that would have called this will not run
 
     def on_rebornos_fire(self, _):
         self.launch_third_party_utility(
@@ -1092,8 +1581,9 @@ class Main:
     def on_utilities_page_shown(self, _):
         if self.application_settings["show_install_info"] is True:
             LogMessage.Debug("Bringing up the installation info dialog...").write(self.logging_handler)
+            installinfo_dialog = self.load_form("installinfo")
             self.builder.get_object("show_installinfo_again").set_active(True)
-            self.builder.get_object("installinfo").show_all()
+            installinfo_dialog.show_all()
         else: 
             LogMessage.Debug("Not bringing up the installation info dialog because the user disabled it...").write(self.logging_handler)
 
@@ -1120,125 +1610,162 @@ class Main:
             # ISO Welcome         
             self.builder.get_object("installer_page_stack").set_visible_child_name("install_page") 
 
+    def on_settings_task_done(self, settings: Dict[str, Any], _output: Any) -> None:
+        """
+        Save settings once the task that applied them has finished
+
+        Parameters
+        ----------
+        settings: Dict[str, Any]
+            The settings to be saved
+        _output: Any
+            The output of the task
+        """
+
+        for (key, value) in settings.items():
+            self.application_settings[key] = value
+        self.application_settings.write_data()
+
     def on_internet_check_toggled(self, _):
         if not self.initialized:
             return # Do nothing when initial values are being set based on current status
-        self.display_busy()
-        if self.builder.get_object("internet_check").get_active():
-            Command([
+        is_active = self.builder.get_object("internet_check").get_active()
+        if is_active:
+            command = Command([
                 "pkexec",
                 "/bin/bash", "-c",
                 "sed -i 's/# - internet/- internet/g' /etc/calamares/modules/welcomeq_online.conf" 
                 + " && " + "sed -i 's/# - internet/- internet/g' /etc/calamares/modules/welcomeq_offline.conf"
-            ]).run_log_and_wait(self.logging_handler)
+            ])
         else:
-            Command([
+            command = Command([
                 "pkexec",
                 "/bin/bash", "-c",
                 "sed -i 's/- internet/# - internet/g' /etc/calamares/modules/welcomeq_online.conf"
                 + " && " + "sed -i 's/- internet/# - internet/g' /etc/calamares/modules/welcomeq_offline.conf" 
-            ]).run_log_and_wait(self.logging_handler)
-        self.application_settings["internet_check_toggled"] = self.builder.get_object("internet_check").get_active()
-        self.application_settings.write_data()
-        self.display_ready()
+            ])
+        self.task_executor.submit(
+            command.run_log_and_wait,
+            self.logging_handler,
+            on_done= functools.partial(self.on_settings_task_done, {"internet_check_toggled": is_active})
+        )
 
     def on_memory_check_toggled(self, _):
         if not self.initialized:
             return # Do nothing when initial values are being set based on current status        
-        self.display_busy()
-        if self.builder.get_object("memory_check").get_active():
-            Command([
+        is_active = self.builder.get_object("memory_check").get_active()
+        if is_active:
+            command = Command([
                 "pkexec",
                 "/bin/bash", "-c",
                 "sed -i 's/# - ram/- ram/g' /etc/calamares/modules/welcomeq_online.conf" 
                 + " && " + "sed -i 's/# - ram/- ram/g' /etc/calamares/modules/welcomeq_offline.conf"
-            ]).run_log_and_wait(self.logging_handler)
+            ])
         else:
-            Command([
+            command = Command([
                 "pkexec",
                 "/bin/bash", "-c",
                 "sed -i 's/- ram/# - ram/g' /etc/calamares/modules/welcomeq_online.conf"
                 + " && " + "sed -i 's/- ram/# - ram/g' /etc/calamares/modules/welcomeq_offline.conf" 
-            ]).run_log_and_wait(self.logging_handler)
-        self.application_settings["memory_check_toggled"] = self.builder.get_object("memory_check").get_active()
-        self.application_settings.write_data()
-        self.display_ready()
+            ])
+        self.task_executor.submit(
+            command.run_log_and_wait,
+            self.logging_handler,
+            on_done= functools.partial(self.on_settings_task_done, {"memory_check_toggled": is_active})
+        )
 
     def on_storage_check_toggled(self, _):
         if not self.initialized:
             return # Do nothing when initial values are being set based on current status        
-        self.display_busy()
-        if self.builder.get_object("storage_check").get_active():
-            Command([
+        is_active = self.builder.get_object("storage_check").get_active()
+        if is_active:
+            command = Command([
                 "pkexec",
                 "/bin/bash", "-c",
                 "sed -i 's/# - storage/- storage/g' /etc/calamares/modules/welcomeq_online.conf" 
                 + " && " + "sed -i 's/# - storage/- storage/g' /etc/calamares/modules/welcomeq_offline.conf"
-            ]).run_log_and_wait(self.logging_handler)
+            ])
         else:
-            Command([
+            command = Command([
                 "pkexec",
                 "/bin/bash", "-c",
                 "sed -i 's/- storage/# - storage/g' /etc/calamares/modules/welcomeq_online.conf"
                 + " && " + "sed -i 's/- storage/# - storage/g' /etc/calamares/modules/welcomeq_offline.conf" 
-            ]).run_log_and_wait(self.logging_handler)
-        self.application_settings["storage_check_toggled"] = self.builder.get_object("storage_check").get_active()            
-        self.application_settings.write_data()
-        self.display_ready()  
+            ])
+        self.task_executor.submit(
+            command.run_log_and_wait,
+            self.logging_handler,
+            on_done= functools.partial(self.on_settings_task_done, {"storage_check_toggled": is_active})
+        )
 
     def on_isp_dns_toggled(self, _):  
         if not self.initialized:
             return # Do nothing when initial values are being set based on current status              
         if self.builder.get_object("isp_dns_radio_button").get_active():
-            self.display_busy()
-            Command([
-                "pkexec",
-                "/bin/bash", "-c",
-                "rm -f /etc/NetworkManager/conf.d/dns-servers.conf" 
-                + " && " + "rm -f /etc/systemd/resolved.conf.d/dns-servers.conf"
-                + " && " + "systemctl reload-or-restart NetworkManager.service"
-                + " && " + "systemctl reload-or-restart systemd-resolved.service"
-            ]).run_log_and_wait(self.logging_handler) 
-            self.application_settings["isp_dns_toggled"] = True
-            self.application_settings["cloudflare_dns_toggled"] = False
-            self.application_settings["google_dns_toggled"] = False
-            self.application_settings.write_data()                    
-            self.display_ready()
+            self.task_executor.submit(
+                Command([
+                    "pkexec",
+                    "/bin/bash", "-c",
+                    "rm -f /etc/NetworkManager/conf.d/dns-servers.conf" 
+                    + " && " + "rm -f /etc/systemd/resolved.conf.d/dns-servers.conf"
+                    + " && " + "systemctl reload-or-restart NetworkManager.service"
+                    + " && " + "systemctl reload-or-restart systemd-resolved.service"
+                ]).run_log_and_wait,
+                self.logging_handler,
+                on_done= functools.partial(
+                    self.on_settings_task_done,
+                    {
+                        "isp_dns_toggled": True,
+                        "cloudflare_dns_toggled": False,
+                        "google_dns_toggled": False,
+                    }
+                )
+            )
     
     def on_cloudflare_dns_toggled(self, _):   
         if not self.initialized:
             return # Do nothing when initial values are being set based on current status             
         if self.builder.get_object("cloudflare_dns_radio_button").get_active():
-            self.display_busy()
-            Command([
-                "pkexec",
-                "/bin/bash", "-c",
-                "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_NetworkManager_cloudflare /etc/NetworkManager/conf.d/dns-servers.conf"
-                + " && " + "mkdir -p /etc/systemd/resolved.conf.d" + " && " + "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_systemd-resolved_cloudflare /etc/systemd/resolved.conf.d/dns-servers.conf"
-                + " && " + "systemctl reload-or-restart NetworkManager.service"
-                + " && " + "systemctl reload-or-restart systemd-resolved.service"
-            ]).run_log_and_wait(self.logging_handler)  
-            self.application_settings["isp_dns_toggled"] = False
-            self.application_settings["cloudflare_dns_toggled"] = True
-            self.application_settings["google_dns_toggled"] = False
-            self.application_settings.write_data()                        
-            self.display_ready() 
+            self.task_executor.submit(
+                Command([
+                    "pkexec",
+                    "/bin/bash", "-c",
+                    "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_NetworkManager_cloudflare /etc/NetworkManager/conf.d/dns-servers.conf"
+                    + " && " + "mkdir -p /etc/systemd/resolved.conf.d" + " && " + "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_systemd-resolved_cloudflare /etc/systemd/resolved.conf.d/dns-servers.conf"
+                    + " && " + "systemctl reload-or-restart NetworkManager.service"
+                    + " && " + "systemctl reload-or-restart systemd-resolved.service"
+                ]).run_log_and_wait,
+                self.logging_handler,
+                on_done= functools.partial(
+                    self.on_settings_task_done,
+                    {
+                        "isp_dns_toggled": False,
+                        "cloudflare_dns_toggled": True,
+                        "google_dns_toggled": False,
+                    }
+                )
+            )
 
     def on_google_dns_toggled(self, _):  
         if not self.initialized:
             return # Do nothing when initial values are being set based on current status              
         if self.builder.get_object("google_dns_radio_button").get_active():
-            self.display_busy()
-            Command([
-                "pkexec",
-                "/bin/bash", "-c",
-                "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_NetworkManager_google /etc/NetworkManager/conf.d/dns-servers.conf"
-                + " && " + "mkdir -p /etc/systemd/resolved.conf.d" + " && " + "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_systemd-resolved_google /etc/systemd/resolved.conf.d/dns-servers.conf"
-                + " && " + "systemctl reload-or-restart NetworkManager.service"
-                + " && " + "systemctl reload-or-restart systemd-resolved.service"
-            ]).run_log_and_wait(self.logging_handler)    
-            self.application_settings["isp_dns_toggled"] = False
-            self.application_settings["cloudflare_dns_toggled"] = False
-            self.application_settings["google_dns_toggled"] = True
-            self.application_settings.write_data()                      
-            self.display_ready()             
+            self.task_executor.submit(
+                Command([
+                    "pkexec",
+                    "/bin/bash", "-c",
+                    "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_NetworkManager_google /etc/NetworkManager/conf.d/dns-servers.conf"
+                    + " && " + "mkdir -p /etc/systemd/resolved.conf.d" + " && " + "cp -rf /opt/rebornos-iso-welcome/configuration/dns-servers.conf_systemd-resolved_google /etc/systemd/resolved.conf.d/dns-servers.conf"
+                    + " && " + "systemctl reload-or-restart NetworkManager.service"
+                    + " && " + "systemctl reload-or-restart systemd-resolved.service"
+                ]).run_log_and_wait,
+                self.logging_handler,
+                on_done= functools.partial(
+                    self.on_settings_task_done,
+                    {
+                        "isp_dns_toggled": False,
+                        "cloudflare_dns_toggled": False,
+                        "google_dns_toggled": True,
+                    }
+                )
+            )
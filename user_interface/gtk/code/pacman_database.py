@@ -0,0 +1,421 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import threading
+import tarfile
+import functools
+from typing import Dict, List, Optional, Tuple
+
+def _is_ascii_digit(character: str) -> bool:
+    return "0" <= character <= "9"
+
+def _is_ascii_alpha(character: str) -> bool:
+    return "a" <= character <= "z" or "A" <= character <= "Z"
+
+def _is_ascii_alphanumeric(character: str) -> bool:
+    return _is_ascii_digit(character) or _is_ascii_alpha(character)
+
+def _compare_version_segments(version_1: str, version_2: str) -> int:
+    """
+    Compare two version segments (epoch, pkgver or pkgrel) like `rpmvercmp` in libalpm
+
+    Parameters
+    ----------
+    version_1: str
+        The first version segment
+    version_2: str
+        The second version segment
+
+    Returns
+    -------
+    comparison: int
+        -1 if version_1 is older, 0 if they are the same, and 1 if version_1 is newer
+    """
+
+    if version_1 == version_2:
+        return 0
+
+    length_1 = len(version_1)
+    length_2 = len(version_2)
+    one = pointer_1 = 0
+    two = pointer_2 = 0
+    while one < length_1 and two < length_2:
+        # Skip the separators, comparing their lengths
+        while one < length_1 and not _is_ascii_alphanumeric(version_1[one]):
+            one += 1
+        while two < length_2 and not _is_ascii_alphanumeric(version_2[two]):
+            two += 1
+        if one >= length_1 or two >= length_2:
+            break
+        if (one - pointer_1) != (two - pointer_2):
+            return -1 if (one - pointer_1) < (two - pointer_2) else 1
+        pointer_1 = one
+        pointer_2 = two
+
+        # Take the next run of either digits or letters, depending on what the first version has here
+        if _is_ascii_digit(version_1[pointer_1]):
+            while pointer_1 < length_1 and _is_ascii_digit(version_1[pointer_1]):
+                pointer_1 += 1
+            while pointer_2 < length_2 and _is_ascii_digit(version_2[pointer_2]):
+                pointer_2 += 1
+            is_numeric = True
+        else:
+            while pointer_1 < length_1 and _is_ascii_alpha(version_1[pointer_1]):
+                pointer_1 += 1
+            while pointer_2 < length_2 and _is_ascii_alpha(version_2[pointer_2]):
+                pointer_2 += 1
+            is_numeric = False
+
+        if two == pointer_2: # the runs are of different types. Numbers are newer than letters
+            return 1 if is_numeric else -1
+
+        run_1 = version_1[one:pointer_1]
+        run_2 = version_2[two:pointer_2]
+        if is_numeric:
+            run_1 = run_1.lstrip("0")
+            run_2 = run_2.lstrip("0")
+            if len(run_1) != len(run_2):
+                return 1 if len(run_1) > len(run_2) else -1
+        if run_1 != run_2:
+            return -1 if run_1 < run_2 else 1
+
+        one = pointer_1
+        two = pointer_2
+
+    if one >= length_1 and two >= length_2:
+        return 0
+
+    # A remaining letter run is older than nothing (for example, 1.0alpha < 1.0), and anything else remaining is newer
+    if (one >= length_1 and not (two < length_2 and _is_ascii_alpha(version_2[two]))) or (one < length_1 and _is_ascii_alpha(version_1[one])):
+        return -1
+    return 1
+
+def _split_version(version: str) -> Tuple[str, str, Optional[str]]:
+    """
+    Split a version of the form `[epoch:]pkgver[-pkgrel]` like `parseEVR` in libalpm
+
+    Parameters
+    ----------
+    version: str
+        The full version
+
+    Returns
+    -------
+    version_parts: Tuple[str, str, Optional[str]]
+        The epoch ("0" if absent), the pkgver, and the pkgrel (None if absent)
+    """
+
+    epoch_end = 0
+    while epoch_end < len(version) and _is_ascii_digit(version[epoch_end]):
+        epoch_end += 1
+    release_start = version.rfind("-", epoch_end)
+    if release_start != -1:
+        release: Optional[str] = version[release_start + 1:]
+        version_end = release_start
+    else:
+        release = None
+        version_end = len(version)
+    if epoch_end < len(version) and version[epoch_end] == ":":
+        epoch = version[:epoch_end] or "0"
+        pkgver = version[epoch_end + 1:version_end]
+    else:
+        epoch = "0"
+        pkgver = version[:version_end]
+    return (epoch, pkgver, release)
+
+@functools.lru_cache(maxsize=4096)
+def vercmp(version_1: str, version_2: str) -> int:
+    """
+    Compare two package versions of the form `[epoch:]pkgver[-pkgrel]` in the same way as `vercmp` and `alpm_pkg_vercmp` in libalpm
+
+    The epoch is compared first, then the pkgver, and the pkgrel only if both versions have one. Results are memoized.
+
+    Parameters
+    ----------
+    version_1: str
+        The first version
+    version_2: str
+        The second version
+
+    Returns
+    -------
+    comparison: int
+        -1 if version_1 is older, 0 if they are the same, and 1 if version_1 is newer
+    """
+
+    if version_1 == version_2:
+        return 0
+    (epoch_1, pkgver_1, release_1) = _split_version(version_1)
+    (epoch_2, pkgver_2, release_2) = _split_version(version_2)
+    comparison = _compare_version_segments(epoch_1, epoch_2)
+    if comparison == 0:
+        comparison = _compare_version_segments(pkgver_1, pkgver_2)
+        if comparison == 0 and release_1 is not None and release_2 is not None:
+            comparison = _compare_version_segments(release_1, release_2)
+    return comparison
+
+class LocalPackageIndex:
+    """
+    An in-process index of the packages installed on the system, read from the local pacman database
+
+    Every entry of the local database is a directory named `<name>-<pkgver>-<pkgrel>` (see `alpm_pkg_t` in libalpm), so the names and versions are read from the directory names without opening any file.
+    The index is rebuilt automatically whenever the modification time of the local database directory changes, which happens whenever a package is installed or removed.
+
+    """
+
+    def __init__(self, local_database_path: str = "/var/lib/pacman/local") -> None:
+        """
+        Parameters
+        ----------
+        local_database_path: str, default "/var/lib/pacman/local"
+            The path to the local pacman database
+
+        Returns
+        -------
+        Nothing
+        """
+
+        self.local_database_path = local_database_path
+        self._lock = threading.Lock()
+        self._modification_time: Optional[int] = None
+        self._versions: Dict[str, str] = {}
+
+    def is_available(self) -> bool:
+        """
+        Tells whether the local pacman database exists on this system
+
+        Returns
+        -------
+        available: bool
+            True if the local pacman database directory exists
+        """
+
+        return os.path.isdir(self.local_database_path)
+
+    def is_installed(self, package_name: str) -> bool:
+        """
+        Tells whether a package with the given name is installed
+
+        Parameters
+        ----------
+        package_name: str
+            The name of the package
+
+        Returns
+        -------
+        installed: bool
+            True if the package is installed
+        """
+
+        return package_name in self._get_versions()
+
+    def get_version(self, package_name: str) -> Optional[str]:
+        """
+        Returns the installed version of a package in the form `[epoch:]pkgver-pkgrel`
+
+        Parameters
+        ----------
+        package_name: str
+            The name of the package
+
+        Returns
+        -------
+        version: Optional[str]
+            The installed version, or None if the package is not installed
+        """
+
+        return self._get_versions().get(package_name)
+
+    def _get_versions(self) -> Dict[str, str]:
+        """
+        Returns the mapping of installed package names to versions, rebuilding it if the local database has changed since it was last built
+
+        Returns
+        -------
+        versions: Dict[str, str]
+            The installed package names mapped to their versions
+        """
+
+        modification_time = os.stat(self.local_database_path).st_mtime_ns
+        with self._lock:
+            if modification_time != self._modification_time:
+                versions: Dict[str, str] = {}
+                with os.scandir(self.local_database_path) as directory_entries:
+                    for directory_entry in directory_entries:
+                        name_parts = directory_entry.name.rsplit("-", 2) # <name>-<pkgver>-<pkgrel>, where only <name> may contain dashes
+                        if len(name_parts) != 3 or not directory_entry.is_dir():
+                            continue # for example, the file ALPM_DB_VERSION
+                        versions[name_parts[0]] = name_parts[1] + "-" + name_parts[2]
+                self._versions = versions
+                self._modification_time = modification_time
+            return self._versions
+
+class SyncDatabaseIndex:
+    """
+    An in-process index of the packages available in the sync databases of pacman, read from `/var/lib/pacman/sync/*.db`
+
+    Each sync database is a tar archive whose entries are directories named `<name>-<pkgver>-<pkgrel>`, so the names and versions are read from the entry names.
+    When several repositories contain a package with the same name, the repository listed first in `pacman.conf` wins, as it does for pacman.
+    The index is rebuilt automatically whenever any sync database is added, removed or modified (for example by `pacman -Sy`).
+    Databases that cannot be read (for example, compressed with an algorithm that Python's `tarfile` does not support) are listed in `unreadable_databases`.
+
+    """
+
+    def __init__(
+        self,
+        sync_database_path: str = "/var/lib/pacman/sync",
+        pacman_configuration_path: str = "/etc/pacman.conf"
+    ) -> None:
+        """
+        Parameters
+        ----------
+        sync_database_path: str, default "/var/lib/pacman/sync"
+            The directory which contains the sync databases
+        pacman_configuration_path: str, default "/etc/pacman.conf"
+            The pacman configuration file, which is used for the order of the repositories
+
+        Returns
+        -------
+        Nothing
+        """
+
+        self.sync_database_path = sync_database_path
+        self.pacman_configuration_path = pacman_configuration_path
+        self.unreadable_databases: List[str] = []
+        self._lock = threading.Lock()
+        self._database_state: Optional[List[Tuple[str, int]]] = None
+        self._versions: Dict[str, str] = {}
+
+    def is_available(self) -> bool:
+        """
+        Tells whether all the sync databases on this system could be read
+
+        Returns
+        -------
+        available: bool
+            True if there is at least one sync database and all of them could be read
+        """
+
+        try:
+            versions = self._get_versions()
+        except OSError:
+            return False
+        return bool(versions) and not self.unreadable_databases
+
+    def get_version(self, package_name: str) -> Optional[str]:
+        """
+        Returns the version of a package in the sync databases in the form `[epoch:]pkgver-pkgrel`
+
+        Parameters
+        ----------
+        package_name: str
+            The name of the package
+
+        Returns
+        -------
+        version: Optional[str]
+            The version from the first repository which contains the package, or None if no repository contains it
+        """
+
+        return self._get_versions().get(package_name)
+
+    def get_database_modification_times(self) -> List[Tuple[str, int]]:
+        """
+        Returns the sync databases and their modification times, in the order of the repositories in `pacman.conf`
+
+        Returns
+        -------
+        database_state: List[Tuple[str, int]]
+            Tuples of the database file name and its modification time in nanoseconds
+        """
+
+        database_state: List[Tuple[str, int]] = []
+        with os.scandir(self.sync_database_path) as directory_entries:
+            for directory_entry in directory_entries:
+                if directory_entry.name.endswith(".db") and directory_entry.is_file():
+                    database_state.append((directory_entry.name, directory_entry.stat().st_mtime_ns))
+        repository_order = self._get_repository_order()
+        database_state.sort(
+            key= lambda database: (
+                repository_order.index(database[0][:-len(".db")]) if database[0][:-len(".db")] in repository_order else len(repository_order),
+                database[0]
+            )
+        )
+        return database_state
+
+    def get_last_refresh_time(self) -> Optional[float]:
+        """
+        Returns when all the sync databases were last refreshed, going by their modification times
+
+        pacman rewrites a database only when the mirror has a newer one, so this is a lower bound
+
+        Returns
+        -------
+        last_refresh_time: Optional[float]
+            The oldest modification time of the sync databases, in seconds since the epoch, or None if there are no sync databases
+        """
+
+        try:
+            database_state = self.get_database_modification_times()
+        except OSError:
+            return None
+        if not database_state:
+            return None
+        return min([modification_time for (_, modification_time) in database_state]) / 1e9
+
+    def _get_repository_order(self) -> List[str]:
+        """
+        Returns the names of the repositories in the order in which they are listed in `pacman.conf`
+
+        Returns
+        -------
+        repository_names: List[str]
+            The names of the repositories. Empty if `pacman.conf` cannot be read
+        """
+
+        repository_names: List[str] = []
+        try:
+            with open(self.pacman_configuration_path) as pacman_configuration_file:
+                for line in pacman_configuration_file:
+                    line = line.strip()
+                    if line.startswith("[") and line.endswith("]") and line != "[options]":
+                        repository_names.append(line[1:-1])
+        except OSError:
+            pass
+        return repository_names
+
+    def _get_versions(self) -> Dict[str, str]:
+        """
+        Returns the mapping of package names to versions, rebuilding it if any sync database has changed since it was last built
+
+        Returns
+        -------
+        versions: Dict[str, str]
+            The package names mapped to their versions
+        """
+
+        database_state = self.get_database_modification_times()
+        with self._lock:
+            if database_state != self._database_state:
+                versions: Dict[str, str] = {}
+                unreadable_databases: List[str] = []
+                for (database_name, _) in database_state:
+                    try:
+                        with tarfile.open(os.path.join(self.sync_database_path, database_name)) as database_archive:
+                            for member_name in database_archive.getnames():
+                                name_parts = member_name.split("/", 1)[0].rsplit("-", 2) # <name>-<pkgver>-<pkgrel>, where only <name> may contain dashes
+                                if len(name_parts) == 3 and name_parts[0] not in versions:
+                                    versions[name_parts[0]] = name_parts[1] + "-" + name_parts[2]
+                    except (OSError, tarfile.TarError):
+                        unreadable_databases.append(database_name)
+                self._versions = versions
+                self.unreadable_databases = unreadable_databases
+                self._database_state = database_state
+            return self._versions
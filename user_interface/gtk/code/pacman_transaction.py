@@ -0,0 +1,157 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import shlex
+from typing import List, Union
+
+from pyrunning import BatchJob, Command, LogMessage
+
+class PacmanTransaction:
+    """
+    Collect the package operations of a user action, and run them with as few pacman invocations as possible, from a single privileged call
+
+    pacman cannot remove and install packages in the same invocation without asking about conflicts, and local package files (`-U`) cannot be mixed with repository packages (`-S`). So at most three invocations are made, in this order:
+    1. `pacman -Rdd` for all the packages to remove
+    2. `pacman -U` for all the local package files
+    3. `pacman -S` (or `-Sy` if a refresh is needed) for all the repository packages, except the ones installed from the local package files in step 2
+    They are run from one `pkexec` call, so that there is a single authentication prompt, and each invocation runs only if the previous one succeeded
+    """
+
+    def __init__(self, remove_database_lock: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        remove_database_lock: bool
+            Whether to remove a stale pacman database lock before the first invocation, like on the live ISO
+        """
+
+        self.remove_database_lock = remove_database_lock
+        self.packages_to_remove: List[str] = []
+        self.package_files_to_add: List[str] = []
+        self.packages_to_sync: List[str] = []
+        self.refresh_sync_databases = False
+        self.post_transaction_commands: List[Union[str, List[str]]] = []
+
+    @staticmethod
+    def _extend_unique(target: List[str], items: List[str]) -> None:
+        for item in items:
+            if item not in target:
+                target.append(item)
+
+    def remove(self, package_names: List[str]) -> None:
+        self._extend_unique(self.packages_to_remove, package_names)
+
+    def add_package_files(self, package_filepaths: List[str]) -> None:
+        self._extend_unique(self.package_files_to_add, package_filepaths)
+
+    @staticmethod
+    def get_package_name(package_filepath: str) -> str:
+        """
+        Get the name of the package in a package file named `<name>-<pkgver>-<pkgrel>-<arch>.pkg.tar.<extension>`, as built by makepkg
+
+        Parameters
+        ----------
+        package_filepath: str
+            The package file
+
+        Returns
+        -------
+        package_name: str
+            The name of the package
+        """
+
+        (package_file_stem, _, _) = os.path.basename(package_filepath).partition(".pkg.tar")
+        return package_file_stem.rsplit("-", 3)[0]
+
+    def sync(self, package_names: List[str], refresh: bool = False) -> None:
+        self._extend_unique(self.packages_to_sync, package_names)
+        self.refresh_sync_databases = self.refresh_sync_databases or refresh
+
+    def add_post_transaction_command(self, command: Union[str, List[str]]) -> None:
+        """
+        Add a command to be run after the transaction, like the `post_install_command` of `Main.install_package`
+
+        Parameters
+        ----------
+        command: Union[str, List[str]]
+            A shell command string or a list of command line arguments
+        """
+
+        self.post_transaction_commands.append(command)
+
+    def is_empty(self) -> bool:
+        return not (self.packages_to_remove or self.package_files_to_add or self.packages_to_sync or self.refresh_sync_databases)
+
+    def get_pacman_commands(self) -> List[List[str]]:
+        """
+        Plan the pacman invocations of the transaction
+
+        Returns
+        -------
+        pacman_commands: List[List[str]]
+            The command line arguments of each pacman invocation, in the order in which they are to be run
+        """
+
+        pacman_commands: List[List[str]] = []
+        if self.packages_to_remove:
+            pacman_commands.append(["pacman", "-Rdd", "--noconfirm", *self.packages_to_remove])
+        if self.package_files_to_add:
+            pacman_commands.append(["pacman", "-U", "--noconfirm", *self.package_files_to_add])
+        # `--needed` skips only the packages whose installed version is the same as in the repository, so a package just installed from a newer file would be replaced by the older repository build
+        package_names_from_files = [self.get_package_name(package_filepath) for package_filepath in self.package_files_to_add]
+        packages_to_sync = [package_name for package_name in self.packages_to_sync if package_name not in package_names_from_files]
+        if packages_to_sync:
+            pacman_commands.append(["pacman", "-Sy" if self.refresh_sync_databases else "-S", "--needed", "--noconfirm", *packages_to_sync])
+        elif self.refresh_sync_databases:
+            pacman_commands.append(["pacman", "-Sy"])
+        return pacman_commands
+
+    def get_command_strings(self) -> List[str]:
+        """
+        Get the single privileged call that runs the whole transaction
+
+        Returns
+        -------
+        command_strings: List[str]
+            The command line arguments of the `pkexec` call
+        """
+
+        shell_commands = [" ".join([shlex.quote(argument) for argument in pacman_command]) for pacman_command in self.get_pacman_commands()]
+        if self.remove_database_lock:
+            shell_commands.insert(0, "rm -f /var/lib/pacman/db.lck")
+        return ["pkexec", "/bin/sh", "-c", " && ".join(shell_commands)]
+
+    def add_to_batch_job(self, batch_job: BatchJob) -> BatchJob:
+        """
+        Add the transaction and the post-transaction commands to a batch job
+
+        Parameters
+        ----------
+        batch_job: BatchJob
+            The batch job to add the transaction to
+
+        Returns
+        -------
+        batch_job: BatchJob
+            The same batch job
+        """
+
+        if not self.is_empty():
+            batch_job += LogMessage.Info(
+                "Running the package transaction:"
+                + "".join(["\n    " + " ".join(pacman_command) for pacman_command in self.get_pacman_commands()])
+            )
+            batch_job += Command(self.get_command_strings())
+        for command in self.post_transaction_commands:
+            if isinstance(command, list):
+                batch_job += Command(command)
+            elif isinstance(command, str):
+                batch_job += Command.Shell(command)
+        return batch_job
@@ -0,0 +1,207 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import os # for filepath related methods
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from gi.repository import Gtk, GdkPixbuf, Gio, GLib
+
+logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
+
+class ResourceBundle:
+    """
+    Read the UI assets (the glade forms, the CSS and the media) from a compiled GResource bundle, falling back to the loose files
+
+    The bundle is memory-mapped as a whole when it is loaded, so reading an asset from it needs no further file opens. This matters on live ISOs, where every small read from the squashfs is expensive.
+    The bundle is built from `user_interface/<ui_toolkit>/rebornos-welcome.gresource.xml` when packaging. Without it (for example, when running from a checkout), the loose files are read instead.
+    Assets are named by their paths relative to the project directory, for example "media/icons/green.svg"
+    """
+
+    def __init__(self, bundle_filepath: str, prefix: str = "/org/rebornos/welcome") -> None:
+        """
+        Parameters
+        ----------
+        bundle_filepath: str
+            The compiled GResource bundle
+        prefix: str
+            The prefix of the assets in the bundle, as given in its manifest
+        """
+
+        self.bundle_filepath = bundle_filepath
+        self.prefix = prefix.rstrip("/")
+        self.resource: Optional[Gio.Resource] = None
+        self.bundle_stat: Optional[os.stat_result] = None
+        self._contained: Dict[str, bool] = {}
+        try:
+            self.resource = Gio.Resource.load(bundle_filepath) # memory-maps the bundle
+            self.bundle_stat = os.stat(bundle_filepath)
+        except (GLib.Error, OSError) as error:
+            logger.info(f"Reading the loose UI files, since the resource bundle `{bundle_filepath}` could not be loaded: {error}")
+            self.resource = None
+            return
+        self.resource._register() # makes the assets reachable from GTK through "resource://" URIs
+        logger.info(f"Reading the UI files from the resource bundle `{bundle_filepath}`...")
+
+    def get_resource_path(self, filepath: str) -> str:
+        """
+        Get the path of an asset inside the bundle
+
+        Parameters
+        ----------
+        filepath: str
+            The path of the asset relative to the project directory
+
+        Returns
+        -------
+        resource_path: str
+            The path of the asset in the bundle
+        """
+
+        return self.prefix + "/" + os.path.normpath(filepath)
+
+    def contains(self, filepath: str) -> bool:
+        """
+        Check if an asset can be read from the bundle
+
+        Parameters
+        ----------
+        filepath: str
+            The path of the asset relative to the project directory
+
+        Returns
+        -------
+        contained: bool
+            True if the bundle is loaded and contains the asset
+        """
+
+        if self.resource is None:
+            return False
+        if filepath not in self._contained:
+            try:
+                self.resource.get_info(self.get_resource_path(filepath), Gio.ResourceLookupFlags.NONE)
+                self._contained[filepath] = True
+            except GLib.Error:
+                self._contained[filepath] = False
+        return self._contained[filepath]
+
+    def get_stat(self, filepath: str) -> os.stat_result:
+        """
+        Get the file status that changes whenever the asset changes. This is the status of the bundle for the assets in it, and of the loose file for the rest
+
+        Parameters
+        ----------
+        filepath: str
+            The path of the asset relative to the project directory
+
+        Returns
+        -------
+        file_stat: os.stat_result
+            The file status
+        """
+
+        if self.contains(filepath):
+            return self.bundle_stat
+        return os.stat(filepath)
+
+    def read_bytes(self, filepath: str) -> GLib.Bytes:
+        """
+        Read an asset without copying it out of the bundle
+
+        Parameters
+        ----------
+        filepath: str
+            The path of the asset relative to the project directory
+
+        Returns
+        -------
+        data: GLib.Bytes
+            The contents of the asset
+        """
+
+        if self.contains(filepath):
+            return self.resource.lookup_data(self.get_resource_path(filepath), Gio.ResourceLookupFlags.NONE)
+        with open(filepath, "rb") as asset_file:
+            return GLib.Bytes.new(asset_file.read())
+
+    def read_text(self, filepath: str) -> str:
+        """
+        Read a text asset
+
+        Parameters
+        ----------
+        filepath: str
+            The path of the asset relative to the project directory
+
+        Returns
+        -------
+        text: str
+            The contents of the asset
+        """
+
+        if self.contains(filepath):
+            return self.read_bytes(filepath).get_data().decode("utf-8")
+        with open(filepath, "r") as asset_file:
+            return asset_file.read()
+
+    def get_uri(self, filepath: str) -> str:
+        """
+        Get a reference to an asset that can be used in a glade form
+
+        Parameters
+        ----------
+        filepath: str
+            The path of the asset relative to the project directory
+
+        Returns
+        -------
+        uri: str
+            A "resource://" URI for the assets in the bundle, and the absolute path for the rest
+        """
+
+        if self.contains(filepath):
+            return "resource://" + self.get_resource_path(filepath)
+        return os.path.abspath(filepath)
+
+    def load_css(self, provider: Gtk.CssProvider, filepath: str) -> None:
+        """
+        Load a stylesheet into a CSS provider
+
+        Parameters
+        ----------
+        provider: Gtk.CssProvider
+            The CSS provider
+        filepath: str
+            The path of the stylesheet relative to the project directory
+        """
+
+        if self.contains(filepath):
+            provider.load_from_resource(self.get_resource_path(filepath))
+        else:
+            provider.load_from_path(filepath)
+
+    def load_pixbuf(self, filepath: str) -> GdkPixbuf.Pixbuf:
+        """
+        Load an image at its natural size, for example for a window icon
+
+        Parameters
+        ----------
+        filepath: str
+            The path of the image relative to the project directory
+
+        Returns
+        -------
+        pixbuf: GdkPixbuf.Pixbuf
+            The image
+        """
+
+        if self.contains(filepath):
+            return GdkPixbuf.Pixbuf.new_from_resource(self.get_resource_path(filepath))
+        return GdkPixbuf.Pixbuf.new_from_file(filepath)
@@ -0,0 +1,112 @@
+# RebornOS Welcome
+# Please refer to the file `LICENSE` in the main directory for license information. 
+# For a high level documentation, please visit https://github.com/RebornOS-Team/rebornos-welcome
+
+# AUTHORS
+# 1. Shivanand Pattanshetti (shivanand.pattanshetti@gmail.com)
+# 2. 
+
+# IMPORTS
+import logging
+import concurrent.futures
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from gi.repository import GLib
+
+logger = logging.getLogger('rebornos_welcome.ui.gtk.code'+'.'+ Path(__file__).stem)
+
+class TaskExecutor:
+    """
+    Run the blocking work of event handlers on a pool of worker threads, so that the main loop keeps drawing the window
+
+    The results are handed back on the main loop through `GLib.idle_add`, so the callbacks can use Gtk. `on_busy` is called for every submitted task and `on_ready` when it finishes, so they are expected to be reference counted, like `Main.display_busy` and `Main.display_ready`
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        on_busy: Optional[Callable[[], Any]] = None,
+        on_ready: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_workers: int
+            The number of tasks that can run at the same time
+        on_busy: Optional[Callable[[], Any]]
+            Called when a task is submitted
+        on_ready: Optional[Callable[[], Any]]
+            Called on the main loop when a task has finished, after its callbacks
+        """
+
+        self.on_busy = on_busy
+        self.on_ready = on_ready
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers= max_workers, thread_name_prefix= "Task")
+
+    def submit(
+        self,
+        function: Callable[..., Any],
+        *arguments,
+        on_done: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        **keyword_arguments
+    ) -> concurrent.futures.Future:
+        """
+        Run a function on a worker thread
+
+        Parameters
+        ----------
+        function: Callable[..., Any]
+            The function to be run
+        arguments
+            The arguments to be passed to the function
+        on_done: Optional[Callable[[Any], Any]]
+            Called on the main loop with the return value of the function
+        on_error: Optional[Callable[[BaseException], Any]]
+            Called on the main loop with the exception raised by the function. If not given, the exception is logged
+        keyword_arguments
+            The named arguments to be passed to the function
+
+        Returns
+        -------
+        future: concurrent.futures.Future
+            The future of the task
+        """
+
+        if self.on_busy is not None:
+            self.on_busy()
+
+        future = self._executor.submit(function, *arguments, **keyword_arguments)
+        future.add_done_callback(
+            lambda finished_future: GLib.idle_add(self._on_task_finished, finished_future, function, on_done, on_error)
+        )
+        return future
+
+    def _on_task_finished(
+        self,
+        future: concurrent.futures.Future,
+        function: Callable[..., Any],
+        on_done: Optional[Callable[[Any], Any]],
+        on_error: Optional[Callable[[BaseException], Any]],
+    ) -> bool:
+        try:
+            error = future.exception()
+            if error is None:
+                if on_done is not None:
+                    on_done(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                logger.error(f"The task `{getattr(function, '__qualname__', function)}` failed", exc_info= error)
+        finally:
+            if self.on_ready is not None:
+                self.on_ready()
+        return False # do not call again
+
+    def shutdown(self) -> None:
+        """
+        Stop accepting tasks. The running tasks are not waited for
+        """
+
+        self._executor.shutdown(wait= False)